@@ -3,9 +3,18 @@
 from flask import Flask
 from flask_cors import CORS
 
+from api.routes.changes import changes_bp
+from api.routes.events import events_bp
 from api.routes.exams import exams_bp
 from api.routes.filters import filters_bp
+from api.metrics import init_metrics
+from api.prefork import SnapshotWatcher
+from api.profiling import init_profiling
+from api.ratelimit import init_rate_limits
 from api.routes.health import health_bp
+from api.routes.metrics import metrics_bp
+from api.routes.suggest import suggest_bp
+from api.services.exam_service import get_exam_service
 
 
 def create_app(config: dict | None = None) -> Flask:
@@ -23,6 +32,44 @@ def create_app(config: dict | None = None) -> Flask:
     app.config.update({
         "JSON_SORT_KEYS": False,
         "CORS_ORIGINS": ["http://localhost:3000"],
+        # Request timing and /api/metrics exposure
+        "METRICS_ENABLED": True,
+        "METRICS_LOCAL_ONLY": True,
+        "SERVER_TIMING_HEADER": False,
+        # Opt-in cProfile capture around service calls
+        "PROFILING_ENABLED": False,
+        "PROFILING_SAMPLE_RATE": 0.0,
+        "PROFILING_HEADER": "X-Profile",
+        "PROFILING_TOKEN": None,
+        "PROFILING_DIR": None,
+        "PROFILING_MAX_FILES": 20,
+        # Server-Sent Events; each open stream holds one server thread
+        "EVENTS_MAX_CLIENTS": 16,
+        "EVENTS_HEARTBEAT_SECONDS": 15,
+        "EVENTS_MAX_STREAM_SECONDS": 300,
+        "EVENTS_RETRY_AFTER_SECONDS": 30,
+        # In-process snapshot polling (0 disables; the pre-fork master polls instead)
+        "SNAPSHOT_POLL_SECONDS": 0,
+        # Admission control: per-client token buckets and concurrency caps per budget
+        "RATE_LIMIT_ENABLED": True,
+        "RATE_LIMIT_BUDGETS": {
+            "default": {"rate": 20, "burst": 100, "max_concurrent": 24},
+            "search": {"rate": 10, "burst": 60, "max_concurrent": 12},
+        },
+        "RATE_LIMIT_ENDPOINTS": {
+            "exams.get_exams": "search",
+            "changes.get_changes": "search",
+        },
+        "RATE_LIMIT_EXEMPT": [
+            "health.health_check",
+            "metrics.get_metrics",
+            "metrics.get_memory",
+            "events.stream_events",
+        ],
+        "RATE_LIMIT_MAX_CLIENTS": 10000,
+        "RATE_LIMIT_TRUST_PROXY": False,
+        "RATE_LIMIT_RETRY_AFTER_SECONDS": 1,
+        "MAX_CONCURRENT_REQUESTS": 24,
     })
     
     # Override with provided config
@@ -32,10 +79,32 @@ def create_app(config: dict | None = None) -> Flask:
     # Configure CORS
     CORS(app, origins=app.config["CORS_ORIGINS"])
     
+    # Instrument request timing
+    if app.config["METRICS_ENABLED"]:
+        init_metrics(app)
+    
+    # Configure profiling
+    if app.config["PROFILING_ENABLED"]:
+        init_profiling(app)
+    
+    # Shed excess load before it reaches the handlers
+    if app.config["RATE_LIMIT_ENABLED"]:
+        init_rate_limits(app)
+    
     # Register blueprints
     app.register_blueprint(exams_bp, url_prefix="/api")
     app.register_blueprint(filters_bp, url_prefix="/api/filters")
     app.register_blueprint(health_bp, url_prefix="/api")
+    app.register_blueprint(suggest_bp, url_prefix="/api")
+    app.register_blueprint(changes_bp, url_prefix="/api")
+    app.register_blueprint(events_bp, url_prefix="/api")
+    if app.config["METRICS_ENABLED"]:
+        app.register_blueprint(metrics_bp, url_prefix="/api")
+    
+    # Reload changed snapshots in this process. Event streams are notified
+    # by the reload listener that api.routes.events registers on the service.
+    if app.config["SNAPSHOT_POLL_SECONDS"]:
+        SnapshotWatcher(get_exam_service(), interval=app.config["SNAPSHOT_POLL_SECONDS"]).start()
     
     # Register error handlers
     register_error_handlers(app)
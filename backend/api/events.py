@@ -0,0 +1,104 @@
+"""Server-Sent Events fan-out for snapshot update notifications."""
+
+import json
+import threading
+import time
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+# Tells EventSource clients how long to wait before reconnecting.
+RECONNECT_MILLISECONDS = 5000
+
+
+def format_event(event: str, data: dict, event_id: str | None = None) -> str:
+    """Encode one message in the text/event-stream format."""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventBroadcaster:
+    """Fan the latest event out to every open stream in this process.
+
+    Streams share a single condition variable instead of one queue per
+    client: publishing stores the event and wakes every waiting stream,
+    which then writes it. A stream that misses intermediate events only
+    sees the latest one, which is all a "snapshot changed" signal needs.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._latest: str | None = None
+        self._clients = 0
+
+    @property
+    def clients(self) -> int:
+        """Number of open streams."""
+        return self._clients
+
+    def publish(self, event: str, data: dict, event_id: str | None = None) -> None:
+        """Send an event to every open stream."""
+        message = format_event(event, data, event_id)
+        with self._condition:
+            self._sequence += 1
+            self._latest = message
+            self._condition.notify_all()
+
+    def try_connect(self, max_clients: int) -> bool:
+        """Reserve a stream slot, unless max_clients streams are already open."""
+        with self._condition:
+            if self._clients >= max_clients:
+                return False
+            self._clients += 1
+            return True
+
+    def disconnect(self) -> None:
+        """Release a slot reserved by try_connect."""
+        with self._condition:
+            self._clients -= 1
+
+    def stream(
+        self,
+        initial: Iterable[str] = (),
+        heartbeat_seconds: float = 15.0,
+        max_seconds: float = 300.0,
+    ) -> Iterator[str]:
+        """Yield encoded messages for one client until max_seconds elapse.
+
+        Ending streams periodically lets clients reconnect to fresh workers
+        after a reload.
+
+        Args:
+            initial: Messages sent before waiting for events.
+            heartbeat_seconds: Idle time before a keepalive comment is sent.
+            max_seconds: Lifetime of the stream.
+        """
+        with self._condition:
+            seen = self._sequence
+
+        yield f"retry: {RECONNECT_MILLISECONDS}\n\n"
+        yield from initial
+
+        deadline = time.monotonic() + max_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._sequence != seen,
+                    timeout=min(heartbeat_seconds, remaining),
+                )
+                message = self._latest if self._sequence != seen else None
+                seen = self._sequence
+            yield message if message is not None else ": keepalive\n\n"
+
+
+@lru_cache(maxsize=None)
+def get_broadcaster() -> EventBroadcaster:
+    """Get the process-wide event broadcaster."""
+    return EventBroadcaster()
@@ -0,0 +1,173 @@
+"""Request timing instrumentation and Prometheus-style latency metrics."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from flask import Flask, Response, g, has_request_context, request
+
+# Histogram bucket upper bounds, in seconds.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+# Addresses allowed to read metrics when METRICS_LOCAL_ONLY is set.
+LOCAL_ADDRESSES = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation, in seconds."""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-route latency histograms and request counters."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._requests: dict[tuple[str, str, int], int] = {}
+
+    def observe(self, route: str, phase: str, seconds: float) -> None:
+        """Record a phase duration for a route."""
+        key = (route, phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._buckets)
+            histogram.observe(seconds)
+
+    def count_request(self, route: str, method: str, status: int) -> None:
+        """Increment the request counter for a route/method/status triple."""
+        key = (route, method, status)
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics text, terminated by a newline.
+        """
+        with self._lock:
+            histograms = {
+                key: (list(h.counts), h.total, h.count)
+                for key, h in self._histograms.items()
+            }
+            requests = dict(self._requests)
+
+        lines = [
+            "# HELP exam_api_requests_total Total HTTP requests handled.",
+            "# TYPE exam_api_requests_total counter",
+        ]
+        for (route, method, status), value in sorted(requests.items()):
+            lines.append(
+                f'exam_api_requests_total{{route="{route}",method="{method}",'
+                f'status="{status}"}} {value}'
+            )
+
+        lines.extend([
+            "# HELP exam_api_request_duration_seconds Request latency by route and phase.",
+            "# TYPE exam_api_request_duration_seconds histogram",
+        ])
+        for (route, phase), (counts, total, count) in sorted(histograms.items()):
+            labels = f'route="{route}",phase="{phase}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets, counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'exam_api_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'exam_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"exam_api_request_duration_seconds_sum{{{labels}}} {total:.6f}")
+            lines.append(f"exam_api_request_duration_seconds_count{{{labels}}} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block of work as a named phase of the current request.
+
+    Outside of a request context (e.g. when the service is used from a
+    script) this is a no-op, so service code can use it unconditionally.
+
+    Args:
+        name: Phase name, e.g. "filter" or "serialize".
+    """
+    if not has_request_context():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = g.setdefault("phase_timings", {})
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _route_label() -> str:
+    """Return the matched URL rule, or a fixed label for unmatched requests."""
+    rule = request.url_rule
+    return rule.rule if rule is not None else "unmatched"
+
+
+def init_metrics(app: Flask) -> MetricsRegistry:
+    """Attach timing hooks and a metrics registry to the application.
+
+    Args:
+        app: Flask application to instrument.
+
+    Returns:
+        The registry stored in ``app.extensions["metrics"]``.
+    """
+    registry = MetricsRegistry()
+    app.extensions["metrics"] = registry
+
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+        g.phase_timings = {}
+
+    @app.after_request
+    def record_timing(response: Response) -> Response:
+        start = g.get("request_start")
+        if start is None:
+            return response
+
+        total = time.perf_counter() - start
+        route = _route_label()
+        timings = g.get("phase_timings", {})
+
+        for name, seconds in timings.items():
+            registry.observe(route, name, seconds)
+        registry.observe(route, "total", total)
+        registry.count_request(route, request.method, response.status_code)
+
+        if app.config.get("SERVER_TIMING_HEADER"):
+            entries = [
+                f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings.items()
+            ]
+            entries.append(f"total;dur={total * 1000:.3f}")
+            response.headers["Server-Timing"] = ", ".join(entries)
+
+        return response
+
+    return registry
@@ -0,0 +1,116 @@
+"""Helpers for running the API under a pre-fork WSGI server.
+
+The master process loads the snapshot and builds every index before forking,
+then freezes the garbage collector so those objects stay on shared
+copy-on-write pages in all workers. Snapshot changes are detected in the
+master only; it rebuilds once and asks the server to replace its workers, so
+every worker always serves the same snapshot and none of them parses JSON.
+"""
+
+import gc
+import logging
+import os
+import threading
+from typing import Callable
+
+from api.services.exam_service import ExamService
+
+logger = logging.getLogger(__name__)
+
+# Held while any watcher reloads. Never fork while it is held; the child would
+# inherit a half-built index and a lock that no thread will release.
+_reload_lock = threading.Lock()
+os.register_at_fork(
+    before=_reload_lock.acquire,
+    after_in_parent=_reload_lock.release,
+    after_in_child=_reload_lock.release,
+)
+
+
+def freeze_heap() -> None:
+    """Move all live objects into the GC's permanent generation.
+    
+    Frozen objects are never scanned by the cyclic collector, so a forked
+    worker does not touch (and therefore copy) the pages they live on.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def warm_and_freeze(service: ExamService) -> None:
+    """Load the snapshot, build its index and freeze the heap.
+    
+    Args:
+        service: Service whose repository and index should be built.
+    """
+    index = service.warm()
+    freeze_heap()
+    logger.info(f"Preloaded {len(index)} exams; froze {gc.get_freeze_count()} objects")
+
+
+class SnapshotWatcher:
+    """Poll the snapshot from the master process and coordinate reloads."""
+    
+    def __init__(
+        self,
+        service: ExamService,
+        on_reload: Callable[[], None] | None = None,
+        interval: float = 5.0,
+        freeze: bool = False,
+    ):
+        """Initialize the watcher.
+        
+        Args:
+            service: Service whose snapshot is watched.
+            on_reload: Called after the master has loaded a new snapshot,
+                      e.g. to signal the server to replace its workers.
+                      Listeners registered on the service (such as the
+                      event streams' publisher) run in either case.
+            interval: Seconds between checks.
+            freeze: Freeze the heap after each reload. Only the pre-fork
+                   master should; elsewhere it just moves each snapshot's
+                   cycles out of reach of the collector for good.
+        """
+        self._service = service
+        self._on_reload = on_reload
+        self._interval = interval
+        self._freeze = freeze
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+    
+    def check(self) -> bool:
+        """Reload the snapshot once if it changed on disk.
+        
+        Returns:
+            True if a new snapshot was loaded.
+        """
+        with _reload_lock:
+            try:
+                reloaded = self._service.reload_if_changed()
+            except Exception:
+                logger.exception("Snapshot reload failed; keeping the current snapshot")
+                reloaded = False
+            if reloaded and self._freeze:
+                # The old snapshot is freed by refcounting; freeze the new one.
+                freeze_heap()
+        
+        if reloaded and self._on_reload is not None:
+            logger.info("Snapshot changed; replacing workers")
+            self._on_reload()
+        return reloaded
+    
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="snapshot-watcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.check()
@@ -0,0 +1,160 @@
+"""Opt-in cProfile capture for service calls, written to an on-disk ring buffer."""
+
+import cProfile
+import hmac
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from flask import Flask, current_app, has_request_context, request
+
+from api.metrics import LOCAL_ADDRESSES
+
+
+class RequestProfiler:
+    """Profile a sampled or header-selected subset of service calls.
+
+    Only one call is profiled at a time; calls that arrive while a profile
+    is in progress run unprofiled. Profiles are written to a fixed number of
+    slots that are overwritten in turn, so disk usage stays bounded.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        sample_rate: float = 0.0,
+        max_profiles: int = 20,
+        header: str = "X-Profile",
+        token: str | None = None,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            output_dir: Directory where .prof files are written.
+            sample_rate: Fraction of calls (0.0-1.0) to profile at random.
+            max_profiles: Number of ring-buffer slots kept on disk.
+            header: Request header that forces a profile when present.
+            token: If set, the header value must equal this token; if not,
+                   the header is only honoured from loopback clients.
+        """
+        self._output_dir = Path(output_dir)
+        self._sample_rate = sample_rate
+        self._max_profiles = max(1, max_profiles)
+        self._header = header
+        self._token = token
+        self._lock = threading.Lock()
+        self._slots = itertools.count()
+
+    def should_profile(self) -> bool:
+        """Decide whether the current call should be profiled."""
+        if has_request_context() and self._header:
+            value = request.headers.get(self._header)
+            if value and self._header_allowed(value):
+                return True
+
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+    def _header_allowed(self, value: str) -> bool:
+        """Check a profiling header against the token, or the client address.
+
+        Without a token, only loopback clients may force a profile.
+        """
+        if self._token is not None:
+            # Compared as bytes: compare_digest rejects non-ASCII str, and
+            # WSGI hands header values over decoded as latin-1.
+            return hmac.compare_digest(value.encode("latin-1"), self._token.encode("utf-8"))
+        return request.remote_addr in LOCAL_ADDRESSES
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[None]:
+        """Profile the wrapped block if it is selected.
+
+        Args:
+            label: Name of the profiled call, stored alongside the profile.
+        """
+        if not self.should_profile() or not self._lock.acquire(blocking=False):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+        finally:
+            self._lock.release()
+
+        self._write(profiler, label, time.perf_counter() - start)
+
+    def _write(self, profiler: cProfile.Profile, label: str, duration: float) -> None:
+        """Write a profile and its metadata into the next ring-buffer slot."""
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        slot = next(self._slots) % self._max_profiles
+        prof_path = self._output_dir / f"profile-{slot:03d}.prof"
+        meta_path = self._output_dir / f"profile-{slot:03d}.json"
+
+        metadata = {
+            "label": label,
+            "captured_at": time.time(),
+            "duration_seconds": round(duration, 6),
+            "path": request.full_path if has_request_context() else None,
+        }
+
+        # Write to temp files first so readers never see a half-written slot.
+        tmp_prof = prof_path.with_suffix(".prof.tmp")
+        profiler.dump_stats(tmp_prof)
+        os.replace(tmp_prof, prof_path)
+
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_meta, meta_path)
+
+
+@contextmanager
+def profiled(label: str) -> Iterator[None]:
+    """Profile a service call if profiling is enabled for the current app.
+
+    Args:
+        label: Name of the profiled call, e.g. "search_exams".
+    """
+    profiler = current_app.extensions.get("profiler")
+    if profiler is None:
+        yield
+        return
+
+    with profiler.profile(label):
+        yield
+
+
+def init_profiling(app: Flask) -> RequestProfiler:
+    """Create the profiler from app config and register it on the app.
+
+    Args:
+        app: Flask application to configure.
+
+    Returns:
+        The profiler stored in ``app.extensions["profiler"]``.
+    """
+    output_dir = app.config["PROFILING_DIR"]
+    if output_dir is None:
+        output_dir = Path(__file__).parent.parent / "profiles"
+
+    profiler = RequestProfiler(
+        output_dir=output_dir,
+        sample_rate=app.config["PROFILING_SAMPLE_RATE"],
+        max_profiles=app.config["PROFILING_MAX_FILES"],
+        header=app.config["PROFILING_HEADER"],
+        token=app.config["PROFILING_TOKEN"],
+    )
+    app.extensions["profiler"] = profiler
+    return profiler
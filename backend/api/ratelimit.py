@@ -0,0 +1,167 @@
+"""In-process admission control: per-client rate limits and concurrency caps.
+
+Every request is assigned a budget by its endpoint (RATE_LIMIT_ENDPOINTS,
+falling back to "default"). A budget sets the token-bucket rate and burst
+each client gets per endpoint, and how many of its requests may run at once.
+A global cap (MAX_CONCURRENT_REQUESTS) bounds all admitted requests
+together. Requests over a client's rate get 429 and requests over a
+concurrency cap get 503, both at once and with Retry-After, so expensive
+endpoints cannot starve cheap lookups of worker threads.
+
+Limits are kept per process: with N pre-fork workers a client can reach up
+to N times its budget.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Flask, abort, current_app, g, jsonify, request
+
+
+class TokenBucket:
+    """Tokens refilled continuously at a fixed rate, up to a burst size."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+
+
+class RateLimiter:
+    """Token buckets keyed by (endpoint, client), with LRU eviction.
+
+    Evicting a client only resets it to a full bucket, so the table is
+    bounded without ever blocking legitimate clients.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+
+    def acquire(self, key: tuple[str, str], rate: float, burst: float, now: float | None = None) -> float:
+        """Take a token from a key's bucket.
+
+        Args:
+            key: Bucket identity, e.g. (endpoint, client address).
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+            now: Current monotonic time, for tests.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until one is available.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(burst, now)
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate)
+                bucket.updated = now
+
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return 0.0
+            return (1 - bucket.tokens) / rate if rate > 0 else math.inf
+
+
+class ConcurrencyLimiter:
+    """Non-blocking counter of requests in progress."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a slot unless `limit` are in use."""
+        with self._lock:
+            if self.active >= self.limit:
+                return False
+            self.active += 1
+            return True
+
+    def release(self) -> None:
+        """Return a slot taken by try_acquire."""
+        with self._lock:
+            self.active -= 1
+
+
+class AdmissionController:
+    """Limiters for one application, built from its configuration."""
+
+    def __init__(self, config: dict):
+        self.budgets = config["RATE_LIMIT_BUDGETS"]
+        self.endpoints = config["RATE_LIMIT_ENDPOINTS"]
+        self.exempt = frozenset(config["RATE_LIMIT_EXEMPT"])
+        self.rates = RateLimiter(config["RATE_LIMIT_MAX_CLIENTS"])
+        self.total = ConcurrencyLimiter(config["MAX_CONCURRENT_REQUESTS"])
+        self.concurrency = {
+            name: ConcurrencyLimiter(budget["max_concurrent"]) for name, budget in self.budgets.items()
+        }
+
+    def budget_for(self, endpoint: str | None) -> str:
+        """Return the budget name an endpoint is charged to."""
+        return self.endpoints.get(endpoint or "", "default")
+
+
+def _reject(status: int, error: str, message: str, retry_after: float) -> None:
+    response = jsonify({"error": error, "message": message})
+    response.status_code = status
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    abort(response)
+
+
+def _client_address() -> str:
+    if current_app.config["RATE_LIMIT_TRUST_PROXY"] and request.access_route:
+        return request.access_route[0]
+    return request.remote_addr or "unknown"
+
+
+def init_rate_limits(app: Flask) -> AdmissionController:
+    """Attach admission control hooks to the application.
+
+    Args:
+        app: Flask application to protect.
+
+    Returns:
+        The controller stored in ``app.extensions["admission"]``.
+    """
+    controller = AdmissionController(app.config)
+    app.extensions["admission"] = controller
+    retry_seconds = app.config["RATE_LIMIT_RETRY_AFTER_SECONDS"]
+
+    @app.before_request
+    def admit():
+        endpoint = request.endpoint
+        if request.method == "OPTIONS" or endpoint in controller.exempt:
+            return
+
+        name = controller.budget_for(endpoint)
+        budget = controller.budgets[name]
+        slots = g.admission_slots = []
+
+        for limiter in (controller.total, controller.concurrency[name]):
+            if not limiter.try_acquire():
+                _reject(503, "Service Unavailable", "Server is busy; try again shortly.", retry_seconds)
+            slots.append(limiter)
+
+        wait = controller.rates.acquire(
+            (endpoint or "unmatched", _client_address()), budget["rate"], budget["burst"]
+        )
+        if wait:
+            _reject(429, "Too Many Requests", "Rate limit exceeded; slow down.", wait)
+
+    @app.teardown_request
+    def release(exc):
+        for limiter in g.pop("admission_slots", ()):
+            limiter.release()
+
+    return controller
@@ -1 +1,35 @@
 """Repository layer for data access."""
+
+import os
+
+from api.repositories.exam_repository import ExamRepository
+
+# Environment variable selecting the storage backend for the default service.
+BACKEND_ENV_VAR = "EXAM_REPOSITORY_BACKEND"
+
+
+def create_repository(backend: str | None = None) -> ExamRepository:
+    """Create the exam repository for the configured storage backend.
+    
+    Args:
+        backend: "json" (default), "binary" or "sqlite". If not provided, read from
+                the EXAM_REPOSITORY_BACKEND environment variable.
+    
+    Returns:
+        Repository instance using the backend's default data path.
+    
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend = (backend or os.environ.get(BACKEND_ENV_VAR) or "json").lower()
+    
+    if backend == "json":
+        return ExamRepository()
+    if backend == "binary":
+        from api.repositories.binary_snapshot import BinarySnapshotRepository
+        return BinarySnapshotRepository()
+    if backend == "sqlite":
+        from api.repositories.sqlite_repository import SqliteExamRepository
+        return SqliteExamRepository()
+    
+    raise ValueError(f"Unknown exam repository backend: {backend}")
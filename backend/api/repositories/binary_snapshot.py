@@ -0,0 +1,496 @@
+"""Read-only, memory-mapped binary exam snapshots.
+
+A binary snapshot holds the same records as exams.json plus the structures
+the search index needs, laid out so they can be queried in place through
+``mmap``. Opening one is O(1): nothing is parsed until it is read, records
+are decoded only when returned, and every worker process that maps the
+same file shares a single page-cache copy.
+
+Layout (all integers little-endian):
+
+    header      magic "EXSNAP01", u32 version, u32 reserved,
+                u64 directory offset, u64 directory length
+    strings     u32[S + 1] offsets, then the UTF-8 bytes of S unique strings
+    records     u32[N * F] string ids, one row of F fields per record
+    search      u32[N + 1] offsets, then folded search keys
+    locations   u32[N + 1] offsets, then folded locations
+    postings    u32 ordinal arrays for each date
+    ngrams      u32[G + 1] offsets, then the G distinct search-key n-grams in
+                byte order; u32[G + 1] posting offsets, then the u32
+                ordinals containing each n-gram
+    sorted      sorted start times (i64 seconds, u16 minutes after midnight)
+                and the u32 ordinals in each order
+    directory   JSON: field names, section offsets, date postings, facets
+
+Usage:
+    python -m api.repositories.binary_snapshot data/exams.json data/exams.bin
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from api.repositories.exam_repository import ExamRepository
+from api.services.exam_index import NGRAM_SIZE, BaseExamIndex, ExamIndex, ngrams
+from scraper.fields import fold
+
+MAGIC = b"EXSNAP01"
+FORMAT_VERSION = 4
+HEADER = struct.Struct("<8sIIQQ")
+
+# String id stored for a field the record does not have.
+MISSING = 0xFFFFFFFF
+
+# Set on a string id whose string is the JSON encoding of a non-string value.
+JSON_VALUE_FLAG = 0x80000000
+
+# Postings longer than this many times the remaining candidates are not
+# intersected; the candidates' search keys are checked directly instead.
+VERIFY_RATIO = 8
+
+# Separates records in the search and location blobs; never part of a query.
+RECORD_SEPARATOR = b"\x01"
+
+
+def _pad(buffer: bytearray) -> None:
+    """Align the end of the buffer to 8 bytes."""
+    buffer.extend(b"\x00" * (-len(buffer) % 8))
+
+
+def _append_blob(buffer: bytearray, values: Sequence[bytes], separator: bytes = b"") -> dict:
+    """Append an offsets table and a blob of values, returning their location."""
+    offsets = array("I")
+    blob = bytearray()
+    for value in values:
+        offsets.append(len(blob))
+        blob.extend(value)
+        blob.extend(separator)
+    offsets.append(len(blob))
+
+    _pad(buffer)
+    offsets_at = len(buffer)
+    buffer.extend(offsets.tobytes())
+    blob_at = len(buffer)
+    buffer.extend(blob)
+    return {"offsets": offsets_at, "blob": blob_at, "count": len(values)}
+
+
+def _append_array(buffer: bytearray, values: array) -> dict:
+    """Append a typed array, returning its location."""
+    _pad(buffer)
+    section = {"offset": len(buffer), "count": len(values), "typecode": values.typecode}
+    buffer.extend(values.tobytes())
+    return section
+
+
+def write_binary_snapshot(exams: list[dict], path: str | Path) -> Path:
+    """Write exams and their search structures as a binary snapshot.
+
+    The file is written next to its destination and moved into place, so
+    processes that already mapped the old snapshot keep a valid mapping.
+
+    Args:
+        exams: Exam records in snapshot order.
+        path: Destination file.
+
+    Returns:
+        The destination path.
+    """
+    path = Path(path)
+    index = ExamIndex(exams)
+
+    fields: list[str] = []
+    for exam in exams:
+        for key in exam:
+            if key not in fields:
+                fields.append(key)
+
+    strings: list[bytes] = []
+    string_ids: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(strings)
+            strings.append(value.encode("utf-8"))
+        return string_id
+
+    records = array("I")
+    for exam in exams:
+        for field in fields:
+            if field not in exam:
+                records.append(MISSING)
+            elif isinstance(exam[field], str):
+                records.append(intern(exam[field]))
+            else:
+                records.append(intern(json.dumps(exam[field])) | JSON_VALUE_FLAG)
+
+    buffer = bytearray(HEADER.size)
+    sections: dict[str, dict] = {}
+    sections["strings"] = _append_blob(buffer, strings)
+
+    _pad(buffer)
+    sections["records"] = {"offset": len(buffer)}
+    buffer.extend(records.tobytes())
+
+    sections["search"] = _append_blob(
+        buffer, [key.encode("utf-8") for key in index.search_keys], RECORD_SEPARATOR
+    )
+    sections["locations"] = _append_blob(
+        buffer, [key.encode("utf-8") for key in index.location_keys], RECORD_SEPARATOR
+    )
+
+    date_postings: dict[str, list[int]] = {}
+    for date, ordinals in index.date_postings.items():
+        _pad(buffer)
+        date_postings[date] = [len(buffer), len(ordinals)]
+        buffer.extend(array("I", ordinals).tobytes())
+
+    grams = sorted(index.ngram_postings, key=lambda gram: gram.encode("utf-8"))
+    sections["ngrams"] = _append_blob(buffer, [gram.encode("utf-8") for gram in grams])
+    posting_offsets = array("I", [0])
+    postings = array("I")
+    for gram in grams:
+        postings.extend(index.ngram_postings[gram])
+        posting_offsets.append(len(postings))
+    sections["ngram_offsets"] = _append_array(buffer, posting_offsets)
+    sections["ngram_postings"] = _append_array(buffer, postings)
+
+    for name in ("start_keys", "start_order", "minute_keys", "minute_order"):
+        sections[name] = _append_array(buffer, getattr(index, name))
+
+    directory = json.dumps({
+        "count": len(exams),
+        "fields": fields,
+        "sections": sections,
+        "date_postings": date_postings,
+        "available_dates": index.available_dates,
+        "available_locations": index.available_locations,
+    }).encode("utf-8")
+
+    _pad(buffer)
+    directory_at = len(buffer)
+    buffer.extend(directory)
+    HEADER.pack_into(buffer, 0, MAGIC, FORMAT_VERSION, 0, directory_at, len(directory))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(buffer)
+    os.replace(tmp_path, path)
+    return path
+
+
+class _Blob:
+    """Offsets table plus byte blob inside the mapped file."""
+
+    def __init__(self, mapped: mmap.mmap, view: memoryview, section: dict):
+        count = section["count"]
+        self._mapped = mapped
+        self.offsets = view[section["offsets"]:section["offsets"] + 4 * (count + 1)].cast("I")
+        self.start = section["blob"]
+        self.end = self.start + self.offsets[count]
+
+    def get(self, position: int) -> bytes:
+        return self._mapped[self.start + self.offsets[position]:self.start + self.offsets[position + 1]]
+
+    def position(self, value: bytes) -> int | None:
+        """Return the position of ``value`` in a blob of sorted entries."""
+        low, high = 0, len(self.offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.get(middle) < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.offsets) - 1 and self.get(low) == value:
+            return low
+        return None
+
+    def find_all(self, needle: bytes) -> list[int]:
+        """Return the positions of every entry containing ``needle``."""
+        found = []
+        offsets = self.offsets
+        cursor = self.start
+        while True:
+            hit = self._mapped.find(needle, cursor, self.end)
+            if hit < 0:
+                return found
+            position = bisect_right(offsets, hit - self.start) - 1
+            found.append(position)
+            cursor = self.start + offsets[position + 1]
+
+
+class BinarySnapshot:
+    """A memory-mapped binary snapshot opened for reading."""
+
+    def __init__(self, path: str | Path):
+        """Map the snapshot file.
+
+        Args:
+            path: Snapshot written by write_binary_snapshot.
+
+        Raises:
+            ValueError: If the file is not a supported binary snapshot.
+        """
+        with open(path, "rb") as f:
+            self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mapped)
+
+        magic, version, _, directory_at, directory_length = HEADER.unpack_from(self._mapped, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported exam snapshot format: {path}")
+
+        directory = json.loads(self._mapped[directory_at:directory_at + directory_length])
+        sections = directory["sections"]
+
+        self.count: int = directory["count"]
+        self.fields: list[str] = directory["fields"]
+        self.available_dates: list[str] = directory["available_dates"]
+        self.available_locations: list[dict] = directory["available_locations"]
+
+        self._strings = _Blob(self._mapped, view, sections["strings"])
+        records_at = sections["records"]["offset"]
+        self._records = view[records_at:records_at + 4 * self.count * len(self.fields)].cast("I")
+        self.search = _Blob(self._mapped, view, sections["search"])
+        self.locations = _Blob(self._mapped, view, sections["locations"])
+        self.date_postings: dict[str, Sequence[int]] = {
+            date: view[offset:offset + 4 * length].cast("I")
+            for date, (offset, length) in directory["date_postings"].items()
+        }
+        self.ngrams = _Blob(self._mapped, view, sections["ngrams"])
+        self._ngram_offsets = self._array(view, sections["ngram_offsets"])
+        self._ngram_postings = self._array(view, sections["ngram_postings"])
+        self.sorted_arrays: dict[str, Sequence[int]] = {
+            name: self._array(view, sections[name])
+            for name in ("start_keys", "start_order", "minute_keys", "minute_order")
+        }
+        self.records = MappedExams(self)
+
+    @staticmethod
+    def _array(view: memoryview, section: dict) -> Sequence[int]:
+        size = array(section["typecode"]).itemsize
+        offset = section["offset"]
+        return view[offset:offset + size * section["count"]].cast(section["typecode"])
+
+    def ngram_posting(self, gram: str) -> Sequence[int] | None:
+        """Return the ordinals whose search key contains an n-gram, in order.
+
+        Args:
+            gram: Folded n-gram of NGRAM_SIZE characters.
+
+        Returns:
+            A view into the mapped postings, or None if no key contains it.
+        """
+        position = self.ngrams.position(gram.encode("utf-8"))
+        if position is None:
+            return None
+        return self._ngram_postings[self._ngram_offsets[position]:self._ngram_offsets[position + 1]]
+
+    def record(self, ordinal: int) -> dict:
+        """Decode a single record.
+
+        Args:
+            ordinal: Position of the record in the snapshot.
+
+        Returns:
+            The exam dictionary, equal to the one in exams.json.
+        """
+        width = len(self.fields)
+        row = self._records[ordinal * width:(ordinal + 1) * width]
+        exam = {}
+        for field, string_id in zip(self.fields, row):
+            if string_id == MISSING:
+                continue
+            if string_id & JSON_VALUE_FLAG:
+                exam[field] = json.loads(self._strings.get(string_id & ~JSON_VALUE_FLAG))
+            else:
+                exam[field] = self._strings.get(string_id).decode("utf-8")
+        return exam
+
+    def column(self, field: str) -> list:
+        """Decode one field of every record, without building whole records.
+
+        Args:
+            field: Field name.
+
+        Returns:
+            Field values in snapshot order; "" where a record lacks the field.
+        """
+        if field not in self.fields:
+            return [""] * self.count
+
+        width = len(self.fields)
+        decoded: dict[int, object] = {}
+        values = []
+        for string_id in self._records[self.fields.index(field)::width]:
+            if string_id == MISSING:
+                values.append("")
+                continue
+            value = decoded.get(string_id)
+            if value is None:
+                if string_id & JSON_VALUE_FLAG:
+                    value = json.loads(self._strings.get(string_id & ~JSON_VALUE_FLAG))
+                else:
+                    value = self._strings.get(string_id).decode("utf-8")
+                decoded[string_id] = value
+            values.append(value)
+        return values
+
+
+class MappedExams(Sequence[dict]):
+    """Lazy sequence of exam records decoded from a binary snapshot."""
+
+    def __init__(self, snapshot: BinarySnapshot):
+        self._snapshot = snapshot
+
+    def __len__(self) -> int:
+        return self._snapshot.count
+
+    def __getitem__(self, ordinal):
+        if isinstance(ordinal, slice):
+            return [self._snapshot.record(i) for i in range(*ordinal.indices(len(self)))]
+        if ordinal < 0:
+            ordinal += len(self)
+        if not 0 <= ordinal < len(self):
+            raise IndexError("exam ordinal out of range")
+        return self._snapshot.record(ordinal)
+
+    def __iter__(self) -> Iterator[dict]:
+        for ordinal in range(len(self)):
+            yield self._snapshot.record(ordinal)
+
+
+class MappedExamIndex(BaseExamIndex):
+    """Index answered directly from a mapped binary snapshot."""
+
+    def __init__(self, snapshot: BinarySnapshot):
+        super().__init__()
+        self.exams = snapshot.records
+        self.date_postings = snapshot.date_postings
+        self.available_dates = snapshot.available_dates
+        self.available_locations = snapshot.available_locations
+        self.start_keys = snapshot.sorted_arrays["start_keys"]
+        self.start_order = snapshot.sorted_arrays["start_order"]
+        self.minute_keys = snapshot.sorted_arrays["minute_keys"]
+        self.minute_order = snapshot.sorted_arrays["minute_order"]
+        self._snapshot = snapshot
+
+    def match_query(self, query: str) -> Sequence[int]:
+        """Return ordinals whose search key contains the query.
+
+        As in ExamIndex, queries of at least NGRAM_SIZE characters are
+        narrowed to the intersection of their mapped n-gram postings and
+        verified; shorter ones scan the search keys.
+        """
+        query_lower = fold(query)
+        search = self._snapshot.search
+        needle = query_lower.encode("utf-8")
+
+        if len(query_lower) < NGRAM_SIZE:
+            return search.find_all(needle)
+
+        postings = []
+        for gram in ngrams(query_lower):
+            posting = self._snapshot.ngram_posting(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = postings[0]
+        for posting in postings[1:]:
+            # Checking a few candidates' keys beats hashing a long posting.
+            if len(posting) > VERIFY_RATIO * len(candidates):
+                break
+            allowed = set(posting)
+            candidates = [i for i in candidates if i in allowed]
+            if not candidates:
+                return []
+
+        return [i for i in candidates if needle in search.get(i)]
+
+    def match_location(
+        self,
+        location: str,
+        candidates: Iterable[int] | None = None,
+    ) -> Sequence[int]:
+        needle = fold(location).encode("utf-8")
+        locations = self._snapshot.locations
+        if candidates is None:
+            return locations.find_all(needle)
+        return [i for i in candidates if needle in locations.get(i)]
+
+    def column(self, field: str) -> Sequence:
+        return self._snapshot.column(field)
+
+    def search_key_at(self, ordinal: int) -> str:
+        return self._snapshot.search.get(ordinal)[:-len(RECORD_SEPARATOR)].decode("utf-8")
+
+
+class BinarySnapshotRepository(ExamRepository):
+    """Repository that serves exams from a memory-mapped binary snapshot."""
+
+    def __init__(self, data_path: str | Path | None = None):
+        """Initialize the repository.
+
+        Args:
+            data_path: Path to the binary snapshot. If not provided,
+                      defaults to backend/data/exams.bin.
+        """
+        if data_path is None:
+            data_path = Path(__file__).parent.parent.parent / "data" / "exams.bin"
+        super().__init__(data_path)
+        self._snapshot: BinarySnapshot | None = None
+
+    def _load_exams(self) -> Sequence[dict]:
+        """Map the snapshot file.
+
+        Returns:
+            Lazy sequence of exam dictionaries.
+
+        Raises:
+            FileNotFoundError: If the snapshot file doesn't exist.
+            ValueError: If the file is not a supported binary snapshot.
+        """
+        if not self._data_path.exists():
+            raise FileNotFoundError(f"Exam snapshot file not found: {self._data_path}")
+
+        stat = self._data_path.stat()
+        snapshot = BinarySnapshot(self._data_path)
+        self._snapshot = snapshot
+        self._cache = snapshot.records
+        self._snapshot_stat = (stat.st_mtime_ns, stat.st_size)
+
+        return self._cache
+
+    def load_index(self) -> MappedExamIndex | None:
+        """Return an index that queries the mapped snapshot in place."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return MappedExamIndex(snapshot)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Convert a JSON snapshot into a binary snapshot."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Usage: python -m api.repositories.binary_snapshot SOURCE.json DEST.bin")
+        raise SystemExit(2)
+
+    source, destination = args
+    with open(source, "r", encoding="utf-8") as f:
+        exams = json.load(f)
+    write_binary_snapshot(exams, destination)
+    print(f"Wrote {len(exams)} exams to {destination}")
+
+
+if __name__ == "__main__":
+    main()
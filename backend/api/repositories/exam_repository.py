@@ -1,9 +1,13 @@
 """Repository for exam data access from JSON file."""
 
+import hashlib
 import json
 from pathlib import Path
 from functools import lru_cache
 
+from api.services.exam_index import load_index_artifact
+from api.services.singleflight import SingleFlight
+
 
 class ExamRepository:
     """Repository for accessing exam data from JSON storage."""
@@ -22,6 +26,11 @@ class ExamRepository:
         
         self._data_path = Path(data_path)
         self._cache: list[dict] | None = None
+        self._snapshot_stat: tuple[int, int] | None = None
+        # (exams, sha256 of the file they were parsed from), swapped as a pair
+        self._checksummed: tuple[list[dict], str] | None = None
+        # Threads that find the cache empty at the same time share one read.
+        self._flights = SingleFlight()
     
     def get_all_exams(self) -> list[dict]:
         """Get all exams from the data file.
@@ -35,7 +44,7 @@ class ExamRepository:
         if self._cache is not None:
             return self._cache
         
-        return self._load_exams()
+        return self._flights.do("load", self._load_exams)
     
     def _load_exams(self) -> list[dict]:
         """Load exams from the JSON file.
@@ -50,11 +59,69 @@ class ExamRepository:
         if not self._data_path.exists():
             raise FileNotFoundError(f"Exam data file not found: {self._data_path}")
         
-        with open(self._data_path, "r", encoding="utf-8") as f:
-            self._cache = json.load(f)
+        stat = self._data_path.stat()
+        with open(self._data_path, "rb") as f:
+            payload = f.read()
+        exams = json.loads(payload)
+        self._checksummed = (exams, hashlib.sha256(payload).hexdigest())
+        self._snapshot_stat = (stat.st_mtime_ns, stat.st_size)
+        self._cache = exams
         
         return self._cache
     
+    def snapshot_changed(self) -> bool:
+        """Check whether the data file differs from the loaded snapshot.
+        
+        Returns:
+            True if a snapshot was loaded from disk and the file's mtime or
+            size has changed since; False otherwise.
+        """
+        if self._snapshot_stat is None:
+            return False
+        try:
+            stat = self._data_path.stat()
+        except FileNotFoundError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) != self._snapshot_stat
+    
+    def snapshot_id(self) -> str | None:
+        """Identify the loaded snapshot file by its mtime and size.
+        
+        Returns:
+            Opaque identifier that changes whenever a different file is
+            loaded, or None if nothing was loaded from disk.
+        """
+        snapshot_stat = self._snapshot_stat
+        if snapshot_stat is None:
+            return None
+        return "{:x}-{:x}".format(*snapshot_stat)
+    
+    def reload(self) -> list[dict]:
+        """Re-read the data file, replacing the cached snapshot in one step.
+        
+        Unlike clear_cache, concurrent readers keep seeing the previous
+        snapshot until the new one has been fully loaded.
+        
+        Returns:
+            List of exam dictionaries.
+        """
+        return self._flights.do("load", self._load_exams)
+    
+    def load_index(self):
+        """Return a prebuilt search index for the current snapshot, if any.
+        
+        Uses the index artifact written by the scraper next to the data
+        file when its checksum matches the loaded snapshot.
+        
+        Returns:
+            An index over the cached exams, or None to build one in memory.
+        """
+        checksummed = self._checksummed
+        if checksummed is None:
+            return None
+        exams, sha256 = checksummed
+        return load_index_artifact(exams, self._data_path, sha256)
+    
     def clear_cache(self) -> None:
         """Clear the cached exam data.
         
@@ -0,0 +1,460 @@
+"""SQLite exam storage with filtering and pagination pushed down to SQL.
+
+A SQLite snapshot holds one row per exam with the original record as JSON,
+plus the derived columns the API filters on, each with a B-tree index, and
+an FTS5 trigram table over the folded search keys for ``q``. Requests
+compile their filters into one WHERE clause, so counting, paging and facet
+counts run inside SQLite and only the requested page is decoded.
+
+Schema (PRAGMA user_version = SCHEMA_VERSION):
+
+    exams       ordinal (rowid), crn, date, subject_key, building_key,
+                location_key, search_key, start_epoch, start_minute, record
+    exams_fts   contentless FTS5 table (trigram tokenizer), rowid = ordinal
+    meta        key/value JSON: count, available_dates, available_locations
+
+Usage:
+    python -m api.repositories.sqlite_repository data/exams.json data/exams.db
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from api.repositories.exam_repository import ExamRepository
+from api.services import bitmap
+from api.services.exam_index import (
+    FACET_FIELDS,
+    MINUTES_PER_DAY,
+    NGRAM_SIZE,
+    RANK_EXACT_COURSE,
+    RANK_EXACT_CRN,
+    RANK_PREFIX,
+    RANK_SUBSTRING,
+    BaseExamIndex,
+    ExamIndex,
+    rank_query,
+    time_window,
+)
+from scraper.fields import FIELD_SEPARATOR, derived_fields, fold, public_record, start_seconds
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE exams (
+    ordinal INTEGER PRIMARY KEY,
+    crn TEXT,
+    date TEXT,
+    subject_key TEXT,
+    building_key TEXT,
+    location_key TEXT NOT NULL,
+    search_key TEXT NOT NULL,
+    start_epoch INTEGER,
+    start_minute INTEGER,
+    record TEXT NOT NULL
+);
+CREATE INDEX exams_crn ON exams (crn);
+CREATE INDEX exams_date ON exams (date);
+CREATE INDEX exams_subject ON exams (subject_key);
+CREATE INDEX exams_building ON exams (building_key);
+CREATE INDEX exams_location ON exams (location_key);
+CREATE INDEX exams_start ON exams (start_epoch);
+CREATE INDEX exams_minute ON exams (start_minute);
+CREATE VIRTUAL TABLE exams_fts USING fts5 (search_key, content='', tokenize='trigram');
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Replaces FIELD_SEPARATOR in stored search keys: SQLite text functions and
+# FTS5 stop at NUL characters.
+SQL_FIELD_SEPARATOR = "\x01"
+
+# Memory-mapped I/O lets every worker read the database through the shared
+# page cache instead of copying pages into per-connection buffers.
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _lower_or_none(value) -> str | None:
+    return value.lower() if isinstance(value, str) and value else None
+
+
+def write_sqlite_database(exams: list[dict], path: str | Path) -> Path:
+    """Write exams as a SQLite snapshot.
+
+    The database is built next to its destination and moved into place, so
+    connections to the previous snapshot keep reading a consistent file.
+
+    Args:
+        exams: Exam records in snapshot order.
+        path: Destination file.
+
+    Returns:
+        The destination path.
+    """
+    path = Path(path)
+    index = ExamIndex(exams)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    rows = []
+    for ordinal, exam in enumerate(exams):
+        derived = derived_fields(exam)
+        seconds = derived["start_epoch"]
+        rows.append((
+            ordinal,
+            exam.get("crn"),
+            derived["date_iso"],
+            _lower_or_none(exam.get("subject")),
+            _lower_or_none(derived["building"]),
+            derived["location_key"],
+            derived["search_key"].replace(FIELD_SEPARATOR, SQL_FIELD_SEPARATOR),
+            seconds,
+            None if seconds is None else seconds // 60 % MINUTES_PER_DAY,
+            json.dumps(exam, ensure_ascii=False),
+        ))
+
+    connection = sqlite3.connect(tmp_path)
+    try:
+        with connection:
+            connection.executescript(SCHEMA)
+            connection.executemany("INSERT INTO exams VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            connection.executemany(
+                "INSERT INTO exams_fts (rowid, search_key) VALUES (?, ?)",
+                [(row[0], row[6]) for row in rows],
+            )
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("count", json.dumps(len(exams))),
+                ("available_dates", json.dumps(index.available_dates)),
+                ("available_locations", json.dumps(index.available_locations)),
+            ])
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    finally:
+        connection.close()
+
+    os.replace(tmp_path, path)
+    return path
+
+
+class ConnectionPool:
+    """Read-only connections to one SQLite snapshot, one per thread.
+
+    Connections are never shared across threads or forked processes: a
+    worker forked from a preloaded master opens its own on first use.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the pool.
+
+        Args:
+            path: SQLite snapshot written by write_sqlite_database.
+        """
+        self._uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+            connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Run a statement on this thread's connection."""
+        return self.connection().execute(sql, params)
+
+
+class SqliteExams(Sequence[dict]):
+    """Lazy sequence of exam records read from a SQLite snapshot."""
+
+    def __init__(self, pool: ConnectionPool, count: int):
+        self.pool = pool
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, ordinal):
+        if isinstance(ordinal, slice):
+            start, stop, step = ordinal.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            rows = self.pool.execute(
+                "SELECT record FROM exams WHERE ordinal >= ? AND ordinal < ? ORDER BY ordinal",
+                (start, stop),
+            )
+            return [json.loads(record) for (record,) in rows]
+        if ordinal < 0:
+            ordinal += len(self)
+        row = self.pool.execute("SELECT record FROM exams WHERE ordinal = ?", (ordinal,)).fetchone()
+        if row is None:
+            raise IndexError("exam ordinal out of range")
+        return json.loads(row[0])
+
+    def __iter__(self) -> Iterator[dict]:
+        for (record,) in self.pool.execute("SELECT record FROM exams ORDER BY ordinal"):
+            yield json.loads(record)
+
+
+class SqlMatch:
+    """Filters compiled into a WHERE clause and its parameters."""
+
+    def __init__(self, where: str, params: list):
+        self.where = where
+        self.params = params
+
+
+class SqliteExamIndex(BaseExamIndex):
+    """Index whose filters, counts and pages are answered by SQLite."""
+
+    def __init__(self, pool: ConnectionPool, exams: SqliteExams):
+        super().__init__()
+        self.exams = exams
+        self._pool = pool
+        meta = dict(pool.execute("SELECT key, value FROM meta"))
+        self.available_dates = json.loads(meta["available_dates"])
+        self.available_locations = json.loads(meta["available_locations"])
+        self._date_postings: dict[str, list[int]] | None = None
+
+    @property
+    def date_postings(self) -> dict[str, list[int]]:
+        if self._date_postings is None:
+            postings: dict[str, list[int]] = {}
+            rows = self._pool.execute(
+                "SELECT date, ordinal FROM exams WHERE date IS NOT NULL ORDER BY ordinal"
+            )
+            for date, ordinal in rows:
+                postings.setdefault(date, []).append(ordinal)
+            self._date_postings = postings
+        return self._date_postings
+
+    def match(
+        self,
+        query: str | None = None,
+        date: str | None = None,
+        location: str | None = None,
+        subject: str | None = None,
+        building: str | None = None,
+        start_after: str | None = None,
+        start_before: str | None = None,
+        time_of_day: str | None = None,
+    ) -> SqlMatch:
+        """Compile filters into a WHERE clause; nothing is queried yet.
+
+        Takes the same arguments as filter_bitmap, with the same semantics.
+        """
+        clauses: list[str] = []
+        params: list = []
+
+        if date:
+            clauses.append("date = ?")
+            params.append(date)
+        if subject:
+            clauses.append("subject_key = ?")
+            params.append(subject.strip().lower())
+        if building:
+            clauses.append("building_key = ?")
+            params.append(building.strip().lower())
+
+        low = start_seconds(start_after) if start_after else None
+        high = start_seconds(start_before) if start_before else None
+        if low is not None:
+            clauses.append("start_epoch >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append("start_epoch < ?")
+            params.append(high)
+
+        if time_of_day:
+            window = time_window(time_of_day)
+            if window is None:
+                clauses.append("0")
+            else:
+                clauses.append("start_minute >= ? AND start_minute < ?")
+                params.extend(window)
+
+        if query:
+            query_lower = fold(query)
+            text = ["instr(search_key, ?) > 0"]
+            text_params: list = [query_lower]
+            if len(query_lower) >= NGRAM_SIZE:
+                # The trigram table narrows candidates; instr keeps the exact
+                # substring semantics of the in-memory index.
+                text.insert(0, "ordinal IN (SELECT rowid FROM exams_fts WHERE exams_fts MATCH ?)")
+                text_params.insert(0, '"' + query_lower.replace('"', '""') + '"')
+            course = rank_query(query)[1]
+            if course:
+                # See BaseExamIndex.course_bitmap.
+                clauses.append(
+                    f"(({' AND '.join(text)}) OR (subject_key = ? AND substr(search_key, 1, ?) = ?))"
+                )
+                params += [*text_params, course[0], len(course[1]) + 1, course[1] + SQL_FIELD_SEPARATOR]
+            else:
+                clauses.extend(text)
+                params += text_params
+
+        if location:
+            clauses.append("instr(location_key, ?) > 0")
+            params.append(fold(location))
+
+        return SqlMatch(" AND ".join(clauses) or "1", params)
+
+    def count(self, matched: SqlMatch) -> int:
+        return self._pool.execute(
+            f"SELECT COUNT(*) FROM exams WHERE {matched.where}", matched.params
+        ).fetchone()[0]
+
+    def page(self, matched: SqlMatch, start: int, count: int) -> list[dict]:
+        rows = self._pool.execute(
+            f"SELECT record FROM exams WHERE {matched.where} ORDER BY ordinal LIMIT ? OFFSET ?",
+            [*matched.params, count, start],
+        )
+        return [public_record(json.loads(record)) for (record,) in rows]
+
+    def ranked_page(self, matched: SqlMatch, query: str, start: int, count: int) -> list[dict]:
+        """Return a page of matches ordered by relevance, ranked by SQLite.
+
+        The tiers are those of relevance(), expressed as a CASE over the
+        stored search key; ORDER BY with LIMIT lets SQLite keep only the top
+        rows instead of sorting every match.
+        """
+        folded, course = rank_query(query)
+        separator = SQL_FIELD_SEPARATOR
+        cases = ["WHEN substr(search_key, -?) = ? THEN ?"]
+        params: list = [len(folded) + 1, separator + folded, RANK_EXACT_CRN]
+        if course:
+            cases.append("WHEN subject_key = ? AND substr(search_key, 1, ?) = ? THEN ?")
+            params += [course[0], len(course[1]) + 1, course[1] + separator, RANK_EXACT_COURSE]
+        cases.append(
+            "WHEN substr(search_key, 1, ?) = ? OR instr(search_key, ?) > 0 OR instr(search_key, ?) > 0 THEN ?"
+        )
+        params += [len(folded), folded, separator + folded, " " + folded, RANK_PREFIX]
+
+        rows = self._pool.execute(
+            f"SELECT record FROM exams WHERE {matched.where} "
+            f"ORDER BY CASE {' '.join(cases)} ELSE {RANK_SUBSTRING} END, ordinal LIMIT ? OFFSET ?",
+            [*matched.params, *params, count, start],
+        )
+        return [public_record(json.loads(record)) for (record,) in rows]
+
+    def facet_counts(self, field: str, selected) -> dict[str, int]:
+        """Count matches per facet value with one GROUP BY query.
+
+        Args:
+            field: One of FACET_FIELDS.
+            selected: Match set returned by match, or a bitmap.
+        """
+        if field not in FACET_FIELDS:
+            raise ValueError(f"Unknown facet: {field!r}")
+        if isinstance(selected, int):
+            return super().facet_counts(field, selected)
+
+        column = "date" if field == "date" else "building_key"
+        grouped = dict(self._pool.execute(
+            f"SELECT {column}, COUNT(*) FROM exams WHERE {selected.where} GROUP BY {column}",
+            selected.params,
+        ))
+
+        if field == "date":
+            values = [(date, date) for date in self.available_dates]
+        else:
+            values = [(entry["building"], entry["building"].lower()) for entry in self.available_locations]
+        return {value: grouped[key] for value, key in values if grouped.get(key)}
+
+    def filter(self, *args, **kwargs) -> list[int]:
+        matched = self.match(*args, **kwargs)
+        rows = self._pool.execute(
+            f"SELECT ordinal FROM exams WHERE {matched.where} ORDER BY ordinal", matched.params
+        )
+        return [ordinal for (ordinal,) in rows]
+
+    def filter_bitmap(self, *args, **kwargs) -> int:
+        return bitmap.from_ordinals(self.filter(*args, **kwargs), len(self))
+
+    def match_query(self, query: str) -> Sequence[int]:
+        return self.filter(query=query)
+
+    def match_location(self, location: str, candidates=None) -> Sequence[int]:
+        matched = self.filter(location=location)
+        if candidates is None:
+            return matched
+        allowed = set(candidates)
+        return [i for i in matched if i in allowed]
+
+    def column(self, field: str) -> Sequence:
+        return [exam.get(field, "") for exam in self.exams]
+
+
+class SqliteExamRepository(ExamRepository):
+    """Repository that serves exams from a read-only SQLite snapshot."""
+
+    def __init__(self, data_path: str | Path | None = None):
+        """Initialize the repository.
+
+        Args:
+            data_path: Path to the SQLite snapshot. If not provided,
+                      defaults to backend/data/exams.db.
+        """
+        if data_path is None:
+            data_path = Path(__file__).parent.parent.parent / "data" / "exams.db"
+        super().__init__(data_path)
+
+    def _load_exams(self) -> Sequence[dict]:
+        """Open a connection pool for the current snapshot file.
+
+        Returns:
+            Lazy sequence of exam dictionaries.
+
+        Raises:
+            FileNotFoundError: If the snapshot file doesn't exist.
+            ValueError: If the file is not a supported SQLite snapshot.
+        """
+        if not self._data_path.exists():
+            raise FileNotFoundError(f"Exam database file not found: {self._data_path}")
+
+        stat = self._data_path.stat()
+        pool = ConnectionPool(self._data_path)
+        try:
+            version = pool.execute("PRAGMA user_version").fetchone()[0]
+            count = json.loads(pool.execute("SELECT value FROM meta WHERE key = 'count'").fetchone()[0])
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Unsupported exam database: {self._data_path}") from e
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported exam database schema: {self._data_path}")
+
+        self._cache = SqliteExams(pool, count)
+        self._snapshot_stat = (stat.st_mtime_ns, stat.st_size)
+
+        return self._cache
+
+    def load_index(self) -> SqliteExamIndex | None:
+        """Return an index that pushes queries down to the database."""
+        exams = self._cache
+        if not isinstance(exams, SqliteExams):
+            return None
+        return SqliteExamIndex(exams.pool, exams)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Convert a JSON snapshot into a SQLite snapshot."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Usage: python -m api.repositories.sqlite_repository SOURCE.json DEST.db")
+        raise SystemExit(2)
+
+    source, destination = args
+    with open(source, "r", encoding="utf-8") as f:
+        exams = json.load(f)
+    write_sqlite_database(exams, destination)
+    print(f"Wrote {len(exams)} exams to {destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Snapshot change feed API route."""
+
+from flask import Blueprint, request, abort
+from api.services.changefeed import get_change_feed
+
+changes_bp = Blueprint("changes", __name__)
+
+# Initialize change feed
+_change_feed = get_change_feed()
+
+
+@changes_bp.route("/changes", methods=["GET"])
+def get_changes():
+    """Get the records that changed since a snapshot version.
+    
+    Query Parameters:
+        since: Snapshot version the client already has. If omitted, only
+               the current version is returned.
+        
+    Returns:
+        JSON response with the current 'version' and a 'resync' flag. When
+        resync is false, 'added' and 'changed' hold full exam records and
+        'removed' holds event ids. When resync is true the version is too
+        old (or unknown) and the client must reload /api/exams.
+    """
+    since = request.args.get("since", "").strip()
+    if not since:
+        return {"version": _change_feed.current_version()}
+    
+    try:
+        since_version = int(since)
+    except ValueError:
+        abort(400, description="Since must be an integer version.")
+    
+    if since_version < 0:
+        abort(400, description="Since must be a non-negative integer version.")
+    
+    return _change_feed.changes_since(since_version)
@@ -0,0 +1,68 @@
+"""Server-Sent Events API route for snapshot update notifications."""
+
+from flask import Blueprint, Response, abort, current_app, request
+from api.events import format_event, get_broadcaster
+from api.services.changefeed import get_change_feed
+from api.services.exam_service import get_exam_service
+
+events_bp = Blueprint("events", __name__)
+
+# Initialize service and broadcaster
+_exam_service = get_exam_service()
+_broadcaster = get_broadcaster()
+
+SNAPSHOT_UPDATED = "snapshot-updated"
+
+
+def _snapshot_event() -> tuple[dict, str | None]:
+    """Build the payload and event id describing the served snapshot."""
+    snapshot_id = _exam_service.snapshot_id()
+    return {"version": get_change_feed().current_version(), "snapshot": snapshot_id}, snapshot_id
+
+
+def publish_snapshot_updated() -> None:
+    """Notify every open stream in this process that the snapshot changed."""
+    data, event_id = _snapshot_event()
+    _broadcaster.publish(SNAPSHOT_UPDATED, data, event_id)
+
+
+_exam_service.add_reload_listener(publish_snapshot_updated)
+
+
+@events_bp.route("/events", methods=["GET"])
+def stream_events():
+    """Stream snapshot update notifications as Server-Sent Events.
+    
+    Sends a 'snapshot-updated' event, whose data holds the change feed
+    'version' and an opaque 'snapshot' id (also used as the event id),
+    whenever the served snapshot changes. A reconnecting client whose
+    Last-Event-ID differs from the current snapshot gets the event at once.
+    Streams close after EVENTS_MAX_STREAM_SECONDS; EventSource reconnects.
+    
+    Returns:
+        text/event-stream response, or 503 when too many streams are open.
+    """
+    config = current_app.config
+    if not _broadcaster.try_connect(config["EVENTS_MAX_CLIENTS"]):
+        response = current_app.response_class("Too many event streams.", status=503)
+        response.headers["Retry-After"] = str(config["EVENTS_RETRY_AFTER_SECONDS"])
+        abort(response)
+    
+    initial = []
+    data, event_id = _snapshot_event()
+    last_event_id = request.headers.get("Last-Event-ID")
+    if last_event_id is not None and last_event_id != event_id:
+        initial.append(format_event(SNAPSHOT_UPDATED, data, event_id))
+    
+    response = Response(
+        _broadcaster.stream(
+            initial,
+            heartbeat_seconds=config["EVENTS_HEARTBEAT_SECONDS"],
+            max_seconds=config["EVENTS_MAX_STREAM_SECONDS"],
+        ),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Runs when the server closes the response, including client disconnects.
+    response.call_on_close(_broadcaster.disconnect)
+    return response
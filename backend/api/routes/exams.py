@@ -1,13 +1,22 @@
 """Exam API routes."""
 
-from flask import Blueprint, request, abort
-from api.services.exam_service import ExamService
-from api.validators import validate_pagination, validate_search_query, validate_date_format
+from flask import Blueprint, request, abort, jsonify
+from api.metrics import phase
+from api.profiling import profiled
+from api.services.exam_service import get_exam_service
+from api.validators import (
+    validate_date_format,
+    validate_datetime,
+    validate_facets,
+    validate_pagination,
+    validate_search_query,
+    validate_time_of_day,
+)
 
 exams_bp = Blueprint("exams", __name__)
 
 # Initialize service
-_exam_service = ExamService()
+_exam_service = get_exam_service()
 
 
 @exams_bp.route("/exams", methods=["GET"])
@@ -15,53 +24,94 @@ def get_exams():
     """Get exams with optional search and filters.
     
     Query Parameters:
-        q: Search query (partial, case-insensitive match on course_number, course_name, crn)
+        q: Search query (partial, case-insensitive match on course_number, course_name, crn;
+           a course code such as "CS 010A" or "cs010a" also matches subject and number)
+           Results are ranked: exact CRN, exact course code, prefix, then other matches.
         date: Filter by date (ISO format: YYYY-MM-DD)
         location: Filter by location (case-insensitive)
+        subject: Filter by exact subject code (case-insensitive)
+        building: Filter by exact building code (case-insensitive)
+        start_after: Only exams starting at or after this ISO date or datetime
+        start_before: Only exams starting before this ISO date or datetime
+        time_of_day: Start-time window (morning, afternoon, evening, HH:MM or HH:MM-HH:MM)
+        facets: Comma-separated facets to count matches for (date, building)
         page: Page number (default: 1)
         limit: Items per page (default: 20, max: 100)
         
     Returns:
         JSON response with exam data and pagination metadata.
     """
-    # Extract and validate parameters
-    search_query = request.args.get("q", "").strip()
-    date_filter = request.args.get("date", "").strip()
-    location_filter = request.args.get("location", "").strip()
-    
-    # Validate search query
-    if search_query:
-        error = validate_search_query(search_query)
+    with phase("validate"):
+        # Extract and validate parameters
+        search_query = request.args.get("q", "").strip()
+        date_filter = request.args.get("date", "").strip()
+        location_filter = request.args.get("location", "").strip()
+        subject_filter = request.args.get("subject", "").strip()
+        building_filter = request.args.get("building", "").strip()
+        start_after = request.args.get("start_after", "").strip()
+        start_before = request.args.get("start_before", "").strip()
+        time_of_day = request.args.get("time_of_day", "").strip()
+        
+        # Validate search query and exact-match filters
+        for value in (search_query, subject_filter, building_filter):
+            if value:
+                error = validate_search_query(value)
+                if error:
+                    abort(400, description=error)
+        
+        # Validate date format
+        if date_filter:
+            error = validate_date_format(date_filter)
+            if error:
+                abort(400, description=error)
+        
+        # Validate time filters
+        for value in (start_after, start_before):
+            if value:
+                error = validate_datetime(value)
+                if error:
+                    abort(400, description=error)
+        
+        if time_of_day:
+            error = validate_time_of_day(time_of_day)
+            if error:
+                abort(400, description=error)
+        
+        # Validate requested facets
+        facets = [f.strip() for f in request.args.get("facets", "").split(",") if f.strip()]
+        error = validate_facets(facets)
         if error:
             abort(400, description=error)
-    
-    # Validate date format
-    if date_filter:
-        error = validate_date_format(date_filter)
+        
+        # Validate and parse pagination
+        try:
+            page = int(request.args.get("page", 1))
+            limit = int(request.args.get("limit", 20))
+        except ValueError:
+            abort(400, description="Page and limit must be integers.")
+        
+        error = validate_pagination(page, limit)
         if error:
             abort(400, description=error)
-    
-    # Validate and parse pagination
-    try:
-        page = int(request.args.get("page", 1))
-        limit = int(request.args.get("limit", 20))
-    except ValueError:
-        abort(400, description="Page and limit must be integers.")
-    
-    error = validate_pagination(page, limit)
-    if error:
-        abort(400, description=error)
-    
-    # Cap limit at 100
-    limit = min(limit, 100)
+        
+        # Cap limit at 100
+        limit = min(limit, 100)
     
     # Get filtered exams
-    result = _exam_service.search_exams(
-        query=search_query or None,
-        date=date_filter or None,
-        location=location_filter or None,
-        page=page,
-        limit=limit
-    )
+    with profiled("search_exams"):
+        result = _exam_service.search_exams(
+            query=search_query or None,
+            date=date_filter or None,
+            location=location_filter or None,
+            page=page,
+            limit=limit,
+            subject=subject_filter or None,
+            building=building_filter or None,
+            facets=list(dict.fromkeys(facets)),
+            start_after=start_after or None,
+            start_before=start_before or None,
+            time_of_day=time_of_day or None
+        )
     
-    return result
+    with phase("serialize"):
+        return jsonify(result)
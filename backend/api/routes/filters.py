@@ -1,12 +1,13 @@
 """Filter API routes for dates and locations."""
 
 from flask import Blueprint
-from api.services.exam_service import ExamService
+from api.profiling import profiled
+from api.services.exam_service import get_exam_service
 
 filters_bp = Blueprint("filters", __name__)
 
 # Initialize service
-_exam_service = ExamService()
+_exam_service = get_exam_service()
 
 
 @filters_bp.route("/dates", methods=["GET"])
@@ -17,7 +18,8 @@ def get_dates():
         JSON response with list of unique exam dates in ISO format (YYYY-MM-DD),
         sorted chronologically.
     """
-    dates = _exam_service.get_available_dates()
+    with profiled("get_available_dates"):
+        dates = _exam_service.get_available_dates()
     return {"data": dates}
 
 
@@ -28,5 +30,6 @@ def get_locations():
     Returns:
         JSON response with locations grouped by building, sorted alphabetically.
     """
-    locations = _exam_service.get_available_locations()
+    with profiled("get_available_locations"):
+        locations = _exam_service.get_available_locations()
     return {"data": locations}
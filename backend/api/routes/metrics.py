@@ -0,0 +1,61 @@
+"""Metrics API routes."""
+
+import resource
+import sys
+import tracemalloc
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+from api.metrics import LOCAL_ADDRESSES
+from api.services.exam_service import get_exam_service
+
+metrics_bp = Blueprint("metrics", __name__)
+
+# Initialize service
+_exam_service = get_exam_service()
+
+
+def _require_local() -> None:
+    """Hide the route from remote clients unless METRICS_LOCAL_ONLY is off."""
+    if current_app.config["METRICS_LOCAL_ONLY"] and request.remote_addr not in LOCAL_ADDRESSES:
+        abort(404)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def get_metrics():
+    """Expose request latency metrics in Prometheus text format.
+    
+    Only served to loopback clients unless METRICS_LOCAL_ONLY is disabled.
+    
+    Returns:
+        Plain-text response in the Prometheus exposition format.
+    """
+    _require_local()
+    
+    registry = current_app.extensions["metrics"]
+    return Response(registry.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@metrics_bp.route("/metrics/memory", methods=["GET"])
+def get_memory():
+    """Report the memory held by this worker's snapshot and indexes.
+    
+    Walks every structure with sys.getsizeof, so it costs a pass over the
+    snapshot; only served to loopback clients unless METRICS_LOCAL_ONLY is
+    disabled. Traced totals are included when the process runs with
+    tracemalloc enabled (e.g. PYTHONTRACEMALLOC=1).
+    
+    Returns:
+        JSON with bytes per structure, totals and process memory.
+    """
+    _require_local()
+    
+    report = _exam_service.memory_report()
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report["process"] = {"max_rss_bytes": max_rss if sys.platform == "darwin" else max_rss * 1024}
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["process"]["traced_bytes"] = current
+        report["process"]["traced_peak_bytes"] = peak
+    return jsonify(report)
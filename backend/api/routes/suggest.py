@@ -0,0 +1,44 @@
+"""Typeahead suggestion API route."""
+
+from flask import Blueprint, request, abort
+from api.services.exam_service import get_exam_service
+from api.validators import validate_search_query
+
+suggest_bp = Blueprint("suggest", __name__)
+
+# Initialize service
+_exam_service = get_exam_service()
+
+# Default and maximum number of suggestions returned.
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+
+@suggest_bp.route("/suggest", methods=["GET"])
+def get_suggestions():
+    """Get typeahead completions for a search prefix.
+    
+    Query Parameters:
+        q: Prefix of a subject code, "SUBJECT COURSE" pair, CRN or course name
+        limit: Maximum suggestions (default: 8, max: 20)
+        
+    Returns:
+        JSON response with a list of suggestions, each with 'value', 'type'
+        and 'count' keys.
+    """
+    prefix = request.args.get("q", "").strip()
+    
+    if prefix:
+        error = validate_search_query(prefix)
+        if error:
+            abort(400, description=error)
+    
+    try:
+        limit = int(request.args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        abort(400, description="Limit must be an integer.")
+    
+    if limit < 1:
+        abort(400, description="Limit must be a positive integer.")
+    
+    return {"data": _exam_service.suggest(prefix, limit=min(limit, MAX_LIMIT))}
@@ -0,0 +1,84 @@
+"""Bitmaps over exam ordinals, represented as Python integers.
+
+Bit ``i`` of a bitmap is set when the exam with ordinal ``i`` matches. Python
+ints give arbitrary-width AND/OR and a C-level popcount (``int.bit_count``),
+so combining any number of predicates never allocates per-exam objects.
+"""
+
+import sys
+from array import array
+from typing import Iterable
+
+WORD_BITS = 64
+
+
+def full(size: int) -> int:
+    """Return a bitmap with the first ``size`` bits set."""
+    return (1 << size) - 1
+
+
+def from_ordinals(ordinals: Iterable[int], size: int) -> int:
+    """Build a bitmap from ordinals.
+
+    Args:
+        ordinals: Ordinals to set, in any order.
+        size: Number of exams in the snapshot.
+
+    Returns:
+        Bitmap with a bit set for each ordinal.
+    """
+    if isinstance(ordinals, range) and ordinals == range(size):
+        return full(size)
+
+    buffer = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def select(bitmap: int, start: int = 0, count: int | None = None) -> list[int]:
+    """Return set ordinals in ascending order, skipping and limiting them.
+
+    Whole 64-bit words are skipped using their popcount, so reaching a deep
+    page costs one pass over the words rather than one step per match.
+
+    Args:
+        bitmap: Bitmap to read.
+        start: Number of set bits to skip.
+        count: Maximum number of ordinals to return; None for all.
+
+    Returns:
+        Ordinals of the selected set bits.
+    """
+    if bitmap <= 0 or count == 0:
+        return []
+
+    word_count = (bitmap.bit_length() + WORD_BITS - 1) // WORD_BITS
+    words = array("Q")
+    words.frombytes(bitmap.to_bytes(word_count * 8, "little"))
+    if sys.byteorder == "big":
+        words.byteswap()
+
+    selected: list[int] = []
+    skipped = 0
+    for word_index, word in enumerate(words):
+        if not word:
+            continue
+        if skipped < start:
+            bits = word.bit_count()
+            if skipped + bits <= start:
+                skipped += bits
+                continue
+
+        base = word_index * WORD_BITS
+        while word:
+            lowest = word & -word
+            if skipped < start:
+                skipped += 1
+            else:
+                selected.append(base + lowest.bit_length() - 1)
+                if count is not None and len(selected) >= count:
+                    return selected
+            word ^= lowest
+
+    return selected
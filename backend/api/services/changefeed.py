@@ -0,0 +1,125 @@
+"""Delta feed over the scraper's versioned snapshot history."""
+
+import json
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from scraper.config import HISTORY_DIR
+from scraper.fields import public_record
+from scraper.history import MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeed:
+    """Answers "what changed since version N" from recorded deltas.
+
+    The history is written by the scraper (see scraper.history): a manifest
+    naming the current version and the versions whose deltas are kept, and
+    one immutable delta file per version. Deltas are cached once read.
+    """
+
+    def __init__(self, history_dir: str | Path):
+        """Initialize the feed.
+
+        Args:
+            history_dir: Directory holding the manifest and delta files.
+        """
+        self._history_dir = Path(history_dir)
+        self._lock = threading.Lock()
+        self._manifest_stat: tuple[int, int] | None = None
+        self._manifest: dict = {"version": 0, "deltas": []}
+        self._deltas: dict[int, dict] = {}
+
+    def _load_manifest(self) -> dict:
+        """Return the manifest, re-reading it only when the file changed."""
+        path = self._history_dir / MANIFEST_FILE
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return {"version": 0, "deltas": []}
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key != self._manifest_stat:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+                self._manifest_stat = key
+                kept = set(self._manifest["deltas"])
+                self._deltas = {v: d for v, d in self._deltas.items() if v in kept}
+            return self._manifest
+
+    def _load_delta(self, version: int) -> dict:
+        delta = self._deltas.get(version)
+        if delta is None:
+            path = self._history_dir / f"{version}.delta.json"
+            with open(path, "r", encoding="utf-8") as f:
+                delta = json.load(f)
+            self._deltas[version] = delta
+        return delta
+
+    def current_version(self) -> int:
+        """Return the version of the latest recorded snapshot (0 if none)."""
+        return self._load_manifest()["version"]
+
+    def changes_since(self, since: int) -> dict:
+        """Merge every delta after a version into one delta.
+
+        A record added and then removed in between is omitted; a record
+        removed and then re-added is reported as changed.
+
+        Args:
+            since: Version the client already has.
+
+        Returns:
+            Dictionary with the current 'version' and 'resync'. When resync
+            is False it also has 'added' and 'changed' (full records) and
+            'removed' (event ids). Resync is True when the version is
+            unknown or older than the oldest kept delta, in which case the
+            client must download the full snapshot.
+        """
+        manifest = self._load_manifest()
+        version = manifest["version"]
+        needed = range(since + 1, version + 1)
+
+        if since > version or not set(needed) <= set(manifest["deltas"]):
+            return {"version": version, "since": since, "resync": True}
+
+        merged: dict[str, tuple[str, dict | None]] = {}
+        try:
+            for delta in (self._load_delta(v) for v in needed):
+                for key, exam in delta["added"].items():
+                    previous = merged.get(key)
+                    merged[key] = ("changed" if previous and previous[0] == "removed" else "added", exam)
+                for key, exam in delta["changed"].items():
+                    previous = merged.get(key)
+                    merged[key] = ("added" if previous and previous[0] == "added" else "changed", exam)
+                for key in delta["removed"]:
+                    previous = merged.get(key)
+                    if previous and previous[0] == "added":
+                        del merged[key]
+                    else:
+                        merged[key] = ("removed", None)
+        except FileNotFoundError:
+            # Pruned between reading the manifest and the delta.
+            logger.info(f"Delta history after version {since} was pruned; requesting resync")
+            return {"version": version, "since": since, "resync": True}
+
+        return {
+            "version": version,
+            "since": since,
+            "resync": False,
+            # Deltas recorded before history stored public records may still
+            # carry derived fields.
+            "added": [public_record(exam) for kind, exam in merged.values() if kind == "added"],
+            "changed": [public_record(exam) for kind, exam in merged.values() if kind == "changed"],
+            "removed": [key for key, (kind, _) in merged.items() if kind == "removed"],
+        }
+
+
+@lru_cache(maxsize=None)
+def get_change_feed() -> ChangeFeed:
+    """Get the process-wide change feed over the scraper's HISTORY_DIR."""
+    return ChangeFeed(Path(__file__).parent.parent.parent / HISTORY_DIR)
@@ -0,0 +1,727 @@
+"""Per-snapshot search and filter index over exam records."""
+
+import base64
+import json
+import logging
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Sequence
+
+from api.services import bitmap
+from scraper.fields import (
+    FIELD_SEPARATOR,
+    building_of,
+    derived_fields,
+    extract_date,
+    fold,
+    public_record,
+    search_key,
+    start_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+# Substring queries shorter than this are answered by a linear scan.
+NGRAM_SIZE = 3
+
+# Bumped whenever the index artifact layout or its contents change.
+INDEX_ARTIFACT_VERSION = 3
+
+# Fields that /api/exams can return match counts for.
+FACET_FIELDS = ("date", "building")
+
+# Relevance tiers of a free-text match, best first. Matches in the same tier
+# keep snapshot order.
+RANK_EXACT_CRN = 0
+RANK_EXACT_COURSE = 1
+RANK_PREFIX = 2
+RANK_SUBSTRING = 3
+
+# A query that names a course: "cs 010a" or "cs010a".
+_COURSE_CODE = re.compile(r"([a-z]+) ?(\d+[a-z]*)")
+
+# Named time_of_day windows, as [start, end) minutes after midnight.
+TIME_OF_DAY_WINDOWS = {
+    "morning": (0, 12 * 60),
+    "afternoon": (12 * 60, 17 * 60),
+    "evening": (17 * 60, 24 * 60),
+}
+
+MINUTES_PER_DAY = 24 * 60
+
+# Substring predicates check remaining candidates one by one when fewer than
+# this fraction of exams is still selected, instead of scanning every exam.
+CANDIDATE_SCAN_RATIO = 0.25
+
+
+def time_window(time_of_day: str) -> tuple[int, int] | None:
+    """Parse a time_of_day filter into [start, end) minutes after midnight.
+
+    Accepts a name from TIME_OF_DAY_WINDOWS, an exact start time ("08:00"),
+    or a range of start times ("08:00-11:30", end excluded).
+
+    Returns:
+        The window, or None if the value cannot be parsed.
+    """
+    value = time_of_day.strip().lower()
+    if value in TIME_OF_DAY_WINDOWS:
+        return TIME_OF_DAY_WINDOWS[value]
+
+    def minutes(text: str) -> int | None:
+        try:
+            parsed = datetime.strptime(text.strip(), "%H:%M")
+        except ValueError:
+            return None
+        return parsed.hour * 60 + parsed.minute
+
+    if "-" in value:
+        start_text, end_text = value.split("-", 1)
+        start, end = minutes(start_text), minutes(end_text)
+        if start is None or end is None or end <= start:
+            return None
+        return start, end
+
+    start = minutes(value)
+    return None if start is None else (start, start + 1)
+
+
+def rank_query(query: str) -> tuple[str, tuple[str, str] | None]:
+    """Normalize a query for ranking.
+
+    Returns:
+        The folded query with runs of whitespace collapsed, and the
+        (subject, course number) it names, if it looks like a course code.
+    """
+    folded = " ".join(fold(query).split())
+    course = _COURSE_CODE.fullmatch(folded)
+    return folded, course.groups() if course else None
+
+
+def relevance(query: str, key: str, course_number: str | None = None) -> int:
+    """Rank a search key that matched a query.
+
+    Args:
+        query: Query normalized by rank_query.
+        key: The exam's search key (course number, course name and CRN).
+        course_number: Course number the query names, when the exam's
+            subject is the one the query names.
+
+    Returns:
+        One of the RANK_* tiers.
+    """
+    if key.endswith(FIELD_SEPARATOR + query):
+        return RANK_EXACT_CRN
+    if course_number is not None and key.startswith(course_number + FIELD_SEPARATOR):
+        return RANK_EXACT_COURSE
+    if key.startswith(query) or FIELD_SEPARATOR + query in key or " " + query in key:
+        return RANK_PREFIX
+    return RANK_SUBSTRING
+
+
+def ngrams(text: str) -> set[str]:
+    """Return the distinct character n-grams of a string."""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class BaseExamIndex:
+    """Search and filter operations shared by every index implementation.
+
+    Subclasses provide the snapshot's records, date postings and facets,
+    and implement the query, location and column primitives. Exams are
+    referred to by their ordinal position in the snapshot.
+
+    Every predicate is evaluated to a bitmap over ordinals (see
+    api.services.bitmap) and predicates are combined with AND, so adding
+    filters costs a few big-integer operations rather than a pass over a
+    list of exams. Bitmaps for dates and exact-value fields are built once
+    per snapshot and cached on the index.
+
+    Start times are kept twice in sorted order, as seconds since the epoch
+    and as minutes after midnight, each with the ordinals in that order.
+    Time-window filters bisect them instead of parsing every start_time.
+    """
+
+    exams: Sequence[dict]
+    date_postings: Mapping[str, Sequence[int]]
+    available_dates: list[str]
+    available_locations: list[dict]
+    start_keys: Sequence[int]
+    start_order: Sequence[int]
+    minute_keys: Sequence[int]
+    minute_order: Sequence[int]
+
+    def __init__(self) -> None:
+        self._bitmaps: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.exams)
+
+    def structures(self) -> dict[str, object]:
+        """Return the index's data by name, for memory accounting.
+
+        The records come first, then each index attribute, then the
+        bitmap cache.
+        """
+        structures: dict[str, object] = {"records": self.exams}
+        for name, value in vars(self).items():
+            if name not in ("exams", "_bitmaps"):
+                structures[f"index.{name.lstrip('_')}"] = value
+        structures["cache.bitmaps"] = self._bitmaps
+        return structures
+
+    def match_query(self, query: str) -> Sequence[int]:
+        """Return ordinals whose search key contains the query, in order."""
+        raise NotImplementedError
+
+    def match_location(
+        self,
+        location: str,
+        candidates: Iterable[int] | None = None,
+    ) -> Sequence[int]:
+        """Return ordinals whose location contains the given text, in order.
+
+        Args:
+            location: Case-insensitive location substring.
+            candidates: If given, only these ordinals are checked.
+        """
+        raise NotImplementedError
+
+    def column(self, field: str) -> Sequence:
+        """Return one field of every exam, in snapshot order."""
+        raise NotImplementedError
+
+    def search_key_at(self, ordinal: int) -> str:
+        """Return the search key of one exam."""
+        return search_key(self.exams[ordinal])
+
+    def date_bitmap(self, date: str) -> int:
+        """Return the bitmap of exams on a date (ISO format: YYYY-MM-DD)."""
+        postings = self.date_postings.get(date)
+        if postings is None:
+            return 0
+
+        key = ("date", date)
+        cached = self._bitmaps.get(key)
+        if cached is None:
+            cached = self._bitmaps[key] = bitmap.from_ordinals(postings, len(self))
+        return cached
+
+    def value_bitmaps(self, field: str) -> dict[str, int]:
+        """Return bitmaps of exams grouped by the lowercased value of a field.
+
+        Args:
+            field: Exam field, or "building" for the first word of the location.
+        """
+        cached = self._bitmaps.get(field)
+        if cached is None:
+            if field == "building":
+                values = (building_of(location) for location in self.column("location"))
+            else:
+                values = self.column(field)
+
+            groups: dict[str, list[int]] = {}
+            for ordinal, value in enumerate(values):
+                if isinstance(value, str) and value:
+                    groups.setdefault(value.lower(), []).append(ordinal)
+
+            size = len(self)
+            cached = {value: bitmap.from_ordinals(ordinals, size) for value, ordinals in groups.items()}
+            self._bitmaps[field] = cached
+        return cached
+
+    def value_bitmap(self, field: str, value: str) -> int:
+        """Return the bitmap of exams whose field equals a value, ignoring case."""
+        return self.value_bitmaps(field).get(value.strip().lower(), 0)
+
+    def course_bitmap(self, subject: str, course_number: str) -> int:
+        """Return the bitmap of exams of one course, as named by rank_query.
+
+        Lets "cs010a" find CS 010A although the subject is not part of the
+        search key.
+        """
+        prefix = course_number + FIELD_SEPARATOR
+        ordinals = bitmap.select(self.value_bitmap("subject", subject))
+        return bitmap.from_ordinals(
+            (ordinal for ordinal in ordinals if self.search_key_at(ordinal).startswith(prefix)),
+            len(self),
+        )
+    
+    def _range_bitmap(
+        self,
+        keys: Sequence[int],
+        order: Sequence[int],
+        low: int | None,
+        high: int | None,
+    ) -> int:
+        """Return the bitmap of ordinals whose sorted key is in [low, high)."""
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_left(keys, high)
+        if start >= end:
+            return 0
+        return bitmap.from_ordinals(order[start:end], len(self))
+
+    def start_range_bitmap(self, start_after: str | None = None, start_before: str | None = None) -> int:
+        """Return the bitmap of exams starting in [start_after, start_before).
+
+        Args:
+            start_after: ISO date or datetime; exams starting at or after it.
+            start_before: ISO date or datetime; exams starting before it.
+        """
+        low = start_seconds(start_after) if start_after else None
+        high = start_seconds(start_before) if start_before else None
+        return self._range_bitmap(self.start_keys, self.start_order, low, high)
+
+    def time_of_day_bitmap(self, time_of_day: str) -> int:
+        """Return the bitmap of exams starting within a time-of-day window.
+
+        Args:
+            time_of_day: Window accepted by time_window.
+        """
+        window = time_window(time_of_day)
+        if window is None:
+            return 0
+        return self._range_bitmap(self.minute_keys, self.minute_order, *window)
+
+    def filter_bitmap(
+        self,
+        query: str | None = None,
+        date: str | None = None,
+        location: str | None = None,
+        subject: str | None = None,
+        building: str | None = None,
+        start_after: str | None = None,
+        start_before: str | None = None,
+        time_of_day: str | None = None,
+    ) -> int:
+        """Return the bitmap of exams matching every given filter.
+
+        Args:
+            query: Search query for course_number, course_name, or crn. A
+                   course code ("CS 010A", "cs010a") also matches that
+                   course by subject and number.
+            date: Exam date (ISO format: YYYY-MM-DD).
+            location: Case-insensitive substring of the location.
+            subject: Exact subject code, ignoring case.
+            building: Exact building code, ignoring case.
+            start_after: Exams starting at or after this ISO date or datetime.
+            start_before: Exams starting before this ISO date or datetime.
+            time_of_day: Start-time window accepted by time_window.
+
+        Returns:
+            Bitmap of matching ordinals.
+        """
+        size = len(self)
+        selected = bitmap.full(size)
+
+        # Cached exact-match bitmaps first; they are the cheapest to apply.
+        if date:
+            selected &= self.date_bitmap(date)
+        if subject:
+            selected &= self.value_bitmap("subject", subject)
+        if building:
+            selected &= self.value_bitmap("building", building)
+
+        # Sorted start times: two bisections plus the matching ordinals.
+        if (start_after or start_before) and selected:
+            selected &= self.start_range_bitmap(start_after, start_before)
+        if time_of_day and selected:
+            selected &= self.time_of_day_bitmap(time_of_day)
+
+        if query and selected:
+            matched = bitmap.from_ordinals(self.match_query(query), size)
+            course = rank_query(query)[1]
+            if course:
+                matched |= self.course_bitmap(*course)
+            selected &= matched
+
+        if location and selected:
+            if selected.bit_count() < size * CANDIDATE_SCAN_RATIO:
+                matched = self.match_location(location, candidates=bitmap.select(selected))
+            else:
+                matched = self.match_location(location)
+            selected &= bitmap.from_ordinals(matched, size)
+
+        return selected
+
+    def filter(
+        self,
+        query: str | None = None,
+        date: str | None = None,
+        location: str | None = None,
+        subject: str | None = None,
+        building: str | None = None,
+        start_after: str | None = None,
+        start_before: str | None = None,
+        time_of_day: str | None = None,
+    ) -> list[int]:
+        """Return ordinals of exams matching every given filter, in order.
+
+        Takes the same arguments as filter_bitmap.
+        """
+        return bitmap.select(self.filter_bitmap(
+            query, date, location, subject, building, start_after, start_before, time_of_day
+        ))
+
+    def facet_counts(self, field: str, selected: int) -> dict[str, int]:
+        """Count selected exams per facet value, one bitmap AND per value.
+
+        Args:
+            field: One of FACET_FIELDS.
+            selected: Bitmap of exams to count.
+
+        Returns:
+            Mapping of facet value to count, in facet order, without
+            values that have no selected exams.
+        """
+        if field == "date":
+            values = [(date, self.date_bitmap(date)) for date in self.available_dates]
+        elif field == "building":
+            values = [
+                (entry["building"], self.value_bitmap("building", entry["building"]))
+                for entry in self.available_locations
+            ]
+        else:
+            raise ValueError(f"Unknown facet: {field!r}")
+
+        counts = {}
+        for value, value_bitmap in values:
+            count = (selected & value_bitmap).bit_count()
+            if count:
+                counts[value] = count
+        return counts
+
+    def match(self, **filters):
+        """Evaluate filters into a match set for count, page and facet_counts.
+
+        In-memory indexes return the filter bitmap. Indexes backed by a
+        database may return a deferred query instead, so that counting and
+        paging are pushed down to the database.
+
+        Args:
+            **filters: Keyword arguments accepted by filter_bitmap.
+        """
+        return self.filter_bitmap(**filters)
+
+    def count(self, matched) -> int:
+        """Return the number of exams in a match set."""
+        return matched.bit_count()
+
+    def page(self, matched, start: int, count: int) -> list[dict]:
+        """Return a page of exams from a match set, in snapshot order.
+
+        Exams are returned as clients see them, without derived fields.
+
+        Args:
+            matched: Match set returned by match.
+            start: Number of matches to skip.
+            count: Maximum number of exams to return.
+        """
+        return [public_record(self.exams[i]) for i in bitmap.select(matched, start, count)]
+
+    def ranked_page(self, matched, query: str, start: int, count: int) -> list[dict]:
+        """Return a page of a query's matches, most relevant first.
+
+        Exact CRN matches come first, then exact course codes ("CS 010A"),
+        then matches where a field or word starts with the query, then
+        other substring matches; ties keep snapshot order (see relevance).
+        The exact tiers are built first as bitmaps: CRNs from the n-gram
+        postings of separator + query (or the matches themselves when they
+        are few), courses from the matches in the subject's bitmap. The
+        remaining matches are only split into prefix and substring tiers
+        when the page reaches past the exact ones. Pages are cut from the
+        tiers by popcount, so only the returned records are selected and
+        loaded. As with page, derived fields are left out.
+
+        Args:
+            matched: Match set returned by match.
+            query: The free-text query the matches were found with.
+            start: Number of ranked matches to skip.
+            count: Maximum number of exams to return.
+        """
+        folded, course = rank_query(query)
+        size = len(self)
+        suffix = FIELD_SEPARATOR + folded
+
+        if matched.bit_count() < size * CANDIDATE_SCAN_RATIO:
+            crn_candidates = bitmap.select(matched)
+        else:
+            crn_candidates = bitmap.select(matched & bitmap.from_ordinals(self.match_query(suffix), size))
+        exact_crn = bitmap.from_ordinals(
+            (i for i in crn_candidates if self.search_key_at(i).endswith(suffix)), size
+        )
+        exact_course = 0
+        if course:
+            subject, course_number = course
+            number_prefix = course_number + FIELD_SEPARATOR
+            exact_course = bitmap.from_ordinals(
+                (
+                    i for i in bitmap.select(matched & self.value_bitmap("subject", subject) & ~exact_crn)
+                    if self.search_key_at(i).startswith(number_prefix)
+                ),
+                size,
+            )
+
+        def tiers() -> Iterator[int]:
+            yield exact_crn
+            yield exact_course
+            # Only ranked further when the page reaches past the exact tiers.
+            rest = matched & ~exact_crn & ~exact_course
+            word = " " + folded
+            prefix = bitmap.from_ordinals(
+                (
+                    i for i in bitmap.select(rest)
+                    if (key := self.search_key_at(i)).startswith(folded) or suffix in key or word in key
+                ),
+                size,
+            )
+            yield prefix
+            yield rest & ~prefix
+
+        ordinals: list[int] = []
+        for tier in tiers():
+            tier_size = tier.bit_count()
+            if start >= tier_size:
+                start -= tier_size
+                continue
+            ordinals += bitmap.select(tier, start, count - len(ordinals))
+            start = 0
+            if len(ordinals) >= count:
+                break
+        return [public_record(self.exams[ordinal]) for ordinal in ordinals]
+
+
+class ExamIndex(BaseExamIndex):
+    """In-memory index built from a list of exam records.
+
+    Built once per snapshot so that request handling never re-parses dates
+    or re-folds fields. Records carrying the scraper's derived fields are
+    indexed without parsing them again.
+    """
+
+    def __init__(self, exams: Sequence[dict], artifact: dict | None = None):
+        """Build the index, or restore it from a prebuilt artifact.
+
+        Args:
+            exams: Exam records in snapshot order.
+            artifact: Decoded index artifact for these exams, as written by
+                     write_index_artifact. Skips rebuilding when given.
+        """
+        super().__init__()
+        self.exams = exams
+        if artifact is not None:
+            self._restore(artifact)
+            return
+
+        self.search_keys: list[str] = []
+        self.location_keys: list[str] = []
+        self.date_postings: dict[str, array] = {}
+        self.ngram_postings: dict[str, array] = {}
+
+        building_rooms: dict[str, set[str]] = {}
+        starts: list[tuple[int, int]] = []
+
+        for ordinal, exam in enumerate(exams):
+            derived = derived_fields(exam)
+            key = derived["search_key"]
+            self.search_keys.append(key)
+            for gram in ngrams(key):
+                self.ngram_postings.setdefault(gram, array("I")).append(ordinal)
+
+            self.location_keys.append(derived["location_key"])
+
+            date = derived["date_iso"]
+            if date:
+                self.date_postings.setdefault(date, array("I")).append(ordinal)
+
+            seconds = derived["start_epoch"]
+            if seconds is not None:
+                starts.append((seconds, ordinal))
+
+            location = exam.get("location", "").strip()
+            if location:
+                building_rooms.setdefault(derived["building"], set()).add(location)
+
+        starts.sort()
+        self.start_keys = array("q", [seconds for seconds, _ in starts])
+        self.start_order = array("I", [ordinal for _, ordinal in starts])
+
+        minutes = sorted((seconds // 60 % MINUTES_PER_DAY, ordinal) for seconds, ordinal in starts)
+        self.minute_keys = array("H", [minute for minute, _ in minutes])
+        self.minute_order = array("I", [ordinal for _, ordinal in minutes])
+
+        self.available_dates = sorted(self.date_postings)
+        self.available_locations = [
+            {"building": building, "rooms": sorted(rooms)}
+            for building, rooms in sorted(building_rooms.items())
+        ]
+
+    def match_query(self, query: str) -> Sequence[int]:
+        """Return ordinals whose search key contains the query.
+
+        Queries of at least NGRAM_SIZE characters are narrowed to the
+        intersection of their n-gram postings before being verified.
+        """
+        query_lower = fold(query)
+        keys = self.search_keys
+
+        if len(query_lower) < NGRAM_SIZE:
+            return [i for i, key in enumerate(keys) if query_lower in key]
+
+        postings = []
+        for gram in ngrams(query_lower):
+            posting = self.ngram_postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = postings[0]
+        for posting in postings[1:]:
+            allowed = set(posting)
+            candidates = [i for i in candidates if i in allowed]
+            if not candidates:
+                return []
+
+        return [i for i in candidates if query_lower in keys[i]]
+
+    def match_location(
+        self,
+        location: str,
+        candidates: Iterable[int] | None = None,
+    ) -> Sequence[int]:
+        location_lower = fold(location)
+        keys = self.location_keys
+        if candidates is None:
+            candidates = range(len(keys))
+        return [i for i in candidates if location_lower in keys[i]]
+
+    def column(self, field: str) -> Sequence:
+        return [exam.get(field, "") for exam in self.exams]
+
+    def search_key_at(self, ordinal: int) -> str:
+        return self.search_keys[ordinal]
+
+    def _restore(self, artifact: dict) -> None:
+        def decode(value: str, typecode: str = "I") -> array:
+            decoded = array(typecode)
+            decoded.frombytes(base64.b64decode(value))
+            return decoded
+
+        def postings(encoded: dict[str, str]) -> dict[str, array]:
+            return {key: decode(value) for key, value in encoded.items()}
+
+        self.search_keys = artifact["search_keys"]
+        self.location_keys = artifact["location_keys"]
+        self.date_postings = postings(artifact["date_postings"])
+        self.ngram_postings = postings(artifact["ngram_postings"])
+        self.start_keys = decode(artifact["start_keys"], "q")
+        self.start_order = decode(artifact["start_order"])
+        self.minute_keys = decode(artifact["minute_keys"], "H")
+        self.minute_order = decode(artifact["minute_order"])
+        self.available_dates = artifact["available_dates"]
+        self.available_locations = artifact["available_locations"]
+
+    def to_artifact(self, snapshot_sha256: str) -> dict:
+        """Serialize the index for storage next to its snapshot.
+
+        Args:
+            snapshot_sha256: Checksum of the snapshot file the index was built from.
+
+        Returns:
+            JSON-serializable artifact.
+        """
+        def encode(values: array) -> str:
+            return base64.b64encode(values.tobytes()).decode("ascii")
+
+        def postings(source: Mapping[str, array]) -> dict[str, str]:
+            return {key: encode(posting) for key, posting in source.items()}
+
+        return {
+            "version": INDEX_ARTIFACT_VERSION,
+            "snapshot_sha256": snapshot_sha256,
+            "count": len(self.exams),
+            "byteorder": sys.byteorder,
+            "search_keys": self.search_keys,
+            "location_keys": self.location_keys,
+            "date_postings": postings(self.date_postings),
+            "ngram_postings": postings(self.ngram_postings),
+            "start_keys": encode(self.start_keys),
+            "start_order": encode(self.start_order),
+            "minute_keys": encode(self.minute_keys),
+            "minute_order": encode(self.minute_order),
+            "available_dates": self.available_dates,
+            "available_locations": self.available_locations,
+        }
+
+
+def index_artifact_path(snapshot_path: str | Path) -> Path:
+    """Return where the index artifact for a snapshot is stored.
+
+    Example: data/exams.json -> data/exams.index.json
+    """
+    snapshot_path = Path(snapshot_path)
+    return snapshot_path.with_name(f"{snapshot_path.stem}.index.json")
+
+
+def write_index_artifact(exams: Sequence[dict], snapshot_path: str | Path, snapshot_sha256: str) -> Path:
+    """Build an index for a snapshot and write it alongside the snapshot.
+
+    Args:
+        exams: Exam records exactly as saved in the snapshot.
+        snapshot_path: Path of the snapshot file.
+        snapshot_sha256: Checksum of the snapshot file's bytes.
+
+    Returns:
+        Path of the written artifact.
+    """
+    path = index_artifact_path(snapshot_path)
+    artifact = ExamIndex(exams).to_artifact(snapshot_sha256)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(artifact, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_index_artifact(
+    exams: Sequence[dict],
+    snapshot_path: str | Path,
+    snapshot_sha256: str,
+) -> ExamIndex | None:
+    """Load the prebuilt index for a snapshot if it is present and current.
+
+    Args:
+        exams: Exam records loaded from the snapshot.
+        snapshot_path: Path of the snapshot file.
+        snapshot_sha256: Checksum of the loaded snapshot's bytes.
+
+    Returns:
+        The restored index, or None if the artifact is missing, from another
+        format version, or built from a different snapshot.
+    """
+    path = index_artifact_path(snapshot_path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            artifact = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable index artifact {path}: {e}")
+        return None
+
+    if (
+        artifact.get("version") != INDEX_ARTIFACT_VERSION
+        or artifact.get("snapshot_sha256") != snapshot_sha256
+        or artifact.get("count") != len(exams)
+        or artifact.get("byteorder") != sys.byteorder
+    ):
+        logger.info(f"Index artifact {path} is stale; rebuilding index")
+        return None
+
+    return ExamIndex(exams, artifact=artifact)
@@ -1,8 +1,17 @@
 """Exam service for search and filter operations."""
 
-from datetime import datetime
+import logging
 from functools import lru_cache
+from typing import Callable, Sequence
+from api.metrics import phase
+from api.repositories import create_repository
 from api.repositories.exam_repository import ExamRepository
+from api.services.exam_index import BaseExamIndex, ExamIndex, extract_date
+from api.services.memory import structure_sizes
+from api.services.singleflight import SingleFlight
+from api.services.suggest import SuggestIndex
+
+logger = logging.getLogger(__name__)
 
 
 class ExamService:
@@ -16,6 +25,12 @@ class ExamService:
                        a default repository will be created.
         """
         self._repository = repository or ExamRepository()
+        self._index: BaseExamIndex | None = None
+        self._suggest: tuple[BaseExamIndex, SuggestIndex] | None = None
+        self._reload_listeners: list[Callable[[], None]] = []
+        # Identical searches, index builds and reloads running at the same
+        # time are computed once and shared.
+        self._flights = SingleFlight()
     
     def search_exams(
         self,
@@ -23,7 +38,13 @@ class ExamService:
         date: str | None = None,
         location: str | None = None,
         page: int = 1,
-        limit: int = 20
+        limit: int = 20,
+        subject: str | None = None,
+        building: str | None = None,
+        facets: Sequence[str] = (),
+        start_after: str | None = None,
+        start_before: str | None = None,
+        time_of_day: str | None = None
     ) -> dict:
         """Search and filter exams with pagination.
         
@@ -33,45 +54,63 @@ class ExamService:
             location: Filter by location (case-insensitive).
             page: Page number (1-indexed).
             limit: Number of items per page.
+            subject: Filter by exact subject code (case-insensitive).
+            building: Filter by exact building code (case-insensitive).
+            facets: Facet fields ("date", "building") to count matches for.
+            start_after: Only exams starting at or after this ISO date or datetime.
+            start_before: Only exams starting before this ISO date or datetime.
+            time_of_day: Start-time window: "morning", "afternoon", "evening",
+                         an exact time ("08:00") or a range ("08:00-12:00").
             
         Returns:
-            Dictionary with 'data' (list of exams) and 'pagination' metadata.
+            Dictionary with 'data' (list of exams) and 'pagination' metadata,
+            plus 'facets' counts when any facets were requested. With a
+            query, exams are ordered by relevance (see
+            BaseExamIndex.ranked_page); otherwise in snapshot order.
+            Concurrent identical searches share one result, so it must not
+            be mutated.
         """
-        exams = self._repository.get_all_exams()
+        index = self.get_index()
+        
+        filters = {
+            "query": query,
+            "date": date,
+            "location": location,
+            "subject": subject,
+            "building": building,
+            "start_after": start_after,
+            "start_before": start_before,
+            "time_of_day": time_of_day
+        }
+        facets = tuple(facets)
+        
+        key = ("search", id(index), tuple(filters.values()), page, limit, facets)
+        return self._flights.do(key, lambda: self._search(index, filters, page, limit, facets))
+    
+    def _search(
+        self,
+        index: BaseExamIndex,
+        filters: dict,
+        page: int,
+        limit: int,
+        facets: Sequence[str]
+    ) -> dict:
+        """Run one search against an index; see search_exams."""
+        with phase("filter"):
+            matched = index.match(**filters)
         
-        # Apply search filter
-        if query:
-            query_lower = query.lower()
-            exams = [
-                exam for exam in exams
-                if query_lower in exam.get("course_number", "").lower()
-                or query_lower in exam.get("course_name", "").lower()
-                or query_lower in exam.get("crn", "").lower()
-            ]
-        
-        # Apply date filter
-        if date:
-            exams = [
-                exam for exam in exams
-                if self._extract_date(exam.get("start_time", "")) == date
-            ]
-        
-        # Apply location filter
-        if location:
-            location_lower = location.lower()
-            exams = [
-                exam for exam in exams
-                if location_lower in exam.get("location", "").lower()
-            ]
-        
-        # Calculate pagination
-        total = len(exams)
-        start_index = (page - 1) * limit
-        end_index = start_index + limit
-        paginated_exams = exams[start_index:end_index]
-        has_more = end_index < total
-        
-        return {
+        with phase("paginate"):
+            # Calculate pagination
+            total = index.count(matched)
+            start_index = (page - 1) * limit
+            end_index = start_index + limit
+            if filters["query"]:
+                paginated_exams = index.ranked_page(matched, filters["query"], start_index, limit)
+            else:
+                paginated_exams = index.page(matched, start_index, limit)
+            has_more = end_index < total
+        
+        result = {
             "data": paginated_exams,
             "pagination": {
                 "page": page,
@@ -80,6 +119,36 @@ class ExamService:
                 "hasMore": has_more
             }
         }
+        
+        if facets:
+            with phase("facets"):
+                result["facets"] = self._facet_counts(index, facets, matched, filters)
+        
+        return result
+    
+    @staticmethod
+    def _facet_counts(
+        index: BaseExamIndex,
+        facets: Sequence[str],
+        matched,
+        filters: dict
+    ) -> dict[str, dict[str, int]]:
+        """Count matches per facet value.
+        
+        Each facet ignores the filters on its own dimension, so selecting a
+        date tab still shows counts for the other dates. The location filter
+        counts as a building filter because the UI's building tabs send it.
+        """
+        counts = {}
+        for facet in facets:
+            if facet == "date" and filters["date"]:
+                selected = index.match(**{**filters, "date": None})
+            elif facet == "building" and (filters["location"] or filters["building"]):
+                selected = index.match(**{**filters, "location": None, "building": None})
+            else:
+                selected = matched
+            counts[facet] = index.facet_counts(facet, selected)
+        return counts
     
     def get_available_dates(self) -> list[str]:
         """Get unique exam dates sorted chronologically.
@@ -87,15 +156,7 @@ class ExamService:
         Returns:
             List of unique dates in ISO format (YYYY-MM-DD).
         """
-        exams = self._repository.get_all_exams()
-        dates = set()
-        
-        for exam in exams:
-            date = self._extract_date(exam.get("start_time", ""))
-            if date:
-                dates.add(date)
-        
-        return sorted(dates)
+        return self.get_index().available_dates
     
     def get_available_locations(self) -> list[dict]:
         """Get unique exam locations grouped by building.
@@ -104,27 +165,129 @@ class ExamService:
             List of dictionaries with 'building' and 'rooms' keys,
             sorted alphabetically by building.
         """
+        return self.get_index().available_locations
+    
+    def suggest(self, prefix: str, limit: int = 8) -> list[dict]:
+        """Get typeahead completions for a prefix.
+        
+        Args:
+            prefix: Case-insensitive prefix of a subject, course, CRN or name.
+            limit: Maximum number of suggestions.
+            
+        Returns:
+            List of dictionaries with 'value', 'type' and 'count' keys.
+        """
+        return self.get_suggest_index().suggest(prefix, limit=limit)
+    
+    def get_suggest_index(self) -> SuggestIndex:
+        """Get the suggestion index for the current snapshot, building it once.
+        
+        Returns:
+            Suggestion index over the current exams.
+        """
+        index = self.get_index()
+        cached = self._suggest
+        if cached is None or cached[0] is not index:
+            cached = self._flights.do(("suggest", id(index)), lambda: self._build_suggest(index))
+        return cached[1]
+    
+    def _build_suggest(self, index: BaseExamIndex) -> tuple[BaseExamIndex, SuggestIndex]:
+        """Build and cache the suggestion index for an index's exams."""
+        cached = self._suggest = (index, SuggestIndex(index.exams))
+        return cached
+    
+    def get_index(self) -> BaseExamIndex:
+        """Get the search index for the repository's current snapshot.
+        
+        The index is replaced whenever the repository returns a different
+        exam list (e.g. after its cache is cleared and the file re-read).
+        A prebuilt index from the repository is used when available.
+        
+        Returns:
+            Index over the current exams.
+        """
         exams = self._repository.get_all_exams()
-        building_rooms: dict[str, set[str]] = {}
-        
-        for exam in exams:
-            location = exam.get("location", "").strip()
-            if location:
-                # Extract building from location (first word)
-                parts = location.split()
-                building = parts[0] if parts else location
-                
-                if building not in building_rooms:
-                    building_rooms[building] = set()
-                building_rooms[building].add(location)
-        
-        # Convert to list format sorted by building
-        result = [
-            {"building": building, "rooms": sorted(rooms)}
-            for building, rooms in sorted(building_rooms.items())
-        ]
+        index = self._index
+        if index is None or index.exams is not exams:
+            index = self._flights.do(("index", id(exams)), lambda: self._build_index(exams))
+        return index
+    
+    def _build_index(self, exams: Sequence[dict]) -> BaseExamIndex:
+        """Load or build the index for a snapshot and make it current."""
+        # An index over an empty snapshot is falsy (len 0) but still valid.
+        index = self._repository.load_index()
+        if index is None:
+            index = ExamIndex(exams)
+        self._index = index
+        return index
+    
+    def warm(self) -> BaseExamIndex:
+        """Load the snapshot and build its indexes ahead of the first request.
         
-        return result
+        Returns:
+            The freshly built index.
+        """
+        index = self.get_index()
+        self.get_suggest_index()
+        return index
+    
+    def memory_report(self) -> dict:
+        """Measure the memory held for the current snapshot.
+    
+        Walks the records, each index structure, the bitmap cache and the
+        suggestion index (if built). Objects shared between structures are
+        charged to the first one listed.
+    
+        Returns:
+            Dictionary from structure_sizes.
+        """
+        index = self.get_index()
+        structures = index.structures()
+        cached = self._suggest
+        if cached is not None and cached[0] is index:
+            structures["suggest"] = cached[1]
+        return structure_sizes(structures, len(index))
+
+    def reload_if_changed(self) -> bool:
+        """Reload the snapshot and rebuild the index if the data file changed.
+        
+        Concurrent calls share a single check and reload.
+        
+        Returns:
+            True if a new snapshot was loaded.
+        """
+        return self._flights.do("reload", self._reload_if_changed)
+    
+    def _reload_if_changed(self) -> bool:
+        """Reload the snapshot if changed; see reload_if_changed."""
+        if not self._repository.snapshot_changed():
+            return False
+        self._repository.reload()
+        self.warm()
+        
+        for listener in list(self._reload_listeners):
+            try:
+                listener()
+            except Exception:
+                logger.exception("Snapshot reload listener failed")
+        return True
+    
+    def add_reload_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback to run after each snapshot reload.
+        
+        Args:
+            listener: Called with no arguments once the new snapshot is live.
+        """
+        self._reload_listeners.append(listener)
+    
+    def snapshot_id(self) -> str | None:
+        """Identify the snapshot currently being served.
+        
+        Returns:
+            Opaque identifier that changes on every reload, or None if the
+            repository was not loaded from a file.
+        """
+        return self._repository.snapshot_id()
     
     @staticmethod
     def _extract_date(datetime_str: str) -> str | None:
@@ -136,10 +299,14 @@ class ExamService:
         Returns:
             Date string in YYYY-MM-DD format, or None if invalid.
         """
-        if not datetime_str:
-            return None
-        try:
-            dt = datetime.fromisoformat(datetime_str)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+        return extract_date(datetime_str)
+
+
+@lru_cache(maxsize=None)
+def get_exam_service() -> ExamService:
+    """Get the process-wide exam service shared by all route blueprints.
+    
+    Returns:
+        The default ExamService, backed by the configured repository.
+    """
+    return ExamService(repository=create_repository())
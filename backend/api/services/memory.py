@@ -0,0 +1,73 @@
+"""Memory accounting for the in-memory structures behind the API."""
+
+import sys
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Mapping
+
+# Objects shared process-wide rather than owned by a snapshot.
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+def deep_sizeof(obj: object, seen: set[int] | None = None) -> int:
+    """Return the bytes used by an object and everything it references.
+
+    Containers, their items and instance ``__dict__``s are followed; classes,
+    modules and functions are not. Objects whose id is already in ``seen``
+    are skipped, so walking several structures with one set counts shared
+    objects (interned strings, records referenced from an index) only once,
+    under the first structure that reaches them.
+
+    Args:
+        obj: Root of the structure to measure.
+        seen: Ids of objects already counted; updated in place.
+
+    Returns:
+        Size in bytes as reported by sys.getsizeof. Buffers held outside
+        the Python heap (mmap, SQLite page cache) are not included.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED_TYPES):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+
+    return total
+
+
+def structure_sizes(structures: Mapping[str, object], count: int) -> dict:
+    """Measure named structures, counting objects they share once.
+
+    Args:
+        structures: Structures by name, in the order they are charged;
+            put the records first so that indexes are charged only for
+            what they add.
+        count: Number of exams, for the per-exam figures.
+
+    Returns:
+        Dictionary with the exam count, bytes per structure and the totals.
+    """
+    seen: set[int] = set()
+    sizes = {name: deep_sizeof(value, seen) for name, value in structures.items()}
+    total = sum(sizes.values())
+    return {
+        "exams": count,
+        "structures": {
+            name: {"bytes": size, "bytes_per_exam": round(size / count, 1) if count else 0.0}
+            for name, size in sizes.items()
+        },
+        "total_bytes": total,
+        "bytes_per_exam": round(total / count, 1) if count else 0.0,
+    }
@@ -0,0 +1,70 @@
+"""Coalescing of concurrent identical computations."""
+
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """One in-flight computation and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs a computation once for all callers that ask for it at the same time.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it runs wait and receive the leader's
+    result, or its exception. Nothing is cached: once the leader finishes,
+    the next call for the key runs the function again.
+
+    Waiters share the leader's result object, so callers must treat it as
+    read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies the computation; calls with equal keys coalesce.
+            fn: Computation to run if no call for key is in flight.
+
+        Returns:
+            The result of the single execution of fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
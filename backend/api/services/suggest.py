@@ -0,0 +1,92 @@
+"""Prefix-based typeahead suggestions over one snapshot of exams."""
+
+from bisect import bisect_left
+from typing import Iterable
+
+# Suggestion kinds, in the order they are preferred when ranking.
+KIND_RANK = {"subject": 0, "course": 1, "crn": 2, "course_name": 3}
+
+# Prefix matches examined before ranking; bounds work for very short prefixes.
+MAX_SCAN = 256
+
+
+class SuggestIndex:
+    """Sorted arrays of completion keys, one per kind, answered with bisect.
+    
+    Keys are lowercased subject codes, "SUBJECT COURSE" pairs, CRNs and
+    course names. Each kind has its own sorted array, so all keys of a kind
+    sharing a prefix are contiguous and a lookup is a binary search plus a
+    short forward scan. Kinds are searched in rank order, so a many-entry
+    kind (course names) cannot crowd a better one (subjects) out of the
+    scan window.
+    """
+    
+    def __init__(self, exams: Iterable[dict]):
+        """Build the index.
+        
+        Args:
+            exams: Exam records of one snapshot.
+        """
+        counts: dict[tuple[str, str], int] = {}
+        
+        for exam in exams:
+            subject = exam.get("subject", "").strip()
+            course_number = exam.get("course_number", "").strip()
+            candidates = [
+                ("subject", subject),
+                ("course", f"{subject} {course_number}" if subject and course_number else ""),
+                ("crn", exam.get("crn", "").strip()),
+                ("course_name", exam.get("course_name", "").strip()),
+            ]
+            for kind, value in candidates:
+                if value:
+                    counts[(kind, value)] = counts.get((kind, value), 0) + 1
+        
+        # kind -> (sorted lowercased keys, (value, count) at the same positions)
+        self._kinds: dict[str, tuple[list[str], list[tuple[str, int]]]] = {}
+        for kind in sorted(KIND_RANK, key=KIND_RANK.get):
+            entries = sorted(
+                (value.lower(), value, count)
+                for (entry_kind, value), count in counts.items()
+                if entry_kind == kind
+            )
+            self._kinds[kind] = (
+                [entry[0] for entry in entries],
+                [(entry[1], entry[2]) for entry in entries],
+            )
+    
+    def __len__(self) -> int:
+        return sum(len(keys) for keys, _ in self._kinds.values())
+    
+    def suggest(self, prefix: str, limit: int = 8) -> list[dict]:
+        """Return the top completions for a prefix.
+        
+        Args:
+            prefix: Case-insensitive prefix typed by the user.
+            limit: Maximum number of suggestions.
+            
+        Returns:
+            List of dictionaries with 'value', 'type' and 'count' keys,
+            ranked by kind, then by number of exams, then alphabetically.
+            Within a kind, only the first MAX_SCAN matches in alphabetical
+            order are ranked.
+        """
+        prefix_lower = prefix.strip().lower()
+        if not prefix_lower or limit <= 0:
+            return []
+        
+        suggestions = []
+        for kind, (keys, entries) in self._kinds.items():
+            start = bisect_left(keys, prefix_lower)
+            matches = []
+            for position in range(start, min(start + MAX_SCAN, len(keys))):
+                if not keys[position].startswith(prefix_lower):
+                    break
+                matches.append(entries[position])
+            
+            matches.sort(key=lambda entry: (-entry[1], entry[0]))
+            for value, count in matches[:limit - len(suggestions)]:
+                suggestions.append({"value": value, "type": kind, "count": count})
+            if len(suggestions) >= limit:
+                break
+        return suggestions
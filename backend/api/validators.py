@@ -3,6 +3,8 @@
 import re
 from datetime import datetime
 
+from api.services.exam_index import FACET_FIELDS, TIME_OF_DAY_WINDOWS, time_window
+
 
 def validate_search_query(query: str) -> str | None:
     """Validate search query parameter.
@@ -40,6 +42,38 @@ def validate_date_format(date_str: str) -> str | None:
         return "Invalid date format. Use YYYY-MM-DD."
 
 
+def validate_datetime(value: str) -> str | None:
+    """Validate an ISO date or datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM[:SS]).
+    
+    Args:
+        value: The date or datetime string to validate.
+        
+    Returns:
+        Error message if validation fails, None if valid.
+    """
+    try:
+        datetime.fromisoformat(value)
+        return None
+    except ValueError:
+        return "Invalid datetime format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM."
+
+
+def validate_time_of_day(value: str) -> str | None:
+    """Validate a time-of-day window.
+    
+    Args:
+        value: A named window, an exact time (HH:MM) or a range (HH:MM-HH:MM).
+        
+    Returns:
+        Error message if validation fails, None if valid.
+    """
+    if time_window(value) is None:
+        names = ", ".join(TIME_OF_DAY_WINDOWS)
+        return f"Invalid time of day. Use {names}, HH:MM or HH:MM-HH:MM."
+    
+    return None
+
+
 def validate_pagination(page: int, limit: int) -> str | None:
     """Validate pagination parameters.
     
@@ -57,3 +91,19 @@ def validate_pagination(page: int, limit: int) -> str | None:
         return "Limit must be a positive integer."
     
     return None
+
+
+def validate_facets(facets: list[str]) -> str | None:
+    """Validate requested facet names.
+    
+    Args:
+        facets: Facet names from the comma-separated facets parameter.
+        
+    Returns:
+        Error message if validation fails, None if valid.
+    """
+    for facet in facets:
+        if facet not in FACET_FIELDS:
+            return f"Unknown facet. Use one or more of: {', '.join(FACET_FIELDS)}."
+    
+    return None
@@ -0,0 +1 @@
+"""Reproducible benchmarks for the exam API and search hot paths."""
@@ -0,0 +1,147 @@
+"""CLI entry point for the benchmark suite.
+
+Usage:
+    python -m benchmarks run [--sizes 1000 10000 100000] [--repeat 5] [--output PATH]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 1.2]
+    python -m benchmarks load [--url http://localhost:5000 | --size 10000]
+        [--sessions 200] [--concurrency 8] [--think-time 0] [--output PATH]
+    python -m benchmarks memory [--size 10000]
+
+Results are written as JSON (default: benchmarks/results/<commit>.json) so runs
+from different commits can be compared.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.datasets import DEFAULT_SIZES
+from benchmarks.loadgen import HttpTarget, LoadProfile, run_load, run_wsgi_load
+from benchmarks.memory import measure_memory
+from benchmarks.suite import compare, run_suite
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark suite")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--output", type=Path, default=None)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=1.2)
+
+    load_parser = subparsers.add_parser("load", help="Replay browsing sessions and report latency")
+    load_parser.add_argument("--url", default=None, help="Base URL of a running API (default: in-process)")
+    load_parser.add_argument("--size", type=int, default=10_000, help="Synthetic exams for in-process runs")
+    load_parser.add_argument("--sessions", type=int, default=200)
+    load_parser.add_argument("--concurrency", type=int, default=8)
+    load_parser.add_argument("--scroll-pages", type=float, default=3.0, help="Mean pages scrolled per session")
+    load_parser.add_argument("--typeahead", type=float, default=0.5, help="Share of sessions that search")
+    load_parser.add_argument("--filter", type=float, default=0.2, help="Share of sessions that filter")
+    load_parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds between requests")
+    load_parser.add_argument("--rate-limits", action="store_true", help="Keep admission control on in-process")
+    load_parser.add_argument("--seed", type=int, default=42)
+    load_parser.add_argument("--output", type=Path, default=None)
+
+    memory_parser = subparsers.add_parser("memory", help="Report bytes per structure")
+    memory_parser.add_argument("--size", type=int, default=10_000)
+    memory_parser.add_argument("--seed", type=int, default=42)
+    memory_parser.add_argument("--output", type=Path, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "memory":
+        report = measure_memory(args.size, seed=args.seed)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        print(f"== {report['exams']} exams")
+        for name, stats in report["structures"].items():
+            print(f"  {name:<28} {stats['bytes']:>12,} B  {stats['bytes_per_exam']:>9.1f} B/exam")
+        print(f"  {'total':<28} {report['total_bytes']:>12,} B  {report['bytes_per_exam']:>9.1f} B/exam")
+        traced = report["tracemalloc"]
+        print(
+            f"  {'tracemalloc retained':<28} {traced['retained_bytes']:>12,} B  "
+            f"{traced['retained_bytes_per_exam']:>9.1f} B/exam  (peak {traced['peak_bytes']:,} B)"
+        )
+        return 0
+
+    if args.command == "load":
+        profile = LoadProfile(
+            sessions=args.sessions,
+            scroll_mean_pages=args.scroll_pages,
+            typeahead_probability=args.typeahead,
+            filter_probability=args.filter,
+            think_time_seconds=args.think_time,
+            seed=args.seed,
+        )
+        if args.url:
+            report = run_load(lambda: HttpTarget(args.url), profile, concurrency=args.concurrency)
+            report["target"] = {"kind": "http", "url": args.url}
+        else:
+            report = run_wsgi_load(args.size, profile, args.concurrency, rate_limits=args.rate_limits)
+
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+        overall = report["overall"]
+        print(
+            f"{overall['requests']} requests in {report['elapsed_seconds']:.2f} s "
+            f"({overall.get('throughput_rps', 0):.1f} req/s), {overall['errors']} errors"
+        )
+        for endpoint, stats in {"all": overall, **report["endpoints"]}.items():
+            if not stats["requests"]:
+                continue
+            print(
+                f"  {endpoint:<24} {stats['requests']:>7} req {stats['throughput_rps']:>9.1f}/s  "
+                f"p50 {stats['p50_ms']:>8.2f}  p95 {stats['p95_ms']:>8.2f}  p99 {stats['p99_ms']:>8.2f} ms"
+            )
+        if args.output:
+            print(f"Saved results to {args.output}")
+        return 1 if overall["errors"] else 0
+
+    if args.command == "run":
+        results = run_suite(tuple(args.sizes), repeat=args.repeat, seed=args.seed)
+        output = args.output or RESULTS_DIR / f"{results['meta']['commit']}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+        for size, cases in results["sizes"].items():
+            print(f"== {size} exams")
+            for name, stats in cases.items():
+                print(f"  {name:<28} median {stats['median_ms']:>10.3f} ms  p95 {stats['p95_ms']:>10.3f} ms")
+        print(f"Saved results to {output}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, threshold=args.threshold)
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['size']:>7} {row['case']:<28} {row['baseline_ms']:>10.3f} -> "
+            f"{row['current_ms']:>10.3f} ms  x{row['ratio']:<6} {flag}"
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
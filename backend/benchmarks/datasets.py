@@ -0,0 +1,105 @@
+"""Synthetic exam datasets shaped like data/exams.json."""
+
+import datetime as dt
+import json
+import random
+from pathlib import Path
+
+# Weighted roughly like the real Fall 2025 snapshot.
+SUBJECTS = [
+    ("WRIT", 20), ("MATH", 6), ("BUS", 6), ("CS", 6), ("BIOL", 3), ("POSC", 3),
+    ("ECON", 3), ("EE", 2), ("PHYS", 2), ("SOC", 2), ("ME", 2), ("CHEM", 2),
+    ("MGT", 2), ("BCH", 1), ("ENGL", 1), ("PHIL", 1), ("STAT", 1), ("HIST", 1),
+    ("PSYC", 1), ("ANTH", 1), ("SPN", 1), ("EDUC", 1), ("LING", 1), ("MUS", 1),
+]
+
+BUILDINGS = [
+    ("SSC", 18), ("SPR", 11), ("OLMH", 9), ("MSE", 6), ("HMNSS", 6), ("WAT", 5),
+    ("ONLINE", 5), ("INTN", 5), ("BRNHL", 5), ("SBB", 4), ("LFSC", 3), ("SPTH", 3),
+    ("PHY", 3), ("CHUNG", 2), ("UNLH", 1), ("SKYE", 1),
+]
+
+# (hour, minute) start slots with their relative frequency.
+START_SLOTS = [((11, 30), 37), ((15, 0), 20), ((8, 0), 20), ((19, 0), 15)]
+
+FIRST_DATE = dt.date(2025, 12, 6)
+DAYS = 7
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def _weighted(rng: random.Random, choices: list[tuple]) -> object:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _format_12h(value: dt.datetime) -> str:
+    ampm = "AM" if value.hour < 12 else "PM"
+    return f"{value.hour % 12 or 12}:{value.minute:02d} {ampm}"
+
+
+def make_exam(rng: random.Random, ordinal: int) -> dict:
+    """Build one synthetic exam record.
+
+    Args:
+        rng: Seeded random generator.
+        ordinal: Position of the record, used to keep CRNs and event ids unique.
+
+    Returns:
+        Exam dictionary with the same keys as records in data/exams.json.
+    """
+    subject = _weighted(rng, SUBJECTS)
+    course_number = f"{rng.randint(1, 299):03d}{rng.choice(['', '', 'A', 'B', 'C'])}"
+    section = f"{rng.randint(1, 40):03d}"
+    crn = str(10000 + ordinal)
+    building = _weighted(rng, BUILDINGS)
+    location = building if building == "ONLINE" else f"{building} {rng.randint(100, 4999)}"
+
+    day = FIRST_DATE + dt.timedelta(days=rng.randrange(DAYS))
+    hour, minute = _weighted(rng, START_SLOTS)
+    start = dt.datetime(day.year, day.month, day.day, hour, minute)
+    end = start + dt.timedelta(hours=3)
+
+    title = f"{subject} {course_number} {section} {crn}"
+    return {
+        "subject": subject,
+        "course_number": course_number,
+        "section": section,
+        "crn": crn,
+        "course_name": title,
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+        "location": location,
+        "term_code": "",
+        "date": day.strftime("%Y%m%d"),
+        "event_id": str(1337000000 + ordinal),
+        "final_exam": f"EXAM: {title}",
+        "exam_date": f"{start:%b} {day.day}",
+        "exam_date_iso": day.isoformat(),
+        "start_time_display": _format_12h(start),
+        "end_time_display": _format_12h(end),
+        "classroom": location,
+    }
+
+
+def generate_exams(count: int, seed: int = 42) -> list[dict]:
+    """Generate a deterministic synthetic dataset.
+
+    Args:
+        count: Number of exams to generate.
+        seed: Random seed; the same seed and count always yield the same data.
+
+    Returns:
+        List of exam dictionaries.
+    """
+    rng = random.Random(seed)
+    return [make_exam(rng, ordinal) for ordinal in range(count)]
+
+
+def write_dataset(exams: list[dict], path: str | Path) -> Path:
+    """Write a dataset in the same JSON layout as the scraper's snapshot."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(exams, f, indent=2, ensure_ascii=False)
+    return path
@@ -0,0 +1,331 @@
+"""Load generator that replays infinite-scroll browsing sessions.
+
+A session mirrors what the frontend does for one visitor: on page load it
+requests /api/filters/dates, /api/filters/locations and the first page of
+/api/exams, may type a search (one /api/exams?q= request per debounced
+prefix) or pick a date or building, then scrolls, fetching further pages of
+``limit=20`` until it loses interest or ``hasMore`` is false.
+
+Sessions are generated from a seeded LoadProfile before the run starts, so
+the same profile and seed always replay the same requests. They run on a
+fixed number of worker threads against a live server (HttpTarget) or
+in-process against the WSGI app (WsgiTarget), and the report gives
+throughput and p50/p95/p99 latency per endpoint.
+"""
+
+import datetime as dt
+import json
+import queue
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Protocol
+from urllib.parse import urlencode
+
+import requests
+
+from api.app import create_app
+from api.repositories.exam_repository import ExamRepository
+from api.services.exam_service import ExamService
+from benchmarks.datasets import BUILDINGS, DAYS, FIRST_DATE, SUBJECTS, generate_exams, write_dataset
+from benchmarks.suite import patched_services
+
+PAGE_LIMIT = 20
+
+
+class LoadProfile:
+    """Distributions that shape the generated sessions.
+
+    Args:
+        sessions: Number of sessions to replay.
+        scroll_mean_pages: Mean number of pages scrolled past the first
+            (geometrically distributed).
+        typeahead_probability: Chance that a session types a search.
+        filter_probability: Chance that a session filters by date or building.
+        think_time_seconds: Mean pause between a session's requests
+            (exponentially distributed; 0 sends them back to back).
+        seed: Random seed for session generation and think times.
+    """
+
+    def __init__(
+        self,
+        sessions: int = 200,
+        scroll_mean_pages: float = 3.0,
+        typeahead_probability: float = 0.5,
+        filter_probability: float = 0.2,
+        think_time_seconds: float = 0.0,
+        seed: int = 42,
+    ):
+        self.sessions = sessions
+        self.scroll_mean_pages = scroll_mean_pages
+        self.typeahead_probability = typeahead_probability
+        self.filter_probability = filter_probability
+        self.think_time_seconds = think_time_seconds
+        self.seed = seed
+
+    def as_dict(self) -> dict:
+        """Return the profile as JSON-serializable settings."""
+        return dict(vars(self))
+
+
+def _weighted(rng: random.Random, choices: list[tuple]) -> object:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _search_text(rng: random.Random) -> str:
+    """Pick what a visitor types: a subject, a course code or a CRN."""
+    kind = rng.random()
+    if kind < 0.5:
+        return str(_weighted(rng, SUBJECTS)).lower()
+    if kind < 0.85:
+        return f"{_weighted(rng, SUBJECTS)} {rng.randint(1, 199):03d}".lower()
+    return str(10000 + rng.randrange(5000))
+
+
+def _typed_prefixes(rng: random.Random, text: str) -> list[str]:
+    """Prefixes that survive the search box debounce while typing ``text``."""
+    prefixes = [text[:end] for end in range(1, len(text) + 1) if not text[:end].endswith(" ")]
+    kept = [prefix for prefix in prefixes[:-1] if rng.random() < 0.4]
+    return kept + [text]
+
+
+def _exams_path(filters: dict, page: int) -> str:
+    params = dict(filters)
+    if page > 1:
+        params["page"] = page
+    params["limit"] = PAGE_LIMIT
+    return "/api/exams?" + urlencode(params)
+
+
+class Session:
+    """Requests one visitor makes, in order.
+
+    ``scroll_pages`` further pages of the final search are requested after
+    ``paths``, stopping early once the API reports ``hasMore`` false.
+    """
+
+    def __init__(self, paths: list[str], filters: dict, scroll_pages: int):
+        self.paths = paths
+        self.filters = filters
+        self.scroll_pages = scroll_pages
+
+
+def generate_sessions(profile: LoadProfile) -> list[Session]:
+    """Build the sessions described by a profile.
+
+    Args:
+        profile: Traffic distributions and seed.
+
+    Returns:
+        Sessions in the order they are handed to workers.
+    """
+    rng = random.Random(profile.seed)
+    stop_probability = 1 / (1 + profile.scroll_mean_pages)
+    sessions = []
+
+    for _ in range(profile.sessions):
+        filters: dict = {}
+        paths = ["/api/filters/dates", "/api/filters/locations", _exams_path(filters, 1)]
+
+        if rng.random() < profile.filter_probability:
+            if rng.random() < 0.5:
+                filters["date"] = (FIRST_DATE + dt.timedelta(days=rng.randrange(DAYS))).isoformat()
+            else:
+                filters["location"] = _weighted(rng, BUILDINGS)
+            paths.append(_exams_path(filters, 1))
+
+        if rng.random() < profile.typeahead_probability:
+            text = _search_text(rng)
+            for prefix in _typed_prefixes(rng, text):
+                paths.append(_exams_path({**filters, "q": prefix}, 1))
+            filters["q"] = text
+
+        scroll_pages = 0
+        while rng.random() >= stop_probability:
+            scroll_pages += 1
+
+        sessions.append(Session(paths, filters, scroll_pages))
+    return sessions
+
+
+class Target(Protocol):
+    """Something that can serve GET requests for the load generator."""
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        """Return the status code and body for a request path."""
+
+
+class HttpTarget:
+    """Sends requests to a running API over HTTP, with keep-alive.
+
+    Server-side rate limits apply, so set a generous budget (or disable
+    RATE_LIMIT_ENABLED) on the server under test; rejected requests are
+    reported as errors.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        response = self._session.get(self.base_url + path, timeout=self.timeout)
+        return response.status_code, response.content
+
+
+class WsgiTarget:
+    """Calls a Flask app in-process through its test client."""
+
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        response = self._client.get(path)
+        return response.status_code, response.get_data()
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return a percentile of already sorted samples (nearest rank)."""
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return samples[index]
+
+
+def _endpoint(path: str) -> str:
+    return path.split("?", 1)[0]
+
+
+def _has_more(body: bytes) -> bool:
+    try:
+        return bool(json.loads(body)["pagination"]["hasMore"])
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+def run_load(
+    target_factory: Callable[[], Target],
+    profile: LoadProfile,
+    concurrency: int = 8,
+) -> dict:
+    """Replay a profile's sessions and summarize the latencies.
+
+    Args:
+        target_factory: Creates one target per worker thread.
+        profile: Sessions to replay.
+        concurrency: Number of sessions in flight at once.
+
+    Returns:
+        JSON-serializable report with overall and per-endpoint statistics.
+    """
+    pending: queue.Queue = queue.Queue()
+    for session in generate_sessions(profile):
+        pending.put(session)
+
+    samples: list[tuple[str, float, int]] = []
+    samples_lock = threading.Lock()
+
+    def worker(seed: int) -> None:
+        target = target_factory()
+        rng = random.Random(seed)
+        local: list[tuple[str, float, int]] = []
+
+        def send(path: str) -> bytes:
+            if profile.think_time_seconds:
+                time.sleep(rng.expovariate(1 / profile.think_time_seconds))
+            start = time.perf_counter()
+            try:
+                status, body = target.get(path)
+            except requests.RequestException:
+                status, body = 0, b""
+            local.append((_endpoint(path), time.perf_counter() - start, status))
+            return body if status == 200 else b""
+
+        while True:
+            try:
+                session = pending.get_nowait()
+            except queue.Empty:
+                break
+            body = b""
+            for path in session.paths:
+                body = send(path)
+            page = 1
+            while page <= session.scroll_pages and _has_more(body):
+                page += 1
+                body = send(_exams_path(session.filters, page))
+
+        with samples_lock:
+            samples.extend(local)
+
+    threads = [
+        threading.Thread(target=worker, args=(profile.seed + slot,), daemon=True)
+        for slot in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    by_endpoint: dict[str, list[tuple[str, float, int]]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample[0], []).append(sample)
+
+    return {
+        "profile": profile.as_dict(),
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "overall": summarize(samples, elapsed),
+        "endpoints": {
+            endpoint: summarize(group, elapsed) for endpoint, group in sorted(by_endpoint.items())
+        },
+    }
+
+
+def summarize(samples: Iterable[tuple[str, float, int]], elapsed: float) -> dict:
+    """Throughput, error count and latency percentiles for a set of samples."""
+    samples = list(samples)
+    latencies = sorted(latency * 1000 for _, latency, _ in samples)
+    statuses: dict[str, int] = {}
+    for _, _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    if not latencies:
+        return {"requests": 0, "errors": 0, "statuses": {}}
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status != "200"),
+        "statuses": statuses,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+def run_wsgi_load(size: int, profile: LoadProfile, concurrency: int = 8, rate_limits: bool = False) -> dict:
+    """Replay a profile in-process against a synthetic dataset.
+
+    Args:
+        size: Number of synthetic exams to serve.
+        profile: Sessions to replay; its seed also seeds the dataset.
+        concurrency: Number of sessions in flight at once.
+        rate_limits: Keep the app's admission control on. Off by default,
+            since every session shares one client address.
+
+    Returns:
+        The run_load report, with the dataset size added.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = write_dataset(generate_exams(size, seed=profile.seed), Path(tmp) / "exams.json")
+        service = ExamService(repository=ExamRepository(data_path))
+        service.warm()
+        app = create_app({"TESTING": True, "RATE_LIMIT_ENABLED": rate_limits})
+        with patched_services(service):
+            report = run_load(lambda: WsgiTarget(app), profile, concurrency=concurrency)
+
+    report["target"] = {"kind": "wsgi", "size": size}
+    return report
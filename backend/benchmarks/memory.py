@@ -0,0 +1,53 @@
+"""Memory footprint of the API's structures over synthetic datasets."""
+
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from api.repositories.exam_repository import ExamRepository
+from api.services.exam_service import ExamService
+from benchmarks.datasets import generate_exams, write_dataset
+
+
+def measure_memory(size: int, seed: int = 42) -> dict:
+    """Load a synthetic snapshot the way a worker does and account for it.
+
+    The snapshot is loaded from JSON and warmed (index and suggestions
+    built) under tracemalloc, so the report carries both the bytes
+    allocated by loading and the per-structure sizes from
+    ExamService.memory_report.
+
+    Args:
+        size: Number of synthetic exams.
+        seed: Dataset generator seed.
+
+    Returns:
+        memory_report dictionary with a "tracemalloc" entry added.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = write_dataset(generate_exams(size, seed=seed), Path(tmp) / "exams.json")
+
+        gc.collect()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            service = ExamService(repository=ExamRepository(data_path))
+            service.warm()
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        report = service.memory_report()
+
+    report["tracemalloc"] = {
+        "retained_bytes": current - baseline,
+        "peak_bytes": peak - baseline,
+        "retained_bytes_per_exam": round((current - baseline) / size, 1) if size else 0.0,
+    }
+    return report
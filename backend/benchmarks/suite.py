@@ -0,0 +1,226 @@
+"""Benchmark cases for ExamRepository, ExamService and the Flask API."""
+
+import contextlib
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from api.app import create_app
+from api.repositories.binary_snapshot import BinarySnapshotRepository, write_binary_snapshot
+from api.repositories.exam_repository import ExamRepository
+from api.repositories.sqlite_repository import SqliteExamRepository, write_sqlite_database
+from api.services.exam_service import ExamService
+from benchmarks.datasets import generate_exams, write_dataset
+
+# search_exams keyword arguments exercised at every dataset size.
+SEARCH_CASES: dict[str, dict] = {
+    "all_first_page": {},
+    "all_deep_page": {"page": 40, "limit": 20},
+    "query_subject": {"query": "math"},
+    "query_course_number": {"query": "010A"},
+    "query_crn": {"query": "10500"},
+    "query_course_code": {"query": "cs 010a"},
+    "query_no_match": {"query": "zzzz"},
+    "query_broad": {"query": "a"},
+    "query_broad_deep_page": {"query": "1", "page": 2000, "limit": 20},
+    "date": {"date": "2025-12-08"},
+    "location_building": {"location": "SSC"},
+    "combined": {"query": "cs", "date": "2025-12-09", "location": "SSC"},
+    "start_window_24h": {"start_after": "2025-12-08T12:00", "start_before": "2025-12-09T12:00"},
+    "time_of_day_exact": {"time_of_day": "08:00"},
+}
+
+# Full request paths replayed through the Flask test client.
+HTTP_CASES: dict[str, str] = {
+    "http_exams_first_page": "/api/exams",
+    "http_exams_search": "/api/exams?q=calc&limit=20",
+    "http_exams_filtered": "/api/exams?date=2025-12-08&location=SSC&page=2",
+    "http_filters_dates": "/api/filters/dates",
+    "http_filters_locations": "/api/filters/locations",
+    "http_suggest": "/api/suggest?q=ma",
+}
+
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    warmup: int = 1,
+    expect_status: int | None = None,
+) -> dict:
+    """Time repeated calls to ``fn``.
+
+    Args:
+        fn: Zero-argument callable to time.
+        repeat: Number of timed calls.
+        warmup: Number of untimed calls made first.
+        expect_status: If set, ``fn`` returns an HTTP response whose status
+            must be this on every call, so error responses are never timed.
+
+    Returns:
+        Dictionary of timing statistics in milliseconds.
+
+    Raises:
+        RuntimeError: If a response has a different status.
+    """
+    def call() -> None:
+        result = fn()
+        if expect_status is not None and result.status_code != expect_status:
+            raise RuntimeError(f"Expected HTTP {expect_status}, got {result.status_code}")
+
+    for _ in range(warmup):
+        call()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p95_index = min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))
+    return {
+        "runs": repeat,
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[p95_index], 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+    }
+
+
+@contextlib.contextmanager
+def patched_services(service: ExamService) -> Iterator[None]:
+    """Point the route modules at ``service`` for the duration of the block."""
+    from api.routes import exams as exams_module
+    from api.routes import filters as filters_module
+    from api.routes import suggest as suggest_module
+
+    modules = (exams_module, filters_module, suggest_module)
+    originals = [module._exam_service for module in modules]
+    for module in modules:
+        module._exam_service = service
+    try:
+        yield
+    finally:
+        for module, original in zip(modules, originals):
+            module._exam_service = original
+
+
+def run_size(size: int, repeat: int, seed: int) -> dict:
+    """Run every benchmark case against a dataset of ``size`` exams."""
+    exams = generate_exams(size, seed=seed)
+    results: dict[str, dict] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = write_dataset(exams, Path(tmp) / "exams.json")
+        results["repository_cold_load"] = measure(
+            lambda: ExamRepository(data_path).get_all_exams(), repeat=repeat, warmup=0
+        )
+
+        binary_path = write_binary_snapshot(exams, Path(tmp) / "exams.bin")
+        results["binary_snapshot_cold_open"] = measure(
+            lambda: ExamService(repository=BinarySnapshotRepository(binary_path)).warm(),
+            repeat=repeat,
+            warmup=0,
+        )
+
+        sqlite_path = write_sqlite_database(exams, Path(tmp) / "exams.db")
+        sqlite_service = ExamService(repository=SqliteExamRepository(sqlite_path))
+        sqlite_service.search_exams()
+
+        service = ExamService(repository=ExamRepository(data_path))
+        service.search_exams()
+
+        for name, kwargs in SEARCH_CASES.items():
+            results[f"search_{name}"] = measure(
+                lambda kwargs=kwargs: service.search_exams(**kwargs), repeat=repeat
+            )
+            results[f"sqlite_search_{name}"] = measure(
+                lambda kwargs=kwargs: sqlite_service.search_exams(**kwargs), repeat=repeat
+            )
+
+        results["facet_dates"] = measure(service.get_available_dates, repeat=repeat)
+        results["facet_locations"] = measure(service.get_available_locations, repeat=repeat)
+        results["suggest_short_prefix"] = measure(lambda: service.suggest("m"), repeat=repeat)
+        results["suggest_course_prefix"] = measure(lambda: service.suggest("cs 01"), repeat=repeat)
+
+        # Rate limits would answer 429 once a run exceeds the search burst.
+        app = create_app({"TESTING": True, "RATE_LIMIT_ENABLED": False})
+        client = app.test_client()
+        with patched_services(service):
+            for name, path in HTTP_CASES.items():
+                results[name] = measure(
+                    lambda path=path: client.get(path), repeat=repeat, expect_status=200
+                )
+
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(sizes: tuple[int, ...], repeat: int = 5, seed: int = 42) -> dict:
+    """Run the full benchmark suite.
+
+    Args:
+        sizes: Dataset sizes to benchmark.
+        repeat: Timed runs per case.
+        seed: Dataset generator seed.
+
+    Returns:
+        JSON-serializable results with run metadata.
+    """
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "sizes": {str(size): run_size(size, repeat=repeat, seed=seed) for size in sizes},
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.2) -> list[dict]:
+    """Compare median timings of two result files.
+
+    Args:
+        baseline: Results from an earlier run.
+        current: Results from the run being checked.
+        threshold: Ratio of current/baseline median above which a case regressed.
+
+    Returns:
+        One row per case present in both runs.
+    """
+    rows = []
+    for size, cases in current["sizes"].items():
+        base_cases = baseline["sizes"].get(size, {})
+        for name, stats in cases.items():
+            base = base_cases.get(name)
+            if base is None:
+                continue
+            ratio = stats["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf")
+            rows.append({
+                "size": size,
+                "case": name,
+                "baseline_ms": base["median_ms"],
+                "current_ms": stats["median_ms"],
+                "ratio": round(ratio, 3),
+                "regressed": ratio > threshold,
+            })
+    return rows
@@ -0,0 +1,47 @@
+"""Gunicorn configuration for the pre-fork production server.
+
+Usage (from backend/):
+    gunicorn -c gunicorn.conf.py
+    python run.py --production
+
+Environment:
+    EXAM_API_BIND: Address to listen on (default: 0.0.0.0:5000).
+    EXAM_API_WORKERS: Number of worker processes (default: 2 * CPUs + 1).
+    EXAM_API_THREADS: Threads per worker (default: 32).
+    EXAM_API_SNAPSHOT_POLL_SECONDS: Snapshot change check interval (default: 5).
+"""
+
+import multiprocessing
+import os
+import signal
+
+bind = os.environ.get("EXAM_API_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("EXAM_API_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+wsgi_app = "wsgi:app"
+
+# Threaded workers, so an open /api/events stream holds one thread rather
+# than a whole worker process. Keep EVENTS_MAX_CLIENTS below this so
+# streams never take every thread.
+worker_class = "gthread"
+threads = int(os.environ.get("EXAM_API_THREADS", 32))
+
+# Import wsgi (and so load the snapshot and build indexes) once in the master.
+preload_app = True
+
+snapshot_poll_seconds = float(os.environ.get("EXAM_API_SNAPSHOT_POLL_SECONDS", 5))
+
+
+def when_ready(server):
+    """Start watching the snapshot from the master once it is serving."""
+    from api.prefork import SnapshotWatcher
+    from wsgi import service
+
+    # SIGHUP makes gunicorn gracefully replace every worker; new workers fork
+    # from the master, which already holds the reloaded snapshot.
+    watcher = SnapshotWatcher(
+        service,
+        on_reload=lambda: os.kill(server.pid, signal.SIGHUP),
+        interval=snapshot_poll_seconds,
+        freeze=True,
+    )
+    watcher.start()
@@ -1,8 +1,28 @@
-"""Entry point for running the Flask API server."""
+"""Entry point for running the Flask API server.
 
-from api.app import create_app
+Usage:
+    python run.py                 # Flask development server with debug reload
+    python run.py --production    # Pre-fork gunicorn server (see gunicorn.conf.py)
+"""
+
+import os
+import sys
+from pathlib import Path
 
-app = create_app()
+from api.app import create_app
 
 if __name__ == "__main__":
+    if "--production" in sys.argv[1:]:
+        backend_dir = Path(__file__).parent.resolve()
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "--chdir", str(backend_dir),
+            "-c", str(backend_dir / "gunicorn.conf.py"),
+        ])
+    
+    # Poll the snapshot in-process so /api/events fires during development,
+    # but only in the reloader's serving child, not the parent that watches
+    # source files; otherwise every change would be reloaded twice.
+    serving = os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    app = create_app({"SNAPSHOT_POLL_SECONDS": 5 if serving else 0})
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -1,5 +1,13 @@
 """UCR Final Exam Scraper package."""
 
-from .exam_scraper import fetch_exams, parse_exam, save_exams
-
 __all__ = ["fetch_exams", "parse_exam", "save_exams"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so that scraper.config and scraper.history can be
+    # imported (e.g. by the API) without loading the scraper and its logging.
+    if name in __all__:
+        from . import exam_scraper
+
+        return getattr(exam_scraper, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,37 @@
 
 Usage:
     python -m scraper
+    python -m scraper --daemon
 
 Fetches final exams for the configured date range and saves them to data/exams.json.
+With --daemon, keeps running and re-scrapes on a schedule (see scraper.daemon).
 """
 
+import argparse
+
 from .config import END_DATE, START_DATE
 from .exam_scraper import run_scraper
 
 
 def main() -> None:
     """Main CLI entry point."""
+    parser = argparse.ArgumentParser(prog="python -m scraper")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run on a schedule and publish validated snapshots until stopped",
+    )
+    args = parser.parse_args()
+
+    if args.daemon:
+        from .daemon import DaemonAlreadyRunning, run_daemon
+
+        try:
+            run_daemon()
+        except DaemonAlreadyRunning as e:
+            parser.exit(1, f"{e}\n")
+        return
+
     print("UCR Final Exam Scraper")
     print("======================")
     print(f"Fetching all department exams for {START_DATE}–{END_DATE}...")
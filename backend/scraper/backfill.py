@@ -0,0 +1,176 @@
+"""Parallel parsing of cached day-view pages for large historical backfills.
+
+Parsing day-view HTML and normalizing its rows is CPU-bound, so a backfill
+spanning many terms parses pages in batches on a process pool. Results are
+merged in (date, index) order before dedupe, so the output does not depend
+on the number of workers or on which batch finishes first.
+
+Pages are read from a replay corpus (see scraper.replay), which
+`python -m scraper.replay record` fills from the upstream.
+
+Usage:
+    python -m scraper.backfill [--corpus data/replay] [--start YYYYMMDD]
+        [--end YYYYMMDD] [--workers N] [--batch-pages 32]
+        [--output data/backfill.json]
+"""
+
+import argparse
+import json
+import logging
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .config import BACKFILL_BATCH_PAGES, BACKFILL_OUTPUT_FILE, BACKFILL_WORKERS, REPLAY_CORPUS_DIR
+from .exam_scraper import _dedupe_exams, _parse_xhr_response, _resolve_output_path, parse_exam, save_exams
+from .report import ScrapeReport
+
+logger = logging.getLogger(__name__)
+
+# A page to parse: (date, index, HTML text or path of a file holding it).
+PageSource = tuple[str, int, "str | Path"]
+
+_DATE_PATTERN = re.compile(r"\d{8}")
+
+
+def iter_corpus_pages(
+    root: str | Path,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> list[tuple[str, int, Path]]:
+    """List the cached pages in a replay corpus, in (date, index) order.
+
+    Recorded pages are listed individually. A full-day capture is listed as
+    the date's page at index 0, unless pages were recorded for that date.
+
+    Args:
+        root: Corpus directory.
+        start: Optional first date (YYYYMMDD) to include.
+        end: Optional last date (YYYYMMDD) to include.
+    """
+    root = Path(root)
+    pages: list[tuple[str, int, Path]] = []
+    recorded_dates = set()
+
+    for path in root.glob("*/*.html"):
+        date = path.parent.name
+        if _DATE_PATTERN.fullmatch(date) and path.stem.isdigit():
+            pages.append((date, int(path.stem), path))
+            recorded_dates.add(date)
+
+    for path in root.glob("*.html"):
+        if _DATE_PATTERN.fullmatch(path.stem) and path.stem not in recorded_dates:
+            pages.append((path.stem, 0, path))
+
+    pages = [
+        page for page in pages
+        if (start is None or page[0] >= start) and (end is None or page[0] <= end)
+    ]
+    return sorted(pages, key=lambda page: page[:2])
+
+
+def _parse_batch(batch: Sequence[PageSource]) -> list[tuple]:
+    """Parse and normalize a batch of pages; runs in a worker process.
+
+    Files are read here rather than in the parent so only paths cross the
+    process boundary on the way in.
+
+    Returns:
+        One (date, index, bytes, parse_seconds, rows, exams) tuple per page.
+    """
+    results = []
+    for date, index, source in batch:
+        text = source.read_text(encoding="utf-8") if isinstance(source, Path) else source
+        parse_start = time.perf_counter()
+        raw_exams = _parse_xhr_response(text, query_date=date)
+        exams = [e for e in (parse_exam(raw) for raw in raw_exams) if e is not None]
+        parse_seconds = time.perf_counter() - parse_start
+        results.append((date, index, len(text.encode("utf-8")), parse_seconds, len(raw_exams), exams))
+    return results
+
+
+def parse_pages(
+    pages: Sequence[PageSource],
+    workers: Optional[int] = BACKFILL_WORKERS,
+    batch_pages: int = BACKFILL_BATCH_PAGES,
+    report: Optional[ScrapeReport] = None,
+) -> list[dict]:
+    """Parse, normalize and dedupe pages, in parallel when worthwhile.
+
+    Args:
+        pages: Pages to parse, in any order.
+        workers: Worker processes; None uses every core and 1 parses in
+            this process.
+        batch_pages: Pages sent to a worker per task.
+        report: Optional report that receives per-page parse timings and
+            row counts. Fetch latency is recorded as 0.
+
+    Returns:
+        Deduped exams, ordered by (date, index) of the page they came from.
+        Where pages repeat a record, the earliest page's copy is kept.
+    """
+    batch_pages = max(1, batch_pages)
+    batches = [pages[i:i + batch_pages] for i in range(0, len(pages), batch_pages)]
+
+    if workers == 1 or len(batches) <= 1:
+        batch_results = [_parse_batch(batch) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batch_results = list(executor.map(_parse_batch, batches))
+
+    page_results = sorted(
+        (result for results in batch_results for result in results),
+        key=lambda result: result[:2],
+    )
+
+    raw_rows = 0
+    parsed_exams: list[dict] = []
+    for date, index, bytes_received, parse_seconds, rows, exams in page_results:
+        if report is not None:
+            report.record_page(
+                date=date,
+                index=index,
+                status=None,
+                latency_seconds=0.0,
+                bytes_received=bytes_received,
+                parse_seconds=parse_seconds,
+                rows=rows,
+                retries=0,
+            )
+        raw_rows += rows
+        parsed_exams.extend(exams)
+
+    final_exams = _dedupe_exams(parsed_exams)
+    if report is not None:
+        report.record_dedupe(raw_rows=raw_rows, parsed_rows=len(parsed_exams), deduped_rows=len(final_exams))
+    logger.info(f"Parsed {len(pages)} pages into {len(final_exams)} exams")
+    return final_exams
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """CLI entry point: parse a cached corpus and save the merged snapshot."""
+    parser = argparse.ArgumentParser(prog="python -m scraper.backfill")
+    parser.add_argument("--corpus", default=REPLAY_CORPUS_DIR)
+    parser.add_argument("--start", default=None, help="First date to include (YYYYMMDD)")
+    parser.add_argument("--end", default=None, help="Last date to include (YYYYMMDD)")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS)
+    parser.add_argument("--batch-pages", type=int, default=BACKFILL_BATCH_PAGES)
+    parser.add_argument("--output", default=BACKFILL_OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    pages = iter_corpus_pages(_resolve_output_path(args.corpus), start=args.start, end=args.end)
+    report = ScrapeReport()
+    exams = parse_pages(pages, workers=args.workers, batch_pages=args.batch_pages, report=report)
+    save_exams(exams, output_path=args.output)
+    report.finish()
+
+    summary = report.to_dict()
+    del summary["pages"]
+    del summary["dates"]
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
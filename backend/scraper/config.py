@@ -1,12 +1,18 @@
 """Configuration for the UCR exam scraper."""
 
-# Base XHR endpoint template for UCR's 25Live calendar.
+# XHR endpoint template for any UCR 25Live calendar.
 # The `date` parameter MUST be in YYYYMMDD format.
-API_BASE_URL = (
-    "https://25livepub.collegenet.com/s.aspx?calendar=final-exam-calendar"
+CALENDAR_URL_TEMPLATE = (
+    "https://25livepub.collegenet.com/s.aspx?calendar={calendar}"
     "&widget=main&date={date}&index={index}&spudformat=xhr"
 )
 
+# Calendar scraped by the default run.
+CALENDAR = "final-exam-calendar"
+
+# Base XHR endpoint template for UCR's final exam calendar.
+API_BASE_URL = CALENDAR_URL_TEMPLATE.replace("{calendar}", CALENDAR)
+
 # Index pagination bounds (inclusive) for the XHR widget.
 INDEX_START = 0
 INDEX_END = 300
@@ -15,6 +21,13 @@ INDEX_STEP = 25
 # Small delay between upstream requests to avoid overloading the site.
 REQUEST_DELAY_SECONDS = 0.2
 
+# Pages of one date fetched at once when the first page links to several.
+MAX_CONCURRENT_PAGES = 4
+
+# Retry transient upstream failures with a linear backoff before giving up.
+MAX_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 1.0
+
 # Inclusive date range bounds for fetching final exams.
 # Format: YYYYMMDD
 START_DATE = "20251206"
@@ -22,3 +35,54 @@ END_DATE = "20251212"
 
 # Output file path (relative to backend directory)
 OUTPUT_FILE = "data/exams.json"
+
+# Also write a prebuilt search index (data/exams.index.json) with each snapshot.
+EMIT_INDEX_ARTIFACT = True
+
+# Versioned snapshot history used by the /api/changes delta feed.
+RECORD_HISTORY = True
+HISTORY_DIR = "data/history"
+HISTORY_MAX_DELTAS = 100
+
+# Recorded upstream responses used by the offline replay server.
+REPLAY_CORPUS_DIR = "data/replay"
+
+# Per-run timing report, written next to the snapshot.
+REPORT_FILE = "data/exams.report.json"
+
+# Daemon mode (python -m scraper --daemon): time between scheduled runs.
+DAEMON_INTERVAL_SECONDS = 6 * 60 * 60
+# Denser schedule from FINALS_LEAD_DAYS before START_DATE through END_DATE.
+FINALS_INTERVAL_SECONDS = 15 * 60
+FINALS_LEAD_DAYS = 7
+# Each wait is randomized by up to this fraction of the interval, either way.
+DAEMON_JITTER_RATIO = 0.1
+# Wait after a failed run before retrying.
+DAEMON_FAILURE_BACKOFF_SECONDS = 5 * 60
+
+# Single-instance lock held for the daemon's lifetime.
+DAEMON_LOCK_FILE = "data/scraper.lock"
+
+# Local health endpoint (GET /health); port 0 disables it.
+DAEMON_HEALTH_HOST = "127.0.0.1"
+DAEMON_HEALTH_PORT = 8026
+
+# Publishing gates: refuse a snapshot with fewer rows than this, or that
+# shrinks below this fraction of the currently published snapshot.
+MIN_PUBLISH_ROWS = 1
+MIN_ROW_RATIO = 0.8
+
+# Backfill parsing (python -m scraper.backfill): worker processes (None uses
+# every core), pages handed to a worker at a time, and the output snapshot.
+BACKFILL_WORKERS = None
+BACKFILL_BATCH_PAGES = 32
+BACKFILL_OUTPUT_FILE = "data/backfill.json"
+
+# Backfill job queue (python -m scraper.jobs): queue database, where fetched
+# pages are stored (one replay corpus per calendar), worker threads, lease
+# length and attempts per page before it is marked failed.
+BACKFILL_QUEUE_FILE = "data/backfill/queue.db"
+BACKFILL_PAGES_DIR = "data/backfill/pages"
+BACKFILL_QUEUE_WORKERS = 4
+BACKFILL_LEASE_SECONDS = 120
+BACKFILL_MAX_ATTEMPTS = 5
@@ -0,0 +1,388 @@
+"""Long-running scraper daemon with scheduled, validated snapshot publishing.
+
+Runs the scraper on an interval that tightens around finals week, with
+random jitter so runs do not hit the upstream at fixed times. A scraped
+snapshot is only published when it passes the validation gates; the API
+picks up the replaced file through its snapshot watcher.
+
+Usage:
+    python -m scraper --daemon
+"""
+
+import datetime as dt
+import fcntl
+import json
+import logging
+import os
+import random
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from .config import (
+    DAEMON_FAILURE_BACKOFF_SECONDS,
+    DAEMON_HEALTH_HOST,
+    DAEMON_HEALTH_PORT,
+    DAEMON_INTERVAL_SECONDS,
+    DAEMON_JITTER_RATIO,
+    DAEMON_LOCK_FILE,
+    END_DATE,
+    FINALS_INTERVAL_SECONDS,
+    FINALS_LEAD_DAYS,
+    MIN_PUBLISH_ROWS,
+    MIN_ROW_RATIO,
+    OUTPUT_FILE,
+    START_DATE,
+)
+from .exam_scraper import (
+    LA_TZ,
+    _load_previous_snapshot,
+    _parse_yyyymmdd,
+    _resolve_output_path,
+    publish_exams,
+    scrape_exams,
+)
+from .report import ScrapeReport
+
+logger = logging.getLogger(__name__)
+
+# Fields every published record must carry as strings.
+REQUIRED_FIELDS = (
+    "subject",
+    "course_number",
+    "section",
+    "crn",
+    "start_time",
+    "end_time",
+    "location",
+    "event_id",
+)
+
+# Invalid rows listed individually before the rest are summarized.
+MAX_REPORTED_ROWS = 5
+
+# Scheduled intervals without a successful publish before health reports stale.
+STALE_INTERVALS = 2
+
+
+class DaemonAlreadyRunning(RuntimeError):
+    """Raised when another daemon holds the instance lock."""
+
+
+def _schema_problem(exam: object) -> Optional[str]:
+    if not isinstance(exam, dict):
+        return "not an object"
+    for field in REQUIRED_FIELDS:
+        if not isinstance(exam.get(field), str):
+            return f"missing or non-string '{field}'"
+    if not exam["event_id"]:
+        return "empty 'event_id'"
+    for field in ("start_time", "end_time"):
+        if exam[field]:
+            try:
+                dt.datetime.fromisoformat(exam[field])
+            except ValueError:
+                return f"invalid '{field}': {exam[field]!r}"
+    return None
+
+
+def validate_snapshot(
+    exams: list[dict],
+    previous_count: int,
+    min_rows: int = MIN_PUBLISH_ROWS,
+    min_ratio: float = MIN_ROW_RATIO,
+) -> list[str]:
+    """Check a scraped snapshot before it replaces the published one.
+
+    Args:
+        exams: Parsed, deduped records.
+        previous_count: Rows in the currently published snapshot (0 if none).
+        min_rows: Fewest rows a snapshot may have.
+        min_ratio: Fewest rows as a fraction of previous_count.
+
+    Returns:
+        Human-readable problems; empty if the snapshot may be published.
+    """
+    problems = []
+    if len(exams) < min_rows:
+        problems.append(f"only {len(exams)} rows (minimum {min_rows})")
+    if previous_count and len(exams) < previous_count * min_ratio:
+        problems.append(
+            f"row count dropped from {previous_count} to {len(exams)} "
+            f"(below {min_ratio:.0%} of the published snapshot)"
+        )
+
+    invalid = 0
+    for position, exam in enumerate(exams):
+        problem = _schema_problem(exam)
+        if problem is None:
+            continue
+        invalid += 1
+        if invalid <= MAX_REPORTED_ROWS:
+            problems.append(f"row {position}: {problem}")
+    if invalid > MAX_REPORTED_ROWS:
+        problems.append(f"{invalid - MAX_REPORTED_ROWS} more invalid rows")
+
+    return problems
+
+
+def in_finals_period(today: dt.date, start: str = START_DATE, end: str = END_DATE) -> bool:
+    """Return whether a date falls in the dense-schedule window around finals."""
+    first = _parse_yyyymmdd(start) - dt.timedelta(days=FINALS_LEAD_DAYS)
+    return first <= today <= _parse_yyyymmdd(end)
+
+
+def current_interval(now: dt.datetime) -> float:
+    """Scheduled seconds between runs, picked by now's date in America/Los_Angeles."""
+    today = now.astimezone(LA_TZ).date()
+    return FINALS_INTERVAL_SECONDS if in_finals_period(today) else DAEMON_INTERVAL_SECONDS
+
+
+def next_delay(now: dt.datetime, rng: random.Random) -> float:
+    """Seconds to wait before the next scheduled run.
+
+    Args:
+        now: Current time; its date in America/Los_Angeles picks the interval.
+        rng: Source of the jitter.
+    """
+    interval = current_interval(now)
+    jitter = interval * DAEMON_JITTER_RATIO
+    return max(0.0, interval + rng.uniform(-jitter, jitter))
+
+
+class InstanceLock:
+    """Exclusive lock file that keeps a second daemon from starting.
+
+    The lock is an advisory flock, so it is released by the OS if the
+    process dies; the file itself is left in place and holds the pid.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Take the lock.
+
+        Raises:
+            DaemonAlreadyRunning: If another process holds it.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise DaemonAlreadyRunning(f"Another scraper daemon holds {self.path}")
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode("ascii"))
+        self._fd = fd
+
+    def release(self) -> None:
+        """Drop the lock if held."""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "InstanceLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class DaemonHealth:
+    """Thread-safe record of the daemon's recent runs."""
+
+    def __init__(self, stale_after_seconds: Optional[float] = None):
+        """Initialize the record.
+
+        Args:
+            stale_after_seconds: The daemon reports unhealthy when its last
+                successful publish (or its start, before the first one) is
+                older than this. Defaults to STALE_INTERVALS times the
+                interval in effect when health is checked, so the threshold
+                tightens with the finals-week schedule.
+        """
+        self.stale_after_seconds = stale_after_seconds
+        self._lock = threading.Lock()
+        self._state = {
+            "pid": os.getpid(),
+            "started_at": time.time(),
+            "last_run_at": None,
+            "last_success_at": None,
+            "last_error": None,
+            "consecutive_failures": 0,
+            "runs": 0,
+            "rows": None,
+            "next_run_at": None,
+        }
+
+    def record_success(self, rows: int) -> None:
+        """Record a published snapshot."""
+        now = time.time()
+        with self._lock:
+            self._state.update(
+                last_run_at=now,
+                last_success_at=now,
+                last_error=None,
+                consecutive_failures=0,
+                rows=rows,
+            )
+            self._state["runs"] += 1
+
+    def record_failure(self, error: str) -> None:
+        """Record a run that did not publish."""
+        with self._lock:
+            self._state.update(last_run_at=time.time(), last_error=error)
+            self._state["consecutive_failures"] += 1
+            self._state["runs"] += 1
+
+    def schedule(self, delay: float) -> None:
+        """Record when the next run is due."""
+        with self._lock:
+            self._state["next_run_at"] = time.time() + delay
+
+    def to_dict(self) -> dict:
+        """Return the state plus a computed 'healthy' flag."""
+        with self._lock:
+            state = dict(self._state)
+        now = time.time()
+        stale_after = self.stale_after_seconds
+        if stale_after is None:
+            stale_after = STALE_INTERVALS * current_interval(
+                dt.datetime.fromtimestamp(now, dt.timezone.utc)
+            )
+        reference = state["last_success_at"] or state["started_at"]
+        state["healthy"] = now - reference <= stale_after
+        return state
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    server: "_HealthHTTPServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/health":
+            self._send(404, {"error": "Not found"})
+            return
+        state = self.server.health.to_dict()
+        self._send(200 if state["healthy"] else 503, state)
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class _HealthHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    health: DaemonHealth
+
+
+def start_health_server(
+    health: DaemonHealth,
+    host: str = DAEMON_HEALTH_HOST,
+    port: int = DAEMON_HEALTH_PORT,
+) -> ThreadingHTTPServer:
+    """Serve GET /health on a background thread.
+
+    Returns:
+        The running server; call shutdown() to stop it.
+    """
+    httpd = _HealthHTTPServer((host, port), _HealthHandler)
+    httpd.health = health
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+class ScraperDaemon:
+    """Runs the scraper on a schedule and publishes snapshots that pass validation."""
+
+    def __init__(self, health: Optional[DaemonHealth] = None, rng: Optional[random.Random] = None):
+        self.health = health or DaemonHealth()
+        self._rng = rng or random.Random()
+
+    def run_once(self) -> bool:
+        """Scrape, validate and publish one snapshot.
+
+        Returns:
+            True if a snapshot was published.
+        """
+        report = ScrapeReport()
+        try:
+            exams = scrape_exams(report)
+        except SystemExit:
+            # fetch_exams has already logged the failing page.
+            self.health.record_failure("scrape failed")
+            return False
+        except Exception as e:
+            logger.exception("Scrape failed")
+            self.health.record_failure(f"scrape failed: {e}")
+            return False
+
+        previous = _load_previous_snapshot(_resolve_output_path(OUTPUT_FILE))
+        problems = validate_snapshot(exams, len(previous) if previous else 0)
+        if problems:
+            logger.error(f"Not publishing snapshot of {len(exams)} exams: {'; '.join(problems)}")
+            self.health.record_failure(f"validation failed: {'; '.join(problems)}")
+            return False
+
+        try:
+            publish_exams(exams, report)
+        except Exception as e:
+            # Includes unreadable history (e.g. a corrupt manifest); the
+            # daemon keeps its schedule and health reports the failure.
+            logger.exception("Publishing snapshot failed")
+            self.health.record_failure(f"publish failed: {e}")
+            return False
+
+        logger.info(f"Published snapshot of {len(exams)} exams")
+        self.health.record_success(len(exams))
+        return True
+
+    def run_forever(self, stop: threading.Event) -> None:
+        """Run until `stop` is set, waiting a jittered interval between runs."""
+        while not stop.is_set():
+            published = self.run_once()
+            if published:
+                delay = next_delay(dt.datetime.now(dt.timezone.utc), self._rng)
+            else:
+                delay = DAEMON_FAILURE_BACKOFF_SECONDS
+            self.health.schedule(delay)
+            logger.info(f"Next scrape in {delay:.0f}s")
+            stop.wait(delay)
+
+
+def run_daemon() -> None:
+    """Hold the instance lock and run the daemon until SIGINT or SIGTERM.
+
+    Raises:
+        DaemonAlreadyRunning: If another daemon is running.
+    """
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    with InstanceLock(_resolve_output_path(DAEMON_LOCK_FILE)):
+        daemon = ScraperDaemon()
+        httpd = None
+        if DAEMON_HEALTH_PORT:
+            httpd = start_health_server(daemon.health)
+            logger.info(f"Daemon health at http://{DAEMON_HEALTH_HOST}:{DAEMON_HEALTH_PORT}/health")
+        try:
+            daemon.run_forever(stop)
+        finally:
+            if httpd is not None:
+                httpd.shutdown()
+                httpd.server_close()
@@ -1,11 +1,14 @@
 """UCR Final Exam Scraper - Core logic for fetching and parsing exam data."""
 
 import datetime as dt
+import hashlib
 import html
 import json
 import logging
+import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from zoneinfo import ZoneInfo
@@ -14,14 +17,25 @@ import requests
 
 from .config import (
     API_BASE_URL,
+    EMIT_INDEX_ARTIFACT,
     END_DATE,
+    HISTORY_DIR,
+    HISTORY_MAX_DELTAS,
     INDEX_END,
     INDEX_START,
     INDEX_STEP,
+    MAX_CONCURRENT_PAGES,
+    MAX_RETRIES,
     OUTPUT_FILE,
+    RECORD_HISTORY,
+    REPORT_FILE,
     REQUEST_DELAY_SECONDS,
+    RETRY_BACKOFF_SECONDS,
     START_DATE,
 )
+from .fields import SNAPSHOT_SCHEMA_VERSION, enrich_exam
+from .history import record_snapshot
+from .report import ScrapeReport
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -88,10 +102,36 @@ def _extract_event_rows(text: str) -> list[str]:
     )
 
 
-def _has_next_page_hint(text: str, next_index: int) -> bool:
-    # Heuristic: the day view HTML includes pagination links containing the next index.
-    # If the upstream stops exposing a link to index={next_index}, we treat that as end.
-    return bool(re.search(rf"\bindex={next_index}\b", text))
+# The pager's "N - M of T" label, as the entire text of an element.
+_PAGER_LABEL = re.compile(r">\s*(\d+)\s*[-–]\s*(\d+)\s+of\s+(\d+)\s*<")
+
+
+def _discover_page_indexes(text: str, index: int) -> list[int]:
+    """Return the later page offsets that a day-view page links to or implies.
+
+    Numbered pagination links name several offsets at once, and the pager's
+    "1 - 25 of 140" label names all of them. The label must be a whole text
+    node, so ranges in other text (dates, course titles) are not mistaken
+    for it. A page that only links to
+    the next offset yields just that one, so pagination degrades to the
+    serial next-page hint chain.
+
+    Args:
+        text: Page HTML.
+        index: Offset the page was fetched at.
+
+    Returns:
+        Sorted offsets after `index`, within the configured index bounds.
+    """
+
+    offsets = {int(value) for value in re.findall(r"\bindex=(\d+)\b", text)}
+
+    for first, last, total in _PAGER_LABEL.findall(text):
+        if 0 < int(first) <= int(last) <= int(total):
+            offsets.update(range(INDEX_START, int(total), INDEX_STEP))
+            break
+
+    return sorted(offset for offset in offsets if index < offset <= INDEX_END)
 
 
 def _parse_day_html(text: str, query_date: str) -> list[dict]:
@@ -165,9 +205,71 @@ def _parse_xhr_response(text: str, query_date: str) -> list[dict]:
     return _parse_day_html(text, query_date=query_date)
 
 
-def fetch_exams() -> list[dict]:
+def _is_transient(error: requests.RequestException) -> bool:
+    """Whether a failed request is worth retrying.
+
+    Connection errors, timeouts, 429 and 5xx responses are; other 4xx
+    responses and malformed requests will fail the same way again.
+    """
+
+    network_errors = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+    if isinstance(error, network_errors):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def _fetch_page(session: requests.Session, url: str) -> tuple[requests.Response, int]:
+    """GET a page, retrying transient failures.
+
+    Returns:
+        Tuple of the successful response and the number of retries used.
+
+    Raises:
+        requests.RequestException: If the last attempt still fails, or the
+            failure is not transient (see `_is_transient`).
+    """
+
+    retries = 0
+    while True:
+        try:
+            response = session.get(url, timeout=30)
+            response.raise_for_status()
+            return response, retries
+        except requests.RequestException as e:
+            if retries >= MAX_RETRIES or not _is_transient(e):
+                raise
+            retries += 1
+            logger.warning(f"Retrying ({retries}/{MAX_RETRIES}) after error fetching {url}: {e}")
+            time.sleep(RETRY_BACKOFF_SECONDS * retries)
+
+
+def _fetch_page_timed(session: requests.Session, url: str) -> tuple[requests.Response, int, float]:
+    """Like `_fetch_page`, also returning the seconds spent including retries."""
+
+    fetch_start = time.perf_counter()
+    response, retries = _fetch_page(session, url)
+    return response, retries, time.perf_counter() - fetch_start
+
+
+def fetch_exams(
+    report: Optional[ScrapeReport] = None,
+    base_url: Optional[str] = None,
+) -> list[dict]:
     """Fetch exam data for each date in the configured range.
 
+    Each date starts at INDEX_START. Offsets discovered from a page's
+    pagination links or total count are fetched concurrently (up to
+    MAX_CONCURRENT_PAGES at a time); a page that only hints at the next
+    offset is followed one page at a time. Rows are returned in offset order.
+
+    Args:
+        report: Optional report that receives per-page timing measurements.
+        base_url: Optional URL template overriding API_BASE_URL, e.g. a local
+            replay server. Must contain `{date}` and `{index}` placeholders.
+
     Returns:
         List of raw exam dictionaries from the upstream endpoint.
 
@@ -175,52 +277,80 @@ def fetch_exams() -> list[dict]:
         SystemExit: If an API request fails or parsing fails for a given date.
     """
 
+    url_template = base_url or API_BASE_URL
     dates = _iter_dates(START_DATE, END_DATE)
     logger.info(f"Fetching exams for date range {START_DATE}–{END_DATE} ({len(dates)} days)")
 
     all_exams: list[dict] = []
-    with requests.Session() as session:
+    with (
+        requests.Session() as session,
+        ThreadPoolExecutor(max_workers=max(1, MAX_CONCURRENT_PAGES)) as executor,
+    ):
         for date in dates:
             logger.info(f"Fetching exams for {date} (index {INDEX_START}..{INDEX_END} step {INDEX_STEP})")
 
-            for index in range(INDEX_START, INDEX_END + 1, INDEX_STEP):
-                url = API_BASE_URL.format(date=date, index=index)
-                logger.info(f"Fetching exams for {date} index={index}: {url}")
-
-                try:
-                    response = session.get(url, timeout=30)
-                    response.raise_for_status()
-                except requests.RequestException as e:
-                    status = getattr(getattr(e, "response", None), "status_code", None)
-                    logger.error(f"Failed to fetch exams (date={date} index={index} status={status}): {e}")
-                    raise SystemExit(1)
-
-                try:
-                    raw_exams = _parse_xhr_response(response.text, query_date=date)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to parse exams (date={date} index={index} status={response.status_code}): {e}"
-                    )
-                    raise SystemExit(1)
-
-                # Stop early if no event rows.
-                if not raw_exams:
-                    logger.info(f"No event rows found; stopping pagination for date={date} at index={index}")
-                    break
-
-                all_exams.extend(raw_exams)
-
-                # Stop early if the payload doesn't hint a next page.
-                next_index = index + INDEX_STEP
-                if next_index <= INDEX_END and not _has_next_page_hint(response.text, next_index=next_index):
-                    logger.info(
-                        f"No next page hint; stopping pagination for date={date} at index={index}"
-                    )
-                    break
-
-                if REQUEST_DELAY_SECONDS > 0:
+            # Fetch in waves: every offset linked from the previous wave's pages
+            # is requested at once. Pages without rows are not followed.
+            rows_by_index: dict[int, list[dict]] = {}
+            pending = [INDEX_START]
+            seen = set(pending)
+            while pending:
+                if len(pending) > 1:
+                    logger.info(f"Fetching {len(pending)} pages for {date} concurrently: index={pending}")
+                futures = []
+                for index in pending:
+                    url = url_template.format(date=date, index=index)
+                    logger.info(f"Fetching exams for {date} index={index}: {url}")
+                    futures.append(executor.submit(_fetch_page_timed, session, url))
+
+                discovered: set[int] = set()
+                for index, future in zip(pending, futures):
+                    try:
+                        response, retries, latency = future.result()
+                    except requests.RequestException as e:
+                        status = getattr(getattr(e, "response", None), "status_code", None)
+                        logger.error(f"Failed to fetch exams (date={date} index={index} status={status}): {e}")
+                        raise SystemExit(1)
+
+                    parse_start = time.perf_counter()
+                    try:
+                        raw_exams = _parse_xhr_response(response.text, query_date=date)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to parse exams (date={date} index={index} status={response.status_code}): {e}"
+                        )
+                        raise SystemExit(1)
+                    parse_seconds = time.perf_counter() - parse_start
+
+                    if report is not None:
+                        report.record_page(
+                            date=date,
+                            index=index,
+                            status=response.status_code,
+                            latency_seconds=latency,
+                            bytes_received=len(response.content),
+                            parse_seconds=parse_seconds,
+                            rows=len(raw_exams),
+                            retries=retries,
+                        )
+
+                    if not raw_exams:
+                        logger.info(f"No event rows found for date={date} at index={index}")
+                        continue
+
+                    rows_by_index[index] = raw_exams
+                    discovered.update(_discover_page_indexes(response.text, index))
+
+                pending = sorted(discovered - seen)
+                seen.update(pending)
+                if not pending:
+                    logger.info(f"No further page links; stopping pagination for date={date}")
+                elif REQUEST_DELAY_SECONDS > 0:
                     time.sleep(REQUEST_DELAY_SECONDS)
 
+            for index in sorted(rows_by_index):
+                all_exams.extend(rows_by_index[index])
+
     logger.info(f"Fetched {len(all_exams)} raw exams before dedupe")
     return all_exams
 
@@ -259,8 +389,22 @@ def _dedupe_key(parsed_exam: dict) -> str:
     )
 
 
+def _dedupe_exams(parsed_exams: list[dict]) -> list[dict]:
+    deduped: dict[str, dict] = {}
+    for exam in parsed_exams:
+        key = _dedupe_key(exam)
+        # Keep first occurrence; upstream duplicates should be identical.
+        deduped.setdefault(key, exam)
+
+    return list(deduped.values())
+
+
 def parse_exam(raw_exam: dict) -> Optional[dict]:
-    """Parse a raw exam dictionary into a structured record."""
+    """Parse a raw exam dictionary into a structured record.
+
+    The record carries the derived fields the API filters and searches on
+    (see fields.derive_fields) and its schema version.
+    """
 
     title = raw_exam.get("title", "")
 
@@ -289,7 +433,7 @@ def parse_exam(raw_exam: dict) -> Optional[dict]:
     if not course_name and title.startswith("EXAM:"):
         course_name = title.replace("EXAM:", "").strip()
 
-    return {
+    return enrich_exam({
         "subject": subject,
         "course_number": course_number,
         "section": section,
@@ -308,47 +452,141 @@ def parse_exam(raw_exam: dict) -> Optional[dict]:
         "start_time_display": raw_exam.get("start_time", ""),
         "end_time_display": raw_exam.get("end_time", ""),
         "classroom": raw_exam.get("classroom", raw_exam.get("location", "")),
-    }
+    })
+
+
+def _resolve_output_path(output_path: str) -> Path:
+    # Resolve path relative to this file's parent's parent (backend/)
+    backend_dir = Path(__file__).parent.parent
+    return backend_dir / output_path
 
 
-def save_exams(exams: list[dict], output_path: str = OUTPUT_FILE) -> None:
+def _load_previous_snapshot(full_path: Path) -> Optional[list[dict]]:
+    try:
+        with open(full_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logger.warning(f"Ignoring unreadable previous snapshot {full_path}: {e}")
+        return None
+
+
+def save_exams(
+    exams: list[dict],
+    output_path: str = OUTPUT_FILE,
+    emit_index: bool = False,
+    history_dir: Optional[str] = None,
+) -> None:
     """
     Save parsed exams to a JSON file.
 
     Args:
-        exams: List of parsed exam dictionaries
+        exams: List of parsed exam dictionaries; records without the current
+            schema's derived fields are enriched before saving
         output_path: Path to output file (relative to backend directory)
+        emit_index: Also write a prebuilt API search index next to the file,
+            checksummed against the saved snapshot
+        history_dir: If set, record the snapshot and its delta against the
+            file being replaced in this history directory (relative to
+            backend directory)
     """
-    # Resolve path relative to this file's parent's parent (backend/)
-    backend_dir = Path(__file__).parent.parent
-    full_path = backend_dir / output_path
+    full_path = _resolve_output_path(output_path)
 
     # Ensure directory exists
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(full_path, "w", encoding="utf-8") as f:
-        json.dump(exams, f, indent=2, ensure_ascii=False)
+    previous = _load_previous_snapshot(full_path) if history_dir else None
+
+    # Records from older parsers are brought up to the current schema.
+    exams = [
+        exam if exam.get("schema_version", 1) >= SNAPSHOT_SCHEMA_VERSION else enrich_exam(exam)
+        for exam in exams
+    ]
+
+    # Written next to the target and renamed over it, so readers such as the
+    # API's snapshot watcher never see a partially written file.
+    payload = json.dumps(exams, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp_path = full_path.with_name(full_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, full_path)
 
     logger.info(f"Saved {len(exams)} exams to {full_path}")
 
+    if emit_index:
+        # Imported lazily so the scraper has no API dependency unless asked.
+        from api.services.exam_index import write_index_artifact
+
+        index_path = write_index_artifact(exams, full_path, hashlib.sha256(payload).hexdigest())
+        logger.info(f"Saved search index to {index_path}")
+
+    if history_dir:
+        record_snapshot(previous, exams, _resolve_output_path(history_dir), HISTORY_MAX_DELTAS)
 
-def run_scraper() -> list[dict]:
-    """Main entry point: fetch, parse, dedupe, and save exams."""
 
-    raw_exams = fetch_exams()
+def save_report(report: ScrapeReport, output_path: str = REPORT_FILE) -> None:
+    """
+    Save a scraper run report to a JSON file.
+
+    Args:
+        report: Completed report for the run
+        output_path: Path to output file (relative to backend directory)
+    """
+    full_path = _resolve_output_path(output_path)
+    report.save(full_path)
+    logger.info(f"Saved run report to {full_path}")
+
+
+def scrape_exams(report: Optional[ScrapeReport] = None) -> list[dict]:
+    """Fetch, parse, and dedupe exams without saving them.
+
+    Args:
+        report: Optional report that receives page timings and row counts.
+
+    Returns:
+        Deduped list of parsed exam dictionaries.
+
+    Raises:
+        SystemExit: If fetching or parsing a page fails.
+    """
+
+    raw_exams = fetch_exams(report=report)
     parsed_exams = [parse_exam(exam) for exam in raw_exams]
 
     # Filter out any None results from failed parsing
     parsed_exams = [e for e in parsed_exams if e is not None]
 
-    deduped: dict[str, dict] = {}
-    for exam in parsed_exams:
-        key = _dedupe_key(exam)
-        # Keep first occurrence; upstream duplicates should be identical.
-        deduped.setdefault(key, exam)
-
-    final_exams = list(deduped.values())
+    final_exams = _dedupe_exams(parsed_exams)
     logger.info(f"Deduped to {len(final_exams)} exams")
 
-    save_exams(final_exams)
+    if report is not None:
+        report.record_dedupe(
+            raw_rows=len(raw_exams),
+            parsed_rows=len(parsed_exams),
+            deduped_rows=len(final_exams),
+        )
+    return final_exams
+
+
+def publish_exams(exams: list[dict], report: Optional[ScrapeReport] = None) -> None:
+    """Save a snapshot with its configured artifacts, then the run report."""
+
+    save_exams(
+        exams,
+        emit_index=EMIT_INDEX_ARTIFACT,
+        history_dir=HISTORY_DIR if RECORD_HISTORY else None,
+    )
+
+    if report is not None:
+        report.finish()
+        save_report(report)
+
+
+def run_scraper() -> list[dict]:
+    """Main entry point: fetch, parse, dedupe, and save exams."""
+
+    report = ScrapeReport()
+    final_exams = scrape_exams(report)
+    publish_exams(final_exams, report)
     return final_exams
@@ -0,0 +1,143 @@
+"""Derived fields stored in each snapshot record.
+
+The scraper computes these once per record so the API can index a snapshot
+without parsing dates or folding text again. They are internal: the API
+strips them before serving a record (see public_record). This module only
+uses the standard library so both sides can import it cheaply.
+"""
+
+import unicodedata
+from datetime import datetime
+from typing import Mapping
+
+# Separates fields in a search key so a query cannot match across fields.
+FIELD_SEPARATOR = "\x00"
+
+# Version of the derived fields stored in each record. Records from older
+# snapshots (without "schema_version") get them computed on load.
+SNAPSHOT_SCHEMA_VERSION = 2
+
+# Keys added to a record by enrich_exam.
+DERIVED_FIELDS = frozenset({
+    "building",
+    "room",
+    "date_iso",
+    "start_epoch",
+    "end_epoch",
+    "search_key",
+    "location_key",
+    "course_key",
+    "schema_version",
+})
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def extract_date(datetime_str: str) -> str | None:
+    """Extract date from ISO datetime string.
+
+    Args:
+        datetime_str: ISO datetime string (e.g., "2025-12-08T08:00:00").
+
+    Returns:
+        Date string in YYYY-MM-DD format, or None if invalid.
+    """
+    if not datetime_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(datetime_str)
+        return dt.strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def start_seconds(datetime_str: str) -> int | None:
+    """Convert an ISO datetime string to seconds since 1970-01-01T00:00.
+
+    Exam times are wall-clock campus times, so any UTC offset is ignored
+    and values sort the same way the times read.
+
+    Args:
+        datetime_str: ISO date or datetime (e.g., "2025-12-08T08:00:00").
+
+    Returns:
+        Seconds since the epoch, or None if invalid.
+    """
+    if not datetime_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(datetime_str)
+    except ValueError:
+        return None
+    return int((dt.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+
+def fold(text: str) -> str:
+    """Case- and accent-fold text for substring matching ("Café" -> "cafe")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def search_key(exam: dict) -> str:
+    """Build the folded key that free-text queries are matched against."""
+    return fold(FIELD_SEPARATOR.join((
+        exam.get("course_number", ""),
+        exam.get("course_name", ""),
+        exam.get("crn", ""),
+    )))
+
+
+def building_of(location: str) -> str:
+    """Extract the building code from a location (its first word)."""
+    location = location.strip()
+    parts = location.split()
+    return parts[0] if parts else location
+
+
+def derive_fields(exam: dict) -> dict:
+    """Compute the fields derived from a record's scraped fields.
+
+    Returns:
+        Dictionary with 'building' and 'room' (the location split at its
+        first word), 'date_iso', 'start_epoch' and 'end_epoch' (wall-clock
+        seconds as returned by start_seconds; None when a time is missing),
+        the folded 'search_key' and 'location_key', and 'course_key'
+        (e.g. "CS 010A").
+    """
+    location = exam.get("location", "").strip()
+    building = building_of(location)
+    start_time = exam.get("start_time", "")
+    return {
+        "building": building,
+        "room": location[len(building):].strip(),
+        "date_iso": extract_date(start_time),
+        "start_epoch": start_seconds(start_time),
+        "end_epoch": start_seconds(exam.get("end_time", "")),
+        "search_key": search_key(exam),
+        "location_key": fold(location),
+        "course_key": " ".join(
+            part for part in (exam.get("subject", ""), exam.get("course_number", "")) if part
+        ).upper(),
+    }
+
+
+def enrich_exam(exam: dict) -> dict:
+    """Return a copy of a record with its derived fields and schema version."""
+    return {**exam, **derive_fields(exam), "schema_version": SNAPSHOT_SCHEMA_VERSION}
+
+
+def derived_fields(exam: dict) -> Mapping:
+    """Return a record's derived fields, computing them for older records."""
+    if exam.get("schema_version", 1) >= SNAPSHOT_SCHEMA_VERSION:
+        return exam
+    return derive_fields(exam)
+
+
+def public_record(exam: dict) -> dict:
+    """Return a record without its derived fields, as clients receive it.
+
+    Records that were never enriched are returned as they are.
+    """
+    if "schema_version" not in exam:
+        return exam
+    return {key: value for key, value in exam.items() if key not in DERIVED_FIELDS}
@@ -0,0 +1,161 @@
+"""Versioned snapshot history with per-record deltas.
+
+Every saved snapshot that differs from the previous one gets the next
+version number and a delta file describing what changed, keyed by each
+record's event id. Only the most recent deltas are kept; clients that fall
+further behind must download the full snapshot again.
+
+Layout (relative to the history directory):
+    manifest.json          {"version": N, "deltas": [oldest, ..., N], "updated_at": ...}
+    <version>.delta.json   {"version": V, "previous": V - 1, "created_at": ...,
+                            "added": {key: record}, "changed": {key: record},
+                            "removed": [keys]}
+
+A record's key is its event id (see record_key).
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .fields import public_record
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+def record_key(exam: dict) -> str:
+    """Return the stable identity of a record across snapshots.
+
+    Uses the 25Live event id, falling back to the fields the scraper dedupes
+    on for records without one.
+    """
+    event_id = exam.get("event_id")
+    if event_id:
+        return str(event_id)
+
+    return "|".join(
+        str(exam.get(field, ""))
+        for field in ("subject", "course_number", "section", "crn", "start_time", "location")
+    )
+
+
+def diff_snapshots(previous: list[dict], current: list[dict]) -> dict:
+    """Compute the per-record changes between two snapshots.
+
+    Records are compared and stored as clients see them, so a change in
+    derived fields alone (e.g. a schema version bump) is not a change.
+
+    Args:
+        previous: Records of the older snapshot.
+        current: Records of the newer snapshot.
+
+    Returns:
+        Dictionary with "added" and "changed" (current records by key, in
+        snapshot order) and "removed" (keys of records no longer present).
+    """
+    previous_by_key = {record_key(exam): public_record(exam) for exam in previous}
+    current_keys = set()
+    added = {}
+    changed = {}
+
+    for exam in map(public_record, current):
+        key = record_key(exam)
+        current_keys.add(key)
+        old = previous_by_key.get(key)
+        if old is None:
+            added[key] = exam
+        elif old != exam:
+            changed[key] = exam
+
+    removed = [key for key in previous_by_key if key not in current_keys]
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def delta_path(history_dir: Path, version: int) -> Path:
+    """Return where the delta that produced a version is stored."""
+    return history_dir / f"{version}.delta.json"
+
+
+def load_manifest(history_dir: Path) -> dict:
+    """Load the history manifest, or an empty history at version 0."""
+    try:
+        with open(history_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"version": 0, "deltas": [], "updated_at": None}
+
+
+def record_snapshot(
+    previous: Optional[list[dict]],
+    current: list[dict],
+    history_dir: Path,
+    max_deltas: int,
+) -> int:
+    """Record a new snapshot in the history if it differs from the previous one.
+
+    The delta is written before the manifest that announces it, so readers
+    never see a version whose delta is missing.
+
+    Args:
+        previous: Records of the snapshot being replaced, or None if there
+            was none. Without a previous snapshot, or on the first recorded
+            version, the new snapshot becomes a base version without a delta.
+        current: Records of the new snapshot.
+        history_dir: Directory holding the manifest and deltas.
+        max_deltas: Number of most recent deltas to keep.
+
+    Returns:
+        The snapshot's version number.
+    """
+    history_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(history_dir)
+    version = manifest["version"]
+
+    if previous is None or version == 0:
+        changes = None
+    else:
+        changes = diff_snapshots(previous, current)
+        if not any(changes.values()):
+            logger.info(f"Snapshot unchanged; history stays at version {version}")
+            return version
+
+    version += 1
+    now = time.time()
+    deltas = manifest["deltas"]
+    if changes is None:
+        # There is nothing to diff against, so every older delta is unusable.
+        deltas = []
+    else:
+        _write_json(delta_path(history_dir, version), {
+            "version": version,
+            "previous": version - 1,
+            "created_at": now,
+            **changes,
+        })
+        deltas = deltas + [version]
+
+    deltas = deltas[-max_deltas:] if max_deltas > 0 else []
+    _write_json(history_dir / MANIFEST_FILE, {"version": version, "deltas": deltas, "updated_at": now})
+
+    # Deltas are removed only after the manifest stops announcing them.
+    for old_version in set(manifest["deltas"] + [version]) - set(deltas):
+        delta_path(history_dir, old_version).unlink(missing_ok=True)
+
+    if changes is not None:
+        logger.info(
+            f"Recorded snapshot version {version}: {len(changes['added'])} added, "
+            f"{len(changes['changed'])} changed, {len(changes['removed'])} removed"
+        )
+    return version
@@ -0,0 +1,453 @@
+"""SQLite-backed job queue for multi-term, multi-calendar backfill scraping.
+
+Each job is one (calendar, date, index) day-view page. Workers lease jobs,
+fetch the page into a per-calendar replay corpus and enqueue the further
+page offsets it links to. A worker that dies simply lets its lease expire,
+after which the job is handed out again; a job that keeps failing is
+marked failed after BACKFILL_MAX_ATTEMPTS. Because all state lives in the
+queue database, a backfill can be paused, resumed, spread over several
+processes and monitored while it runs. Once drained, `publish` parses the
+fetched pages through the normal parse/dedupe/save path (scraper.backfill).
+
+Usage:
+    python -m scraper.jobs enqueue --start 20241207 --end 20241213 [--calendar NAME]
+    python -m scraper.jobs work [--workers 4]
+    python -m scraper.jobs status
+    python -m scraper.jobs pause | resume | retry-failed
+    python -m scraper.jobs publish [--output data/backfill.json]
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from .backfill import iter_corpus_pages, parse_pages
+from .config import (
+    BACKFILL_LEASE_SECONDS,
+    BACKFILL_MAX_ATTEMPTS,
+    BACKFILL_OUTPUT_FILE,
+    BACKFILL_PAGES_DIR,
+    BACKFILL_QUEUE_FILE,
+    BACKFILL_QUEUE_WORKERS,
+    CALENDAR,
+    CALENDAR_URL_TEMPLATE,
+    INDEX_START,
+    REQUEST_DELAY_SECONDS,
+)
+from .exam_scraper import (
+    _discover_page_indexes,
+    _extract_event_rows,
+    _fetch_page,
+    _iter_dates,
+    _resolve_output_path,
+    save_exams,
+)
+from .replay import ReplayCorpus
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ("pending", "leased", "done", "failed")
+
+# How long an idle worker waits before checking for jobs other workers add.
+IDLE_POLL_SECONDS = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    calendar TEXT NOT NULL,
+    date TEXT NOT NULL,
+    page_index INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    rows INTEGER,
+    last_error TEXT,
+    updated_at REAL NOT NULL,
+    UNIQUE (calendar, date, page_index)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class Job:
+    """One leased day-view page."""
+
+    def __init__(self, job_id: int, calendar: str, date: str, index: int, attempts: int):
+        self.id = job_id
+        self.calendar = calendar
+        self.date = date
+        self.index = index
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return f"Job({self.id}, {self.calendar!r}, {self.date!r}, index={self.index})"
+
+
+class JobQueue:
+    """Durable queue of page fetch jobs in a SQLite database.
+
+    Each instance holds its own connection, so give every worker thread its
+    own queue object. Writers serialize on SQLite's database lock.
+    """
+
+    def __init__(self, path: str | Path, max_attempts: int = BACKFILL_MAX_ATTEMPTS):
+        """Open (and create if needed) the queue database.
+
+        Args:
+            path: Queue database file.
+            max_attempts: Leases a job gets before it is marked failed.
+        """
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; multi-statement updates use explicit transactions.
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the queue's connection."""
+        self._conn.close()
+
+    def _begin(self) -> None:
+        # Take the write lock up front so two workers never lease the same job.
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def enqueue(self, calendar: str, date: str, index: int = INDEX_START) -> bool:
+        """Add a page job unless it is already queued.
+
+        Returns:
+            True if the job is new.
+        """
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO jobs (calendar, date, page_index, updated_at) VALUES (?, ?, ?, ?)",
+            (calendar, date, index, time.time()),
+        )
+        return cursor.rowcount == 1
+
+    def enqueue_range(self, calendar: str, start: str, end: str) -> int:
+        """Queue the first page of every date in an inclusive YYYYMMDD range.
+
+        Returns:
+            Number of new jobs.
+        """
+        self._begin()
+        try:
+            added = sum(self.enqueue(calendar, date) for date in _iter_dates(start, end))
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return added
+
+    def lease(
+        self,
+        owner: str,
+        lease_seconds: float = BACKFILL_LEASE_SECONDS,
+        now: Optional[float] = None,
+    ) -> Optional[Job]:
+        """Hand out the oldest available job.
+
+        Jobs are available when pending or when their lease has expired.
+        Expired jobs that already used every attempt are marked failed.
+
+        Args:
+            owner: Identifies the worker taking the lease.
+            lease_seconds: Time the worker has to complete or fail the job.
+            now: Current time, for tests.
+
+        Returns:
+            The leased job, or None if the queue is paused or has no
+            available job.
+        """
+        now = time.time() if now is None else now
+        self._begin()
+        try:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'failed', lease_owner = NULL, last_error = 'lease expired', "
+                "updated_at = ? WHERE status = 'leased' AND lease_expires_at <= ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            if self.paused():
+                row = None
+            else:
+                row = self._conn.execute(
+                    "SELECT id, calendar, date, page_index, attempts FROM jobs "
+                    "WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at <= ?) "
+                    "ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires_at = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (owner, now + lease_seconds, now, row[0]),
+                )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+        if row is None:
+            return None
+        job_id, calendar, date, index, attempts = row
+        return Job(job_id, calendar, date, index, attempts + 1)
+
+    def complete(self, job: Job, owner: str, rows: int, next_indexes: list[int] = ()) -> bool:
+        """Mark a leased job done and queue the pages it links to.
+
+        Returns:
+            False if the lease was lost (expired and taken by another
+            worker), in which case nothing is recorded.
+        """
+        self._begin()
+        try:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'done', lease_owner = NULL, rows = ?, last_error = NULL, "
+                "updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (rows, time.time(), job.id, owner),
+            )
+            completed = cursor.rowcount == 1
+            if completed:
+                for index in next_indexes:
+                    self.enqueue(job.calendar, job.date, index)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return completed
+
+    def fail(self, job: Job, owner: str, error: str) -> None:
+        """Release a leased job after an error, to be retried or marked failed."""
+        status = "failed" if job.attempts >= self.max_attempts else "pending"
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, lease_owner = NULL, last_error = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (status, error, time.time(), job.id, owner),
+        )
+
+    def retry_failed(self) -> int:
+        """Return failed jobs to pending with a fresh attempt budget.
+
+        Returns:
+            Number of jobs requeued.
+        """
+        cursor = self._conn.execute(
+            "UPDATE jobs SET status = 'pending', attempts = 0, updated_at = ? WHERE status = 'failed'",
+            (time.time(),),
+        )
+        return cursor.rowcount
+
+    def paused(self) -> bool:
+        """Return whether leasing is paused."""
+        row = self._conn.execute("SELECT value FROM settings WHERE key = 'paused'").fetchone()
+        return row is not None and row[0] == "1"
+
+    def set_paused(self, paused: bool) -> None:
+        """Pause or resume leasing for every worker using this queue."""
+        self._conn.execute(
+            "INSERT INTO settings (key, value) VALUES ('paused', ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            ("1" if paused else "0",),
+        )
+
+    def status(self) -> dict:
+        """Summarize the queue for monitoring.
+
+        Returns:
+            Dictionary with 'paused', job counts per status, per-calendar
+            counts and fetched 'rows'.
+        """
+        totals = {status: 0 for status in JOB_STATUSES}
+        calendars: dict[str, dict] = {}
+        for calendar, status, count in self._conn.execute(
+            "SELECT calendar, status, COUNT(*) FROM jobs GROUP BY calendar, status"
+        ):
+            totals[status] += count
+            calendars.setdefault(calendar, {s: 0 for s in JOB_STATUSES})[status] = count
+        rows = self._conn.execute("SELECT COALESCE(SUM(rows), 0) FROM jobs").fetchone()[0]
+        return {"paused": self.paused(), "jobs": totals, "calendars": calendars, "rows": rows}
+
+    def drained(self) -> bool:
+        """Return whether no job is pending or leased."""
+        row = self._conn.execute(
+            "SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1"
+        ).fetchone()
+        return row is None
+
+
+def calendar_corpus(pages_dir: str | Path, calendar: str) -> ReplayCorpus:
+    """Return the replay corpus holding one calendar's fetched pages."""
+    return ReplayCorpus(Path(pages_dir) / calendar)
+
+
+def run_worker(
+    queue: JobQueue,
+    pages_dir: str | Path,
+    stop: threading.Event,
+    url_template: str = CALENDAR_URL_TEMPLATE,
+    lease_seconds: float = BACKFILL_LEASE_SECONDS,
+) -> int:
+    """Process jobs until the queue is drained or paused, or `stop` is set.
+
+    Args:
+        queue: This worker's queue connection.
+        pages_dir: Directory holding one replay corpus per calendar.
+        stop: Set to make the worker return after its current job.
+        url_template: Page URL with {calendar}, {date} and {index} placeholders.
+        lease_seconds: Lease length per job.
+
+    Returns:
+        Number of jobs this worker completed.
+    """
+    owner = f"{uuid.uuid4().hex[:8]}-{threading.get_ident()}"
+    completed = 0
+
+    with requests.Session() as session:
+        while not stop.is_set():
+            job = queue.lease(owner, lease_seconds)
+            if job is None:
+                if queue.paused() or queue.drained():
+                    break
+                # Other workers hold the remaining jobs and may still add more.
+                stop.wait(IDLE_POLL_SECONDS)
+                continue
+
+            url = url_template.format(calendar=job.calendar, date=job.date, index=job.index)
+            try:
+                response, _ = _fetch_page(session, url)
+            except requests.RequestException as e:
+                logger.warning(f"{job} failed (attempt {job.attempts}): {e}")
+                queue.fail(job, owner, str(e))
+                continue
+
+            rows = len(_extract_event_rows(response.text))
+            calendar_corpus(pages_dir, job.calendar).save_page(job.date, job.index, response.text)
+            # Pages without rows end the date, as in fetch_exams.
+            next_indexes = _discover_page_indexes(response.text, job.index) if rows else []
+            if queue.complete(job, owner, rows, next_indexes):
+                completed += 1
+                logger.info(f"{job} done: {rows} rows, {len(next_indexes)} linked pages")
+
+            if REQUEST_DELAY_SECONDS > 0:
+                stop.wait(REQUEST_DELAY_SECONDS)
+
+    return completed
+
+
+def run_workers(
+    queue_path: str | Path,
+    pages_dir: str | Path,
+    workers: int = BACKFILL_QUEUE_WORKERS,
+    stop: Optional[threading.Event] = None,
+    url_template: str = CALENDAR_URL_TEMPLATE,
+) -> int:
+    """Run worker threads, each with its own queue connection, until they finish.
+
+    Returns:
+        Number of jobs completed.
+    """
+    stop = stop or threading.Event()
+    counts = [0] * workers
+
+    def work(slot: int) -> None:
+        queue = JobQueue(queue_path)
+        try:
+            counts[slot] = run_worker(queue, pages_dir, stop, url_template=url_template)
+        finally:
+            queue.close()
+
+    threads = [threading.Thread(target=work, args=(slot,), daemon=True) for slot in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(timeout=0.5)
+    except KeyboardInterrupt:
+        logger.info("Stopping workers after their current jobs")
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return sum(counts)
+
+
+def publish_backfill(pages_dir: str | Path, output_path: str = BACKFILL_OUTPUT_FILE) -> list[dict]:
+    """Parse, dedupe and save every fetched page across all calendars.
+
+    Returns:
+        The saved exams.
+    """
+    pages = []
+    for corpus_dir in sorted(Path(pages_dir).iterdir()):
+        if corpus_dir.is_dir():
+            pages.extend(iter_corpus_pages(corpus_dir))
+    exams = parse_pages(pages)
+    save_exams(exams, output_path=output_path)
+    return exams
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """CLI entry point for managing and running the backfill queue."""
+    parser = argparse.ArgumentParser(prog="python -m scraper.jobs")
+    parser.add_argument("--queue", default=BACKFILL_QUEUE_FILE)
+    parser.add_argument("--pages", default=BACKFILL_PAGES_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Queue every date of a term window")
+    enqueue_parser.add_argument("--calendar", default=CALENDAR)
+    enqueue_parser.add_argument("--start", required=True, help="First date (YYYYMMDD)")
+    enqueue_parser.add_argument("--end", required=True, help="Last date (YYYYMMDD)")
+
+    work_parser = subparsers.add_parser("work", help="Fetch queued pages until drained or paused")
+    work_parser.add_argument("--workers", type=int, default=BACKFILL_QUEUE_WORKERS)
+
+    subparsers.add_parser("status", help="Print job counts")
+    subparsers.add_parser("pause", help="Stop handing out jobs")
+    subparsers.add_parser("resume", help="Hand out jobs again")
+    subparsers.add_parser("retry-failed", help="Requeue failed jobs")
+
+    publish_parser = subparsers.add_parser("publish", help="Parse fetched pages into a snapshot")
+    publish_parser.add_argument("--output", default=BACKFILL_OUTPUT_FILE)
+
+    args = parser.parse_args(argv)
+    queue_path = _resolve_output_path(args.queue)
+    pages_dir = _resolve_output_path(args.pages)
+
+    if args.command == "work":
+        completed = run_workers(queue_path, pages_dir, workers=args.workers)
+        print(f"Completed {completed} jobs")
+        return
+    if args.command == "publish":
+        exams = publish_backfill(pages_dir, output_path=args.output)
+        print(f"Saved {len(exams)} exams to {args.output}")
+        return
+
+    queue = JobQueue(queue_path)
+    try:
+        if args.command == "enqueue":
+            added = queue.enqueue_range(args.calendar, args.start, args.end)
+            print(f"Queued {added} new jobs for {args.calendar} {args.start}–{args.end}")
+        elif args.command in ("pause", "resume"):
+            queue.set_paused(args.command == "pause")
+            print(f"Queue {args.command}d")
+        elif args.command == "retry-failed":
+            print(f"Requeued {queue.retry_failed()} failed jobs")
+        else:
+            print(json.dumps(queue.status(), indent=2))
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""Offline replay harness for the 25Live day-view endpoint.
+
+Records real XHR day-view responses into a fixture corpus and serves them
+from a local stand-in HTTP server, so `fetch_exams` can be benchmarked and
+load-tested without touching 25livepub.collegenet.com.
+
+Usage:
+    python -m scraper.replay record [--corpus data/replay]
+    python -m scraper.replay serve [--corpus data/replay] [--port 8025]
+        [--latency 0.05] [--jitter 0.02] [--error-rate 0.05]
+    python -m scraper.replay bench [--corpus data/replay] [--latency 0.05]
+        [--error-rate 0.05]
+
+Corpus layout (relative to the corpus directory):
+    <YYYYMMDD>/<index>.html   one recorded page per date and index offset
+    <YYYYMMDD>.html           a whole day's rows, sliced into pages on demand
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from .config import (
+    API_BASE_URL,
+    END_DATE,
+    INDEX_START,
+    INDEX_STEP,
+    REPLAY_CORPUS_DIR,
+    REQUEST_DELAY_SECONDS,
+    START_DATE,
+)
+from .exam_scraper import (
+    _dedupe_exams,
+    _discover_page_indexes,
+    _extract_event_rows,
+    _fetch_page,
+    _iter_dates,
+    _resolve_output_path,
+    fetch_exams,
+    parse_exam,
+)
+from .report import ScrapeReport
+
+logger = logging.getLogger(__name__)
+
+# Served when neither a recorded page nor a full-day capture exists.
+EMPTY_DAY_HTML = "<html>No events</html>"
+
+
+class ReplayCorpus:
+    """Read-only view over a directory of recorded day-view pages."""
+
+    def __init__(self, root: str | Path, page_size: int = INDEX_STEP):
+        """Initialize the corpus.
+
+        Args:
+            root: Corpus directory.
+            page_size: Rows per page when slicing full-day captures.
+        """
+        self.root = Path(root)
+        self.page_size = page_size
+
+    def page(self, date: str, index: int) -> Optional[str]:
+        """Return the page body for a date and index offset.
+
+        Recorded pages are returned verbatim. Otherwise a full-day capture is
+        sliced into `page_size` rows, with a next-page link appended while
+        more rows remain, mirroring the upstream pagination hints.
+
+        Returns:
+            HTML body, or None if the corpus has nothing for this date.
+        """
+        recorded = self.root / date / f"{index}.html"
+        if recorded.exists():
+            return recorded.read_text(encoding="utf-8")
+
+        full_day = self.root / f"{date}.html"
+        if not full_day.exists():
+            return None
+
+        rows = _extract_event_rows(full_day.read_text(encoding="utf-8"))
+        page_rows = rows[index:index + self.page_size]
+        if not page_rows:
+            return EMPTY_DAY_HTML
+
+        body = "".join(page_rows)
+        next_index = index + self.page_size
+        if next_index < len(rows):
+            body += f'<a href="s.aspx?date={date}&index={next_index}&spudformat=xhr">Next</a>'
+        return body
+
+    def save_page(self, date: str, index: int, text: str) -> Path:
+        """Store a recorded page in the corpus."""
+        path = self.root / date / f"{index}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        return path
+
+
+def record_corpus(
+    corpus: ReplayCorpus,
+    start: str = START_DATE,
+    end: str = END_DATE,
+    base_url: Optional[str] = None,
+) -> int:
+    """Fetch every day-view page in a date range and save it to the corpus.
+
+    Pages are discovered the same way as in `fetch_exams`: every offset
+    linked or implied by a page with rows (see `_discover_page_indexes`),
+    wave by wave, so the corpus holds each page `fetch_exams` will request.
+
+    Returns:
+        Number of pages recorded.
+    """
+    url_template = base_url or API_BASE_URL
+    recorded = 0
+
+    with requests.Session() as session:
+        for date in _iter_dates(start, end):
+            pending = [INDEX_START]
+            seen = set(pending)
+            while pending:
+                discovered: set[int] = set()
+                for index in pending:
+                    url = url_template.format(date=date, index=index)
+                    response, _ = _fetch_page(session, url)
+                    corpus.save_page(date, index, response.text)
+                    recorded += 1
+                    logger.info(f"Recorded date={date} index={index} ({len(response.content)} bytes)")
+
+                    if _extract_event_rows(response.text):
+                        discovered.update(_discover_page_indexes(response.text, index))
+
+                pending = sorted(discovered - seen)
+                seen.update(pending)
+                if pending and REQUEST_DELAY_SECONDS > 0:
+                    time.sleep(REQUEST_DELAY_SECONDS)
+
+    return recorded
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: "_StandInHTTPServer"
+
+    def do_GET(self) -> None:
+        stand_in = self.server.stand_in
+        params = parse_qs(urlparse(self.path).query)
+        date = params.get("date", [""])[0]
+        try:
+            index = int(params.get("index", ["0"])[0])
+        except ValueError:
+            index = -1
+
+        stand_in.wait()
+
+        if stand_in.should_fail():
+            self._send(stand_in.error_status, "Injected error")
+            return
+        if not date or index < 0:
+            self._send(400, "Missing or invalid date/index")
+            return
+
+        body = stand_in.corpus.page(date, index)
+        self._send(200, body if body is not None else EMPTY_DAY_HTML)
+
+    def _send(self, status: int, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format, *args)
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: "StandInServer"
+
+
+class StandInServer:
+    """Local HTTP server that imitates the 25Live XHR day-view endpoint."""
+
+    def __init__(
+        self,
+        corpus: ReplayCorpus,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            corpus: Pages to serve.
+            latency_seconds: Fixed delay added to every response.
+            jitter_seconds: Extra uniform random delay, up to this many seconds.
+            error_rate: Fraction of requests (0.0-1.0) answered with `error_status`.
+            error_status: HTTP status used for injected errors.
+            seed: Seed for jitter and error injection, for reproducible runs.
+            host: Interface to bind.
+            port: Port to bind; 0 picks a free port.
+        """
+        self.corpus = corpus
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = _StandInHTTPServer((host, port), _StandInHandler)
+        self._httpd.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL template accepted by `fetch_exams(base_url=...)`."""
+        host, port = self._httpd.server_address[:2]
+        return (
+            f"http://{host}:{port}/s.aspx?calendar=final-exam-calendar"
+            "&widget=main&date={date}&index={index}&spudformat=xhr"
+        )
+
+    def wait(self) -> None:
+        """Sleep for the configured latency plus jitter."""
+        with self._lock:
+            self.requests_served += 1
+            delay = self.latency_seconds
+            if self.jitter_seconds > 0:
+                delay += self._rng.uniform(0, self.jitter_seconds)
+        if delay > 0:
+            time.sleep(delay)
+
+    def should_fail(self) -> bool:
+        """Decide whether to inject an error into the current response."""
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors_injected += 1
+        return failed
+
+    def start(self) -> "StandInServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def _build_server(args: argparse.Namespace) -> StandInServer:
+    return StandInServer(
+        ReplayCorpus(_resolve_output_path(args.corpus)),
+        latency_seconds=args.latency,
+        jitter_seconds=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        port=args.port,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """CLI entry point for recording, serving and benchmarking."""
+    parser = argparse.ArgumentParser(prog="python -m scraper.replay")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record upstream pages into the corpus")
+    record_parser.add_argument("--corpus", default=REPLAY_CORPUS_DIR)
+    record_parser.add_argument("--start", default=START_DATE)
+    record_parser.add_argument("--end", default=END_DATE)
+
+    for name, help_text in (
+        ("serve", "Serve the corpus from a local stand-in server"),
+        ("bench", "Run fetch_exams against a stand-in server and print its report"),
+    ):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--corpus", default=REPLAY_CORPUS_DIR)
+        sub.add_argument("--port", type=int, default=8025 if name == "serve" else 0)
+        sub.add_argument("--latency", type=float, default=0.0)
+        sub.add_argument("--jitter", type=float, default=0.0)
+        sub.add_argument("--error-rate", type=float, default=0.0)
+        sub.add_argument("--seed", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        corpus = ReplayCorpus(_resolve_output_path(args.corpus))
+        count = record_corpus(corpus, start=args.start, end=args.end)
+        print(f"Recorded {count} pages into {corpus.root}")
+        return
+
+    server = _build_server(args)
+    if args.command == "serve":
+        print(f"Serving {server.corpus.root} at {server.base_url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    report = ScrapeReport()
+    with server:
+        raw_exams = fetch_exams(report=report, base_url=server.base_url)
+    parsed_exams = [e for e in (parse_exam(exam) for exam in raw_exams) if e is not None]
+    final_exams = _dedupe_exams(parsed_exams)
+    report.record_dedupe(
+        raw_rows=len(raw_exams),
+        parsed_rows=len(parsed_exams),
+        deduped_rows=len(final_exams),
+    )
+    report.finish()
+    summary = report.to_dict()
+    summary["server"] = {
+        "requests_served": server.requests_served,
+        "errors_injected": server.errors_injected,
+    }
+    del summary["pages"]
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
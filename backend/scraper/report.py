@@ -0,0 +1,101 @@
+"""Structured per-run timing report for the exam scraper."""
+
+import json
+import time
+from pathlib import Path
+
+
+class ScrapeReport:
+    """Collects per-page fetch/parse measurements for a single scraper run."""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.wall_seconds: float | None = None
+        self.pages: list[dict] = []
+        self.raw_rows = 0
+        self.parsed_rows = 0
+        self.deduped_rows = 0
+
+    def record_page(
+        self,
+        date: str,
+        index: int,
+        status: int | None,
+        latency_seconds: float,
+        bytes_received: int,
+        parse_seconds: float,
+        rows: int,
+        retries: int,
+    ) -> None:
+        """Record the measurements for one fetched page."""
+        self.pages.append(
+            {
+                "date": date,
+                "index": index,
+                "status": status,
+                "latency_seconds": round(latency_seconds, 6),
+                "bytes": bytes_received,
+                "parse_seconds": round(parse_seconds, 6),
+                "rows": rows,
+                "retries": retries,
+            }
+        )
+
+    def record_dedupe(self, raw_rows: int, parsed_rows: int, deduped_rows: int) -> None:
+        """Record row counts before and after parsing and dedupe."""
+        self.raw_rows = raw_rows
+        self.parsed_rows = parsed_rows
+        self.deduped_rows = deduped_rows
+
+    def finish(self) -> None:
+        """Stop the run's wall-clock timer."""
+        self.wall_seconds = time.perf_counter() - self._start
+
+    def _date_summaries(self) -> dict[str, dict]:
+        dates: dict[str, dict] = {}
+        for page in self.pages:
+            summary = dates.setdefault(
+                page["date"],
+                {
+                    "pages": 0,
+                    "latency_seconds": 0.0,
+                    "bytes": 0,
+                    "parse_seconds": 0.0,
+                    "rows": 0,
+                    "retries": 0,
+                },
+            )
+            summary["pages"] += 1
+            summary["latency_seconds"] = round(summary["latency_seconds"] + page["latency_seconds"], 6)
+            summary["bytes"] += page["bytes"]
+            summary["parse_seconds"] = round(summary["parse_seconds"] + page["parse_seconds"], 6)
+            summary["rows"] += page["rows"]
+            summary["retries"] += page["retries"]
+        return dates
+
+    def to_dict(self) -> dict:
+        """Return the report as a JSON-serializable dictionary."""
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall_seconds, 6) if self.wall_seconds is not None else None,
+            "totals": {
+                "pages": len(self.pages),
+                "bytes": sum(page["bytes"] for page in self.pages),
+                "latency_seconds": round(sum(page["latency_seconds"] for page in self.pages), 6),
+                "parse_seconds": round(sum(page["parse_seconds"] for page in self.pages), 6),
+                "retries": sum(page["retries"] for page in self.pages),
+                "raw_rows": self.raw_rows,
+                "parsed_rows": self.parsed_rows,
+                "deduped_rows": self.deduped_rows,
+                "dedupe_dropped": self.parsed_rows - self.deduped_rows,
+            },
+            "dates": self._date_summaries(),
+            "pages": self.pages,
+        }
+
+    def save(self, full_path: Path) -> None:
+        """Write the report as JSON to an absolute path."""
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -83,10 +83,12 @@ def app(mock_repository, monkeypatch):
     # Patch the global exam service to use our mock repository
     from api.routes import exams as exams_module
     from api.routes import filters as filters_module
+    from api.routes import suggest as suggest_module
     
     mock_service = ExamService(repository=mock_repository)
     monkeypatch.setattr(exams_module, "_exam_service", mock_service)
     monkeypatch.setattr(filters_module, "_exam_service", mock_service)
+    monkeypatch.setattr(suggest_module, "_exam_service", mock_service)
     
     app = create_app({"TESTING": True})
     return app
@@ -70,6 +70,49 @@ class TestExamsEndpoint:
         data = response.get_json()
         assert len(data["data"]) == 1
     
+    def test_filter_by_subject_and_building(self, client):
+        """Test exact subject and building filters."""
+        response = client.get("/api/exams?subject=MATH&building=ssc")
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [exam["crn"] for exam in data["data"]] == ["35359"]
+    
+    def test_facet_counts(self, client):
+        """Test requesting facet counts with the results."""
+        response = client.get("/api/exams?q=CALC&facets=date,building")
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["facets"]["date"] == {"2025-12-08": 2}
+        assert data["facets"]["building"] == {"BRNHL": 1, "SSC": 1}
+    
+    def test_invalid_facet(self, client):
+        """Test that unknown facets are rejected."""
+        response = client.get("/api/exams?facets=date,seats")
+        
+        assert response.status_code == 400
+    
+    def test_time_filters(self, client):
+        """Test start window and time-of-day filters."""
+        response = client.get("/api/exams?start_after=2025-12-09&time_of_day=morning")
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [exam["crn"] for exam in data["data"]] == ["54321"]
+    
+    @pytest.mark.parametrize("params", [
+        "start_after=tomorrow",
+        "start_before=2025-13-01",
+        "time_of_day=night",
+        "time_of_day=11:00-09:00",
+    ])
+    def test_invalid_time_filters(self, client, params):
+        """Test that malformed time filters are rejected."""
+        response = client.get(f"/api/exams?{params}")
+        
+        assert response.status_code == 400
+    
     def test_combined_filters(self, client):
         """Test combining search and filters."""
         response = client.get("/api/exams?q=CALC&date=2025-12-08")
@@ -178,6 +221,30 @@ class TestFiltersEndpoints:
             assert len(location["rooms"]) > 0
 
 
+class TestSuggestEndpoint:
+    """Tests for the typeahead suggestion endpoint."""
+    
+    def test_suggest(self, client):
+        """Test getting suggestions for a prefix."""
+        response = client.get("/api/suggest?q=phy")
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["data"][0] == {"value": "PHYS", "type": "subject", "count": 1}
+    
+    def test_suggest_limit(self, client):
+        """Test that the limit parameter caps the number of suggestions."""
+        response = client.get("/api/suggest?q=m&limit=2")
+        
+        assert len(response.get_json()["data"]) == 2
+    
+    def test_suggest_invalid_limit(self, client):
+        """Test error for a non-integer limit."""
+        response = client.get("/api/suggest?q=m&limit=abc")
+        
+        assert response.status_code == 400
+
+
 class TestErrorHandling:
     """Tests for error handling."""
     
@@ -0,0 +1,104 @@
+"""Smoke tests for the synthetic datasets and benchmark suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+from benchmarks.datasets import generate_exams
+from benchmarks.loadgen import LoadProfile, generate_sessions, run_wsgi_load
+from benchmarks.suite import compare, measure, run_suite
+
+
+class TestSyntheticDatasets:
+    """Tests for the synthetic dataset generator."""
+    
+    def test_generation_is_deterministic(self):
+        """Test that the same seed yields identical datasets."""
+        assert generate_exams(50, seed=7) == generate_exams(50, seed=7)
+        assert generate_exams(50, seed=7) != generate_exams(50, seed=8)
+    
+    def test_records_match_snapshot_shape(self):
+        """Test that records carry the same keys as data/exams.json."""
+        snapshot_path = Path(__file__).parent.parent / "data" / "exams.json"
+        with open(snapshot_path, encoding="utf-8") as f:
+            snapshot_keys = set(json.load(f)[0])
+        
+        exams = generate_exams(100)
+        assert all(set(exam) == snapshot_keys for exam in exams)
+        assert len({exam["crn"] for exam in exams}) == 100
+
+
+class TestBenchmarkSuite:
+    """Tests for running and comparing benchmark results."""
+    
+    def test_run_suite_small(self):
+        """Test that every case runs and reports timings."""
+        results = run_suite((50,), repeat=1)
+        
+        cases = results["sizes"]["50"]
+        assert "repository_cold_load" in cases
+        assert "search_combined" in cases
+        assert "http_filters_locations" in cases
+        assert all(stats["median_ms"] >= 0 for stats in cases.values())
+    
+    def test_http_cases_outlast_the_rate_limit_burst(self):
+        """Test that HTTP cases keep timing 200s past the search burst."""
+        results = run_suite((20,), repeat=70)
+        
+        assert results["sizes"]["20"]["http_exams_search"]["runs"] == 70
+    
+    def test_measure_rejects_unexpected_status(self):
+        """Test that an error response fails the case instead of being timed."""
+        class Response:
+            status_code = 429
+        
+        with pytest.raises(RuntimeError, match="429"):
+            measure(Response, repeat=1, expect_status=200)
+    
+    def test_compare_flags_regressions(self):
+        """Test that slower medians beyond the threshold are flagged."""
+        baseline = {"sizes": {"1000": {"search": {"median_ms": 1.0}}}}
+        current = {"sizes": {"1000": {"search": {"median_ms": 1.5}}}}
+        
+        rows = compare(baseline, current, threshold=1.2)
+        
+        assert rows == [{
+            "size": "1000",
+            "case": "search",
+            "baseline_ms": 1.0,
+            "current_ms": 1.5,
+            "ratio": 1.5,
+            "regressed": True,
+        }]
+
+
+class TestLoadGenerator:
+    """Tests for the session-replay load generator."""
+    
+    def test_sessions_are_deterministic(self):
+        """Test that a profile and seed always replay the same requests."""
+        profile = LoadProfile(sessions=20, seed=3)
+        
+        first = [(s.paths, s.filters, s.scroll_pages) for s in generate_sessions(profile)]
+        second = [(s.paths, s.filters, s.scroll_pages) for s in generate_sessions(profile)]
+        
+        assert first == second
+        assert all(paths[:2] == ["/api/filters/dates", "/api/filters/locations"] for paths, _, _ in first)
+        assert all("limit=20" in path for paths, _, _ in first for path in paths[2:])
+    
+    def test_wsgi_run_reports_percentiles(self):
+        """Test an in-process run reports every endpoint without errors."""
+        report = run_wsgi_load(200, LoadProfile(sessions=10, typeahead_probability=1.0), concurrency=2)
+        
+        assert report["overall"]["errors"] == 0
+        assert set(report["endpoints"]) == {"/api/exams", "/api/filters/dates", "/api/filters/locations"}
+        assert report["endpoints"]["/api/filters/dates"]["requests"] == 10
+        stats = report["endpoints"]["/api/exams"]
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    
+    def test_scrolling_stops_when_results_run_out(self):
+        """Test that sessions stop requesting pages once hasMore is false."""
+        report = run_wsgi_load(30, LoadProfile(sessions=5, scroll_mean_pages=50, typeahead_probability=0), 1)
+        
+        # 30 unfiltered exams fill two pages of 20; filtered searches have fewer.
+        assert report["endpoints"]["/api/exams"]["requests"] <= 5 * 3
@@ -0,0 +1,175 @@
+"""Tests for the memory-mapped binary snapshot format."""
+
+import pytest
+from api.repositories.binary_snapshot import (
+    BinarySnapshot,
+    BinarySnapshotRepository,
+    MappedExamIndex,
+    write_binary_snapshot,
+)
+from api.services.exam_index import ExamIndex, time_window
+from api.services.exam_service import ExamService
+from benchmarks.datasets import generate_exams
+
+
+@pytest.fixture
+def synthetic_exams(sample_exams):
+    """Sample exams followed by a larger synthetic dataset."""
+    return sample_exams + generate_exams(2000, seed=11)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, synthetic_exams):
+    """Write the synthetic exams as a binary snapshot."""
+    return write_binary_snapshot(synthetic_exams, tmp_path / "exams.bin")
+
+
+class TestBinarySnapshot:
+    """Tests for writing and decoding binary snapshots."""
+    
+    def test_records_round_trip(self, snapshot_path, synthetic_exams):
+        """Test that every decoded record equals its source record."""
+        snapshot = BinarySnapshot(snapshot_path)
+        
+        assert len(snapshot.records) == len(synthetic_exams)
+        assert list(snapshot.records) == synthetic_exams
+        assert snapshot.records[-1] == synthetic_exams[-1]
+    
+    def test_non_string_values_round_trip(self, tmp_path):
+        """Test that missing keys and non-string values are preserved."""
+        exams = [{"crn": "1", "seats": 40, "online": True}, {"crn": "2", "note": None}]
+        snapshot = BinarySnapshot(write_binary_snapshot(exams, tmp_path / "x.bin"))
+        
+        assert list(snapshot.records) == exams
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the snapshot header is rejected."""
+        path = tmp_path / "exams.bin"
+        path.write_bytes(b"[]" + b"\x00" * 64)
+        
+        with pytest.raises(ValueError):
+            BinarySnapshot(path)
+
+
+class TestMappedExamIndex:
+    """Tests for querying a mapped snapshot in place."""
+    
+    @pytest.mark.parametrize("query,date,location", [
+        ("calc", None, None),
+        ("MATH", None, None),
+        ("0", None, None),
+        ("10500", None, None),
+        ("zzz", None, None),
+        ("cs010a", None, None),
+        ("WRIT 267C", None, None),
+        (None, "2025-12-08", None),
+        (None, None, "ssc"),
+        ("cs", "2025-12-09", "SSC"),
+        ("01", "2025-12-10", None),
+        (None, "2025-12-11", "online"),
+    ])
+    def test_parity_with_in_memory_index(self, snapshot_path, synthetic_exams, query, date, location):
+        """Test that mapped and in-memory indexes return identical matches."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        
+        assert list(mapped.filter(query, date, location)) == list(in_memory.filter(query, date, location))
+    
+    @pytest.mark.parametrize("query", ["calc", "10500", "math 0", "zzz", "caf\u00e9"])
+    def test_long_queries_use_mapped_postings(self, snapshot_path, synthetic_exams, monkeypatch, query):
+        """Test that queries of NGRAM_SIZE or more never scan every search key."""
+        snapshot = BinarySnapshot(snapshot_path)
+        in_memory = ExamIndex(synthetic_exams)
+        
+        def forbidden(needle):
+            raise AssertionError("search keys were scanned")
+        
+        monkeypatch.setattr(snapshot.search, "find_all", forbidden)
+        
+        assert list(MappedExamIndex(snapshot).match_query(query)) == list(in_memory.match_query(query))
+    
+    @pytest.mark.parametrize("subject,building", [("MATH", None), (None, "ssc"), ("cs", "SSC")])
+    def test_equality_parity_with_in_memory_index(self, snapshot_path, synthetic_exams, subject, building):
+        """Test that subject and building filters agree across indexes."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        
+        assert mapped.filter(subject=subject, building=building) == in_memory.filter(subject=subject, building=building)
+    
+    @pytest.mark.parametrize("filters", [
+        {"start_after": "2025-12-08T11:30:00"},
+        {"start_before": "2025-12-09"},
+        {"start_after": "2025-12-07", "start_before": "2025-12-10T12:00", "time_of_day": "morning"},
+        {"time_of_day": "19:00"},
+        {"time_of_day": "11:00-16:00", "query": "a"},
+    ])
+    def test_time_filter_parity(self, snapshot_path, synthetic_exams, filters):
+        """Test that time filters agree across indexes and with a naive scan."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        window = time_window(filters.get("time_of_day", "00:00-23:59"))
+        
+        def matches(exam):
+            start = exam["start_time"]
+            minute = int(start[11:13]) * 60 + int(start[14:16])
+            return (
+                start >= filters.get("start_after", "")
+                and start < filters.get("start_before", "9999")
+                and window[0] <= minute < window[1]
+            )
+        
+        expected = set(in_memory.filter(query=filters.get("query")))
+        expected = [i for i, exam in enumerate(synthetic_exams) if i in expected and matches(exam)]
+        
+        assert in_memory.filter(**filters) == expected
+        assert mapped.filter(**filters) == expected
+    
+    @pytest.mark.parametrize("query", ["1050", "MATH 010", "cs010a", "writ267c", "cs", "a"])
+    def test_ranked_page_parity(self, snapshot_path, synthetic_exams, query):
+        """Test that ranked pages agree across indexes."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        
+        for start in (0, 40):
+            assert mapped.ranked_page(mapped.match(query=query), query, start, 20) == \
+                in_memory.ranked_page(in_memory.match(query=query), query, start, 20)
+    
+    def test_facet_counts_match(self, snapshot_path, synthetic_exams):
+        """Test that facet counts agree across indexes."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        
+        for field in ("date", "building"):
+            assert mapped.facet_counts(field, mapped.filter_bitmap(query="a")) == \
+                in_memory.facet_counts(field, in_memory.filter_bitmap(query="a"))
+    
+    def test_facets_match(self, snapshot_path, synthetic_exams):
+        """Test that stored facets equal those built in memory."""
+        mapped = MappedExamIndex(BinarySnapshot(snapshot_path))
+        in_memory = ExamIndex(synthetic_exams)
+        
+        assert mapped.available_dates == in_memory.available_dates
+        assert mapped.available_locations == in_memory.available_locations
+
+
+class TestBinarySnapshotRepository:
+    """Tests for serving the API from a binary snapshot."""
+    
+    def test_service_uses_mapped_index(self, snapshot_path):
+        """Test that the service queries the snapshot without building an index."""
+        service = ExamService(repository=BinarySnapshotRepository(snapshot_path))
+        
+        result = service.search_exams(query="009B")
+        
+        assert isinstance(service.get_index(), MappedExamIndex)
+        assert result["data"][0]["crn"] == "33515"
+    
+    def test_reload_after_rewrite(self, snapshot_path, sample_exams):
+        """Test that a replaced snapshot is detected and re-mapped."""
+        service = ExamService(repository=BinarySnapshotRepository(snapshot_path))
+        service.warm()
+        
+        write_binary_snapshot(sample_exams, snapshot_path)
+        
+        assert service.reload_if_changed() is True
+        assert service.search_exams()["pagination"]["total"] == 4
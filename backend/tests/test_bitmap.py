@@ -0,0 +1,77 @@
+"""Tests for ordinal bitmaps and bitmap-based filtering."""
+
+import random
+
+import pytest
+from api.services import bitmap
+from api.services.exam_index import ExamIndex
+from benchmarks.datasets import generate_exams
+
+
+class TestBitmap:
+    """Tests for building and reading bitmaps."""
+    
+    def test_round_trip(self):
+        """Test that ordinals survive a round trip in ascending order."""
+        ordinals = random.Random(3).sample(range(5000), 700)
+        
+        assert bitmap.select(bitmap.from_ordinals(ordinals, 5000)) == sorted(ordinals)
+    
+    def test_full_and_empty(self):
+        """Test the full and empty bitmaps."""
+        assert bitmap.from_ordinals(range(130), 130) == bitmap.full(130)
+        assert bitmap.full(130).bit_count() == 130
+        assert bitmap.select(0) == []
+        assert bitmap.select(bitmap.full(10), 0, 0) == []
+    
+    @pytest.mark.parametrize("start,count", [(0, 5), (63, 3), (64, 10), (199, 50), (500, 5), (3, None)])
+    def test_select_skips_and_limits(self, start, count):
+        """Test that select matches slicing the sorted ordinals."""
+        ordinals = sorted(random.Random(5).sample(range(2000), 400))
+        selected = bitmap.from_ordinals(ordinals, 2000)
+        end = None if count is None else start + count
+        
+        assert bitmap.select(selected, start, count) == ordinals[start:end]
+
+
+class TestBitmapFiltering:
+    """Tests for combining predicates as bitmaps."""
+    
+    @pytest.fixture
+    def exams(self, sample_exams):
+        """Sample exams followed by a larger synthetic dataset."""
+        return sample_exams + generate_exams(3000, seed=17)
+    
+    @pytest.mark.parametrize("filters", [
+        {"subject": "math"},
+        {"building": "SSC"},
+        {"subject": "CS", "date": "2025-12-09"},
+        {"building": "ssc", "location": "335"},
+        {"query": "calc", "subject": "MATH", "building": "brnhl"},
+        {"subject": "NOPE"},
+    ])
+    def test_matches_naive_filter(self, exams, filters):
+        """Test that bitmap filtering equals a scan over every exam."""
+        def matches(exam):
+            location = exam.get("location", "")
+            parts = location.split()
+            return all([
+                "query" not in filters or filters["query"].lower() in
+                f'{exam["course_number"]} {exam["course_name"]} {exam["crn"]}'.lower(),
+                "date" not in filters or exam["start_time"].startswith(filters["date"]),
+                "location" not in filters or filters["location"].lower() in location.lower(),
+                "subject" not in filters or exam["subject"].lower() == filters["subject"].lower(),
+                "building" not in filters or (parts[0] if parts else "").lower() == filters["building"].lower(),
+            ])
+        
+        expected = [i for i, exam in enumerate(exams) if matches(exam)]
+        
+        assert ExamIndex(exams).filter(**filters) == expected
+    
+    def test_value_bitmaps_are_cached(self, exams):
+        """Test that equality bitmaps are built once per index."""
+        index = ExamIndex(exams)
+        
+        assert index.value_bitmaps("subject") is index.value_bitmaps("subject")
+        assert index.date_bitmap("2025-12-08") is index.date_bitmap("2025-12-08")
+        assert index.date_bitmap("1999-01-01") == 0
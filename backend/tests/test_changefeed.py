@@ -0,0 +1,170 @@
+"""Tests for the snapshot history and the /api/changes delta feed."""
+
+import copy
+import json
+
+import pytest
+from api.app import create_app
+from api.routes import changes as changes_module
+from api.services.changefeed import ChangeFeed
+from scraper.exam_scraper import save_exams
+from scraper.fields import enrich_exam
+from scraper.history import diff_snapshots, load_manifest, record_snapshot
+
+
+@pytest.fixture
+def exams(sample_exams):
+    """Sample exams with event ids, as the scraper emits them."""
+    return [{**exam, "event_id": str(100 + i)} for i, exam in enumerate(sample_exams)]
+
+
+@pytest.fixture
+def history_dir(tmp_path):
+    """Empty history directory."""
+    return tmp_path / "history"
+
+
+def _save_versions(exams, history_dir, *snapshots, max_deltas=100):
+    """Record a base snapshot followed by each later snapshot."""
+    previous = None
+    for snapshot in (exams, *snapshots):
+        record_snapshot(previous, snapshot, history_dir, max_deltas)
+        previous = snapshot
+
+
+def _moved(exams, index, location):
+    snapshot = copy.deepcopy(exams)
+    snapshot[index]["location"] = location
+    return snapshot
+
+
+class TestSnapshotHistory:
+    """Tests for recording versions and deltas."""
+    
+    def test_diff_by_event_id(self, exams):
+        """Test added, changed and removed records between snapshots."""
+        current = _moved(exams, 0, "SSC 100")[:3] + [{**exams[1], "event_id": "999"}]
+        
+        changes = diff_snapshots(exams, current)
+        
+        assert list(changes["added"]) == ["999"]
+        assert list(changes["changed"]) == ["100"]
+        assert changes["changed"]["100"]["location"] == "SSC 100"
+        assert changes["removed"] == ["103"]
+    
+    def test_diff_ignores_derived_fields(self, exams):
+        """Test that deltas compare and store records without derived fields."""
+        enriched = [enrich_exam(exam) for exam in exams]
+        
+        assert diff_snapshots(exams, enriched) == {"added": {}, "changed": {}, "removed": []}
+        assert diff_snapshots([], enriched)["added"]["100"] == exams[0]
+    
+    def test_unchanged_snapshot_keeps_version(self, exams, history_dir):
+        """Test that re-saving identical data does not bump the version."""
+        _save_versions(exams, history_dir, copy.deepcopy(exams))
+        
+        assert load_manifest(history_dir)["version"] == 1
+    
+    def test_old_deltas_are_pruned(self, exams, history_dir):
+        """Test that only the most recent deltas are kept."""
+        snapshots = [_moved(exams, 0, f"SSC {n}") for n in range(5)]
+        _save_versions(exams, history_dir, *snapshots, max_deltas=2)
+        
+        manifest = load_manifest(history_dir)
+        assert manifest["version"] == 6
+        assert manifest["deltas"] == [5, 6]
+        assert sorted(p.name for p in history_dir.glob("*.delta.json")) == ["5.delta.json", "6.delta.json"]
+    
+    def test_save_exams_records_history(self, exams, tmp_path):
+        """Test that save_exams diffs against the file it replaces."""
+        output = tmp_path / "exams.json"
+        history = tmp_path / "history"
+        save_exams(exams, output_path=str(output), history_dir=str(history))
+        save_exams(_moved(exams, 2, "SSC 999"), output_path=str(output), history_dir=str(history))
+        
+        delta = json.loads((history / "2.delta.json").read_text(encoding="utf-8"))
+        assert list(delta["changed"]) == ["102"]
+
+
+class TestChangeFeed:
+    """Tests for merging deltas into a single response."""
+    
+    def test_merges_deltas(self, exams, history_dir):
+        """Test that several versions collapse into one net delta."""
+        v2 = _moved(exams, 0, "SSC 1")
+        v3 = v2 + [{**exams[1], "event_id": "500"}]
+        v4 = _moved(v3, 0, "SSC 2")[:3] + [v3[4]]
+        _save_versions(exams, history_dir, v2, v3, v4)
+        
+        changes = ChangeFeed(history_dir).changes_since(1)
+        
+        assert changes["version"] == 4
+        assert changes["resync"] is False
+        assert [exam["event_id"] for exam in changes["added"]] == ["500"]
+        assert [exam["location"] for exam in changes["changed"]] == ["SSC 2"]
+        assert changes["removed"] == ["103"]
+    
+    def test_added_then_removed_is_omitted(self, exams, history_dir):
+        """Test that a record added and removed in between is not reported."""
+        _save_versions(exams, history_dir, exams + [{**exams[0], "event_id": "500"}], exams)
+        
+        changes = ChangeFeed(history_dir).changes_since(1)
+        
+        assert (changes["added"], changes["changed"], changes["removed"]) == ([], [], [])
+    
+    @pytest.mark.parametrize("since", [0, 1, 9])
+    def test_resync_when_history_is_missing(self, exams, history_dir, since):
+        """Test the resync signal for pruned or unknown versions."""
+        snapshots = [_moved(exams, 0, f"SSC {n}") for n in range(3)]
+        _save_versions(exams, history_dir, *snapshots, max_deltas=2)
+        
+        changes = ChangeFeed(history_dir).changes_since(since)
+        
+        assert changes == {"version": 4, "since": since, "resync": True}
+    
+    def test_picks_up_new_versions(self, exams, history_dir):
+        """Test that a new manifest is noticed without restarting."""
+        _save_versions(exams, history_dir)
+        feed = ChangeFeed(history_dir)
+        assert feed.current_version() == 1
+        
+        record_snapshot(exams, _moved(exams, 1, "SSC 7"), history_dir, 100)
+        
+        assert feed.current_version() == 2
+        assert [exam["location"] for exam in feed.changes_since(1)["changed"]] == ["SSC 7"]
+
+
+class TestChangesEndpoint:
+    """Tests for /api/changes."""
+    
+    @pytest.fixture
+    def client(self, exams, history_dir, monkeypatch):
+        """Test client whose change feed reads a temporary history."""
+        _save_versions(exams, history_dir, _moved(exams, 0, "SSC 1"))
+        monkeypatch.setattr(changes_module, "_change_feed", ChangeFeed(history_dir))
+        return create_app({"TESTING": True}).test_client()
+    
+    def test_current_version(self, client):
+        """Test that omitting since returns only the current version."""
+        response = client.get("/api/changes")
+        
+        assert response.status_code == 200
+        assert response.get_json() == {"version": 2}
+    
+    def test_delta(self, client):
+        """Test fetching the delta since a version."""
+        data = client.get("/api/changes?since=1").get_json()
+        
+        assert data["resync"] is False
+        assert [exam["event_id"] for exam in data["changed"]] == ["100"]
+    
+    def test_up_to_date(self, client):
+        """Test that the current version yields an empty delta."""
+        data = client.get("/api/changes?since=2").get_json()
+        
+        assert (data["added"], data["changed"], data["removed"]) == ([], [], [])
+    
+    @pytest.mark.parametrize("since", ["abc", "-1"])
+    def test_invalid_since(self, client, since):
+        """Test that malformed versions are rejected."""
+        assert client.get(f"/api/changes?since={since}").status_code == 400
@@ -0,0 +1,145 @@
+"""Tests for Server-Sent Events snapshot notifications."""
+
+import json
+import threading
+import time
+
+import pytest
+from api.app import create_app
+from api.events import EventBroadcaster, format_event
+from api.repositories.exam_repository import ExamRepository
+from api.routes import events as events_module
+from api.services.exam_service import ExamService
+
+
+def _events(body: str) -> list[dict]:
+    """Parse the named events out of an event-stream body."""
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append({"id": fields.get("id"), "event": fields["event"], "data": json.loads(fields["data"])})
+    return events
+
+
+class TestEventBroadcaster:
+    """Tests for fanning events out to streams."""
+    
+    def test_format_event(self):
+        """Test the text/event-stream encoding."""
+        assert format_event("snapshot-updated", {"version": 3}, "abc") == \
+            'id: abc\nevent: snapshot-updated\ndata: {"version":3}\n\n'
+    
+    def test_publish_wakes_every_stream(self):
+        """Test that one publish reaches all open streams."""
+        broadcaster = EventBroadcaster()
+        streams = [broadcaster.stream(heartbeat_seconds=5, max_seconds=5) for _ in range(3)]
+        for stream in streams:
+            next(stream)
+        received = []
+        
+        def read(stream):
+            received.append(next(stream))
+        
+        threads = [threading.Thread(target=read, args=(stream,)) for stream in streams]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        broadcaster.publish("snapshot-updated", {"version": 2}, "v2")
+        for thread in threads:
+            thread.join(timeout=2)
+        
+        assert len(received) == 3
+        assert all(_events(message)[0]["data"] == {"version": 2} for message in received)
+    
+    def test_keepalive_and_expiry(self):
+        """Test heartbeats while idle and the end of the stream's lifetime."""
+        broadcaster = EventBroadcaster()
+        
+        messages = list(broadcaster.stream(["initial\n\n"], heartbeat_seconds=0.02, max_seconds=0.1))
+        
+        assert messages[0].startswith("retry: ")
+        assert messages[1] == "initial\n\n"
+        assert ": keepalive\n\n" in messages[2:]
+    
+    def test_client_limit(self):
+        """Test that slots are limited and released."""
+        broadcaster = EventBroadcaster()
+        
+        assert broadcaster.try_connect(1) is True
+        assert broadcaster.try_connect(1) is False
+        broadcaster.disconnect()
+        assert broadcaster.try_connect(1) is True
+
+
+class TestEventsEndpoint:
+    """Tests for /api/events."""
+    
+    @pytest.fixture
+    def service(self, tmp_path, sample_exams, monkeypatch):
+        """Service over a JSON snapshot on disk, used by the events route."""
+        path = tmp_path / "exams.json"
+        path.write_text(json.dumps(sample_exams), encoding="utf-8")
+        service = ExamService(repository=ExamRepository(path))
+        service.warm()
+        monkeypatch.setattr(events_module, "_exam_service", service)
+        monkeypatch.setattr(events_module, "_broadcaster", EventBroadcaster())
+        return service
+    
+    @pytest.fixture
+    def app(self, service):
+        """App with short-lived streams."""
+        return create_app({
+            "TESTING": True,
+            "EVENTS_HEARTBEAT_SECONDS": 0.02,
+            "EVENTS_MAX_STREAM_SECONDS": 0.1,
+        })
+    
+    def test_stream_headers(self, app):
+        """Test the content type and a stream with no pending update."""
+        response = app.test_client().get("/api/events")
+        
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert _events(response.get_data(as_text=True)) == []
+    
+    def test_stale_last_event_id_gets_update(self, app, service):
+        """Test that a client that missed a reload is told immediately."""
+        response = app.test_client().get("/api/events", headers={"Last-Event-ID": "old"})
+        
+        events = _events(response.get_data(as_text=True))
+        assert events[0]["event"] == "snapshot-updated"
+        assert events[0]["id"] == service.snapshot_id()
+    
+    def test_reload_publishes_event(self, app, service, tmp_path, sample_exams):
+        """Test that a repository reload is pushed to open streams."""
+        response = app.test_client().get("/api/events")
+        stream = iter(response.response)
+        next(stream)
+        service.add_reload_listener(events_module.publish_snapshot_updated)
+        (tmp_path / "exams.json").write_text(json.dumps(sample_exams[:2]), encoding="utf-8")
+        
+        assert service.reload_if_changed() is True
+        
+        events = _events(next(stream).decode())
+        assert events[0]["data"]["snapshot"] == service.snapshot_id()
+        response.close()
+    
+    def test_too_many_streams(self, app):
+        """Test that streams beyond the limit get 503 with Retry-After."""
+        app.config["EVENTS_MAX_CLIENTS"] = 0
+        
+        response = app.test_client().get("/api/events")
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "30"
+    
+    def test_closing_releases_slot(self, app):
+        """Test that a closed stream frees its slot."""
+        response = app.test_client().get("/api/events")
+        assert events_module._broadcaster.clients == 1
+        
+        response.close()
+        
+        assert events_module._broadcaster.clients == 0
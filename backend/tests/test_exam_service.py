@@ -1,7 +1,22 @@
 """Unit tests for ExamService."""
 
+import json
+
 import pytest
+from api.repositories.exam_repository import ExamRepository
+from api.services import bitmap
+from api.services.exam_index import (
+    RANK_EXACT_COURSE,
+    RANK_EXACT_CRN,
+    RANK_PREFIX,
+    RANK_SUBSTRING,
+    ExamIndex,
+    public_record,
+    relevance,
+    rank_query,
+)
 from api.services.exam_service import ExamService
+from benchmarks.datasets import generate_exams
 
 
 class TestExamServiceSearch:
@@ -119,6 +134,201 @@ class TestExamServiceCombinedFilters:
         
         assert len(result["data"]) == 1
         assert result["data"][0]["crn"] == "35359"
+    
+    def test_filter_by_subject_and_building(self, exam_service):
+        """Test exact subject and building filters."""
+        result = exam_service.search_exams(subject="math", building="BRNHL")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["33515"]
+        assert result["pagination"]["total"] == 1
+    
+    def test_building_is_exact_match(self, exam_service):
+        """Test that building does not match a partial building code."""
+        result = exam_service.search_exams(building="SS")
+        
+        assert result["data"] == []
+
+
+class TestExamServiceTimeFilters:
+    """Tests for start-time window and time-of-day filters."""
+    
+    def test_start_window(self, exam_service):
+        """Test that start_after is inclusive and start_before exclusive."""
+        result = exam_service.search_exams(
+            start_after="2025-12-08T08:00:00",
+            start_before="2025-12-09T15:00:00"
+        )
+        
+        assert [exam["crn"] for exam in result["data"]] == ["35359", "33515"]
+    
+    def test_start_after_date(self, exam_service):
+        """Test that a bare date means midnight."""
+        result = exam_service.search_exams(start_after="2025-12-09")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["12345", "54321"]
+    
+    @pytest.mark.parametrize("time_of_day,crns", [
+        ("morning", ["35359", "33515", "54321"]),
+        ("afternoon", ["12345"]),
+        ("evening", []),
+        ("08:00", ["35359", "33515", "54321"]),
+        ("14:00-16:00", ["12345"]),
+    ])
+    def test_time_of_day(self, exam_service, time_of_day, crns):
+        """Test named, exact and ranged time-of-day windows."""
+        result = exam_service.search_exams(time_of_day=time_of_day)
+        
+        assert [exam["crn"] for exam in result["data"]] == crns
+    
+    def test_combined_with_query(self, exam_service):
+        """Test time filters combined with a search query."""
+        result = exam_service.search_exams(query="CALC", time_of_day="morning", start_after="2025-12-08")
+        
+        assert result["pagination"]["total"] == 2
+
+
+class TestExamServiceFacets:
+    """Tests for facet counts alongside search results."""
+    
+    def test_no_facets_by_default(self, exam_service):
+        """Test that facets are only returned when requested."""
+        assert "facets" not in exam_service.search_exams()
+    
+    def test_counts_for_current_query(self, exam_service):
+        """Test date and building counts for a search query."""
+        result = exam_service.search_exams(query="CALC", facets=["date", "building"])
+        
+        assert result["facets"] == {
+            "date": {"2025-12-08": 2},
+            "building": {"BRNHL": 1, "SSC": 1},
+        }
+    
+    def test_facet_ignores_its_own_filter(self, exam_service):
+        """Test that a selected date or building keeps the other counts."""
+        result = exam_service.search_exams(
+            date="2025-12-08",
+            location="SSC",
+            facets=["date", "building"]
+        )
+        
+        assert result["pagination"]["total"] == 1
+        assert result["facets"]["date"] == {"2025-12-08": 1, "2025-12-09": 1}
+        assert result["facets"]["building"] == {"BRNHL": 1, "SSC": 1}
+
+
+def _exam(subject: str, course_number: str, crn: str) -> dict:
+    """Exam record shaped like the scraper's, titled "SUBJ NUM SEC CRN"."""
+    return {
+        "subject": subject,
+        "course_number": course_number,
+        "section": "001",
+        "crn": crn,
+        "course_name": f"{subject} {course_number} 001 {crn}",
+        "start_time": "2025-12-08T08:00:00",
+        "end_time": "2025-12-08T11:00:00",
+        "location": "SSC 335",
+    }
+
+
+class TestExamServiceRanking:
+    """Tests for relevance ranking of free-text searches."""
+    
+    @pytest.fixture
+    def ranked_service(self, tmp_path):
+        """Service whose best matches come last in snapshot order."""
+        exams = [
+            _exam("ECS", "010A", "41234"),
+            _exam("CS", "110A", "51234"),
+            _exam("MATH", "010A", "61234"),
+            _exam("CS", "010A", "12345"),
+            _exam("CS", "010A", "1234"),
+        ]
+        path = tmp_path / "exams.json"
+        path.write_text(json.dumps(exams), encoding="utf-8")
+        return ExamService(repository=ExamRepository(path))
+    
+    @pytest.mark.parametrize("text,key,course_number,tier", [
+        ("12345", "010a\x00cs 010a 001 12345\x0012345", None, RANK_EXACT_CRN),
+        ("cs 010a", "010a\x00cs 010a 001 12345\x0012345", "010a", RANK_EXACT_COURSE),
+        ("cs 010a", "010a\x00ecs 010a 001 41234\x0041234", None, RANK_SUBSTRING),
+        ("010", "010a\x00cs 010a 001 12345\x0012345", None, RANK_PREFIX),
+        ("001", "010a\x00cs 010a 001 12345\x0012345", None, RANK_PREFIX),
+        ("10a", "010a\x00cs 010a 001 12345\x0012345", None, RANK_SUBSTRING),
+    ])
+    def test_relevance_tiers(self, text, key, course_number, tier):
+        """Test the tier assigned to a matching search key."""
+        assert relevance(text, key, course_number) == tier
+    
+    def test_rank_query_recognizes_course_codes(self):
+        """Test that course codes are recognized with or without a space."""
+        assert rank_query("  CS   010A ") == ("cs 010a", ("cs", "010a"))
+        assert rank_query("cs010a") == ("cs010a", ("cs", "010a"))
+        assert rank_query("calculus") == ("calculus", None)
+    
+    def test_exact_crn_first(self, ranked_service):
+        """Test that an exact CRN comes first, then prefixes, then other matches."""
+        result = ranked_service.search_exams(query="1234")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["1234", "12345", "41234", "51234", "61234"]
+    
+    def test_exact_course_before_substring(self, ranked_service):
+        """Test that "CS 010A" ranks the CS course above ECS 010A."""
+        result = ranked_service.search_exams(query="CS 010A")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["12345", "1234", "41234"]
+    
+    @pytest.mark.parametrize("query", ["cs010a", "CS 010A", "cs 010a"])
+    def test_course_code_matches_subject_and_number(self, exam_service, query):
+        """Test that a course code finds the course although its name differs."""
+        result = exam_service.search_exams(query=query)
+        
+        assert [exam["crn"] for exam in result["data"]] == ["12345"]
+    
+    def test_course_code_without_space_ranks_course_first(self, ranked_service):
+        """Test that "cs010a" finds and ranks both CS 010A sections."""
+        result = ranked_service.search_exams(query="cs010a")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["12345", "1234"]
+    
+    def test_prefix_before_substring(self, exam_service):
+        """Test that a word starting with the query outranks an inner match."""
+        result = exam_service.search_exams(query="calc")
+        
+        assert [exam["crn"] for exam in result["data"]] == ["33515", "35359"]
+    
+    @pytest.mark.parametrize("query", ["1", "10500", "cs 010a", "math010", "calc", "a", "zzz"])
+    def test_ranked_page_matches_relevance_order(self, sample_exams, query):
+        """Test that tiered pages equal sorting every match by relevance."""
+        index = ExamIndex(sample_exams + generate_exams(3000, seed=5))
+        matched = index.match(query=query)
+        folded, course = rank_query(query)
+        subjects = index.value_bitmap("subject", course[0]) if course else 0
+        
+        def rank(ordinal):
+            number = course[1] if subjects >> ordinal & 1 else None
+            return relevance(folded, index.search_key_at(ordinal), number), ordinal
+        
+        expected = [public_record(index.exams[i]) for _, i in sorted(map(rank, bitmap.select(matched)))]
+        
+        for start in (0, 7, 150, 2000):
+            assert index.ranked_page(matched, query, start, 25) == expected[start:start + 25]
+    
+    def test_pages_follow_ranking(self, ranked_service):
+        """Test that pages partition the ranked order without gaps."""
+        ranked = [exam["crn"] for exam in ranked_service.search_exams(query="1234")["data"]]
+        paged = [
+            exam["crn"]
+            for page in (1, 2, 3)
+            for exam in ranked_service.search_exams(query="1234", page=page, limit=2)["data"]
+        ]
+        
+        assert paged == ranked
+    
+    def test_no_query_keeps_snapshot_order(self, ranked_service):
+        """Test that unranked listings stay in snapshot order."""
+        result = ranked_service.search_exams()
+        
+        assert [exam["crn"] for exam in result["data"]] == ["41234", "51234", "61234", "12345", "1234"]
 
 
 class TestExamServicePagination:
@@ -208,3 +418,48 @@ class TestExamServiceAvailableLocations:
         ssc = next(loc for loc in locations if loc["building"] == "SSC")
         assert "SSC 335" in ssc["rooms"]
         assert "SSC 235" in ssc["rooms"]
+
+
+class TestExamServiceSuggest:
+    """Tests for typeahead suggestions."""
+    
+    def test_suggest_subject_prefix(self, exam_service):
+        """Test that a subject prefix suggests the subject first."""
+        suggestions = exam_service.suggest("ma")
+        
+        assert suggestions[0] == {"value": "MATH", "type": "subject", "count": 2}
+        assert {"value": "MATH 009B", "type": "course", "count": 1} in suggestions
+    
+    def test_suggest_course_pair(self, exam_service):
+        """Test completing a SUBJECT COURSE pair."""
+        suggestions = exam_service.suggest("cs 01")
+        
+        assert suggestions == [{"value": "CS 010A", "type": "course", "count": 1}]
+    
+    def test_suggest_crn_and_course_name(self, exam_service):
+        """Test completing CRNs and course names case-insensitively."""
+        assert exam_service.suggest("3535")[0]["value"] == "35359"
+        assert exam_service.suggest("general")[0]["value"] == "GENERAL PHYSICS"
+    
+    def test_suggest_limit_and_empty_prefix(self, exam_service):
+        """Test that the limit is honored and an empty prefix suggests nothing."""
+        assert len(exam_service.suggest("m", limit=1)) == 1
+        assert exam_service.suggest("") == []
+        assert exam_service.suggest("zzz") == []
+    
+    @pytest.mark.parametrize("prefix,subjects", [
+        ("c", {"CHEM", "CS"}),
+        ("b", {"BCH", "BIOL", "BUS"}),
+        ("p", {"PHIL", "PHYS", "POSC", "PSYC"}),
+        ("s", {"SOC", "SPN", "STAT"}),
+    ])
+    def test_subjects_not_crowded_out_by_names(self, prefix, subjects):
+        """Test that every matching subject is suggested before other kinds."""
+        from api.services.suggest import SuggestIndex
+        from benchmarks.datasets import generate_exams
+        
+        suggestions = SuggestIndex(generate_exams(10_000)).suggest(prefix)
+        
+        suggested = {s["value"] for s in suggestions if s["type"] == "subject"}
+        assert suggested == subjects
+        assert [s["type"] for s in suggestions[:len(subjects)]] == ["subject"] * len(subjects)
@@ -0,0 +1,157 @@
+"""Tests for the prebuilt search index artifact."""
+
+import json
+
+import pytest
+from api.repositories.exam_repository import ExamRepository
+from api.services import exam_index
+from api.services.exam_index import ExamIndex, index_artifact_path
+from api.services.exam_service import ExamService
+from scraper.exam_scraper import save_exams
+from scraper.fields import derive_fields, enrich_exam
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, sample_exams):
+    """Save the sample exams and their index artifact like the scraper does."""
+    path = tmp_path / "exams.json"
+    save_exams(sample_exams, output_path=str(path), emit_index=True)
+    return path
+
+
+def _forbid_rebuild(monkeypatch):
+    """Make building an index from scratch fail the test."""
+    original = ExamIndex.__init__
+    
+    def init(self, exams, artifact=None):
+        assert artifact is not None, "index was rebuilt instead of loaded"
+        original(self, exams, artifact=artifact)
+    
+    monkeypatch.setattr(ExamIndex, "__init__", init)
+
+
+class TestIndexArtifact:
+    """Tests for writing and loading index artifacts."""
+    
+    def test_scraper_writes_artifact(self, snapshot_path):
+        """Test that save_exams emits a versioned, checksummed artifact."""
+        artifact = json.loads(index_artifact_path(snapshot_path).read_text(encoding="utf-8"))
+        
+        assert snapshot_path.with_name("exams.index.json").exists()
+        assert artifact["version"] == exam_index.INDEX_ARTIFACT_VERSION
+        assert artifact["count"] == 4
+        assert len(artifact["snapshot_sha256"]) == 64
+    
+    def test_service_loads_artifact(self, snapshot_path, monkeypatch):
+        """Test that a current artifact is used instead of rebuilding."""
+        _forbid_rebuild(monkeypatch)
+        service = ExamService(repository=ExamRepository(snapshot_path))
+        
+        assert service.search_exams(query="calc")["pagination"]["total"] == 2
+        assert service.search_exams(date="2025-12-08")["pagination"]["total"] == 2
+        assert service.get_available_dates() == ["2025-12-08", "2025-12-09", "2025-12-10"]
+    
+    def test_restored_index_matches_built_index(self, snapshot_path, sample_exams):
+        """Test that a restored index holds the same structures as a fresh build."""
+        repository = ExamRepository(snapshot_path)
+        repository.get_all_exams()
+        restored = repository.load_index()
+        built = ExamIndex(sample_exams)
+        
+        assert restored is not None
+        assert restored.search_keys == built.search_keys
+        assert restored.ngram_postings == built.ngram_postings
+        assert restored.date_postings == built.date_postings
+        assert restored.available_locations == built.available_locations
+    
+    def test_stale_artifact_falls_back_to_build(self, snapshot_path, sample_exams):
+        """Test that an artifact for a different snapshot is ignored."""
+        snapshot_path.write_text(json.dumps(sample_exams[:2]), encoding="utf-8")
+        repository = ExamRepository(snapshot_path)
+        service = ExamService(repository=repository)
+        
+        repository.get_all_exams()
+        assert repository.load_index() is None
+        assert service.search_exams()["pagination"]["total"] == 2
+    
+    def test_other_version_falls_back_to_build(self, snapshot_path, monkeypatch):
+        """Test that an artifact from another format version is ignored."""
+        monkeypatch.setattr(exam_index, "INDEX_ARTIFACT_VERSION", exam_index.INDEX_ARTIFACT_VERSION + 1)
+        repository = ExamRepository(snapshot_path)
+        
+        repository.get_all_exams()
+        assert repository.load_index() is None
+    
+    def test_empty_snapshot_artifact_is_used(self, tmp_path, monkeypatch):
+        """Test that the valid index of an empty snapshot is not rebuilt."""
+        path = tmp_path / "exams.json"
+        save_exams([], output_path=str(path), emit_index=True)
+        _forbid_rebuild(monkeypatch)
+        service = ExamService(repository=ExamRepository(path))
+        
+        assert service.search_exams()["pagination"]["total"] == 0
+    
+    def test_missing_artifact_falls_back_to_build(self, snapshot_path):
+        """Test that the service still works without an artifact."""
+        index_artifact_path(snapshot_path).unlink()
+        service = ExamService(repository=ExamRepository(snapshot_path))
+        
+        assert service.search_exams(query="009B")["data"][0]["crn"] == "33515"
+
+
+class TestDerivedFields:
+    """Tests for the derived fields stored with each record."""
+    
+    def test_derive_fields(self, sample_exams):
+        """Test the values derived from one record."""
+        derived = derive_fields(sample_exams[1])
+        
+        assert derived["building"] == "BRNHL"
+        assert derived["room"] == "A125"
+        assert derived["date_iso"] == "2025-12-08"
+        assert derived["end_epoch"] - derived["start_epoch"] == 3 * 60 * 60
+        assert derived["location_key"] == "brnhl a125"
+        assert derived["course_key"] == "MATH 009B"
+        assert "first-year calculus" in derived["search_key"]
+    
+    def test_enriched_snapshot_indexes_like_legacy_snapshot(self, sample_exams):
+        """Test that stored derived fields and computed ones build the same index."""
+        enriched = ExamIndex([enrich_exam(exam) for exam in sample_exams])
+        legacy = ExamIndex(sample_exams)
+        
+        assert enriched.search_keys == legacy.search_keys
+        assert enriched.location_keys == legacy.location_keys
+        assert enriched.date_postings == legacy.date_postings
+        assert enriched.start_keys == legacy.start_keys
+        assert enriched.available_locations == legacy.available_locations
+    
+    def test_enriched_snapshot_is_not_reparsed(self, sample_exams, monkeypatch):
+        """Test that building an index over enriched records parses no times."""
+        enriched = [enrich_exam(exam) for exam in sample_exams]
+        
+        def fail(*args):
+            raise AssertionError("derived field recomputed")
+        
+        monkeypatch.setattr(exam_index, "start_seconds", fail)
+        monkeypatch.setattr(exam_index, "extract_date", fail)
+        monkeypatch.setattr(exam_index, "search_key", fail)
+        
+        assert len(ExamIndex(enriched).start_keys) == 4
+    
+    @pytest.mark.parametrize("filters", [{}, {"query": "calc"}, {"query": "35359"}])
+    def test_served_records_omit_derived_fields(self, snapshot_path, sample_exams, filters):
+        """Test that enriched records are served with only their scraped fields."""
+        service = ExamService(repository=ExamRepository(snapshot_path))
+        
+        data = service.search_exams(**filters)["data"]
+        
+        assert data
+        assert all(exam in sample_exams for exam in data)
+    
+    def test_query_is_case_and_accent_folded(self, sample_exams):
+        """Test that queries and keys are folded the same way."""
+        exam = dict(sample_exams[0], course_name="CAFÉ CHEMISTRY")
+        index = ExamIndex([exam, enrich_exam(exam)])
+        
+        assert list(index.match_query("cafe")) == [0, 1]
+        assert list(index.match_query("Café")) == [0, 1]
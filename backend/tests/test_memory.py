@@ -0,0 +1,107 @@
+"""Memory accounting and per-exam memory budgets."""
+
+import sys
+
+import pytest
+from api.services.memory import deep_sizeof, structure_sizes
+from benchmarks.memory import measure_memory
+
+# Bytes per exam allowed at BUDGET_SIZE synthetic exams. Measured values at
+# the time of writing are in the comments; raise a budget only with a reason.
+BUDGET_SIZE = 10_000
+RECORDS_BUDGET = 1800  # 1417
+INDEX_BUDGET = 400  # 304
+SUGGEST_BUDGET = 550  # 417
+TOTAL_BUDGET = 2700  # 2139
+PEAK_BUDGET = 3400  # 2660
+
+
+@pytest.fixture(scope="module")
+def report():
+    """Memory report for the budget-sized synthetic snapshot."""
+    return measure_memory(BUDGET_SIZE)
+
+
+class TestDeepSizeof:
+    """Tests for the recursive size walk."""
+    
+    def test_counts_nested_items(self):
+        """Test that containers are charged for what they hold."""
+        items = ["x" * 100, "y" * 100]
+        
+        assert deep_sizeof(items) == sys.getsizeof(items) + sum(map(sys.getsizeof, items))
+        assert deep_sizeof({"k": items}) > deep_sizeof(items)
+    
+    def test_shared_objects_counted_once(self):
+        """Test that a structure pays only for objects not already counted."""
+        record = {"course_name": "x" * 1000}
+        report = structure_sizes({"records": [record], "index": {"0": record}}, count=1)
+        
+        assert report["structures"]["records"]["bytes"] > 1000
+        assert report["structures"]["index"]["bytes"] < 1000
+        assert report["total_bytes"] == sum(s["bytes"] for s in report["structures"].values())
+    
+    def test_follows_instance_attributes(self):
+        """Test that plain objects are measured through their __dict__."""
+        class Holder:
+            def __init__(self):
+                self.payload = "z" * 5000
+        
+        assert deep_sizeof(Holder()) > 5000
+
+
+class TestServiceReport:
+    """Tests for ExamService.memory_report and its endpoint."""
+    
+    def test_report_lists_structures(self, exam_service):
+        """Test that records, index structures and suggestions are reported."""
+        exam_service.warm()
+        report = exam_service.memory_report()
+        
+        assert report["exams"] == 4
+        assert {"records", "index.search_keys", "index.ngram_postings", "cache.bitmaps", "suggest"} <= set(
+            report["structures"]
+        )
+        assert report["bytes_per_exam"] == round(report["total_bytes"] / 4, 1)
+    
+    def test_memory_endpoint(self, app, exam_service, monkeypatch):
+        """Test that the endpoint serves the report to local clients only."""
+        from api.routes import metrics as metrics_module
+        monkeypatch.setattr(metrics_module, "_exam_service", exam_service)
+        client = app.test_client()
+        
+        response = client.get("/api/metrics/memory")
+        remote = client.get("/api/metrics/memory", environ_base={"REMOTE_ADDR": "10.0.0.5"})
+        
+        assert response.status_code == 200
+        assert response.get_json()["exams"] == 4
+        assert response.get_json()["process"]["max_rss_bytes"] > 0
+        assert remote.status_code == 404
+
+
+class TestMemoryBudget:
+    """Fail when memory per exam regresses past its budget."""
+    
+    def test_records_budget(self, report):
+        """Test the parsed records' bytes per exam."""
+        assert report["structures"]["records"]["bytes_per_exam"] <= RECORDS_BUDGET
+    
+    def test_index_budget(self, report):
+        """Test the search index's bytes per exam, excluding the records."""
+        index_bytes = sum(
+            stats["bytes"] for name, stats in report["structures"].items() if name.startswith("index.")
+        )
+        assert index_bytes / BUDGET_SIZE <= INDEX_BUDGET
+    
+    def test_suggest_budget(self, report):
+        """Test the suggestion index's bytes per exam."""
+        assert report["structures"]["suggest"]["bytes_per_exam"] <= SUGGEST_BUDGET
+    
+    def test_total_budget(self, report):
+        """Test total retained memory, walked and traced."""
+        assert report["bytes_per_exam"] <= TOTAL_BUDGET
+        assert report["tracemalloc"]["retained_bytes_per_exam"] <= TOTAL_BUDGET
+    
+    def test_peak_budget(self, report):
+        """Test the allocation peak while loading and indexing."""
+        assert report["tracemalloc"]["peak_bytes"] / BUDGET_SIZE <= PEAK_BUDGET
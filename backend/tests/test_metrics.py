@@ -0,0 +1,67 @@
+"""Tests for request timing instrumentation and the metrics endpoint."""
+
+import pytest
+from api.app import create_app
+
+
+class TestMetricsEndpoint:
+    """Tests for the /api/metrics endpoint."""
+    
+    def test_metrics_prometheus_format(self, client):
+        """Test that metrics are exposed in Prometheus text format."""
+        client.get("/api/exams?q=CALC")
+        response = client.get("/api/metrics")
+        
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        body = response.get_data(as_text=True)
+        assert "# TYPE exam_api_request_duration_seconds histogram" in body
+        assert 'exam_api_requests_total{route="/api/exams",method="GET",status="200"} 1' in body
+    
+    def test_metrics_record_search_phases(self, client):
+        """Test that the exams endpoint records each search phase."""
+        client.get("/api/exams")
+        body = client.get("/api/metrics").get_data(as_text=True)
+        
+        for phase in ("validate", "filter", "paginate", "serialize", "total"):
+            assert (
+                f'exam_api_request_duration_seconds_count{{route="/api/exams",phase="{phase}"}} 1'
+                in body
+            )
+    
+    def test_metrics_hidden_from_remote_clients(self, client):
+        """Test that non-loopback clients cannot read metrics."""
+        response = client.get("/api/metrics", environ_base={"REMOTE_ADDR": "10.0.0.5"})
+        
+        assert response.status_code == 404
+    
+    def test_unmatched_routes_share_label(self, client):
+        """Test that 404s do not create one series per URL."""
+        client.get("/api/unknown-one")
+        client.get("/api/unknown-two")
+        body = client.get("/api/metrics").get_data(as_text=True)
+        
+        assert 'route="unmatched",method="GET",status="404"} 2' in body
+
+
+class TestServerTimingHeader:
+    """Tests for the optional Server-Timing response header."""
+    
+    def test_header_absent_by_default(self, client):
+        """Test that Server-Timing is off unless configured."""
+        response = client.get("/api/exams")
+        
+        assert "Server-Timing" not in response.headers
+    
+    def test_header_lists_phases(self, mock_repository, monkeypatch):
+        """Test that Server-Timing lists each phase and the total."""
+        from api.routes import exams as exams_module
+        from api.services.exam_service import ExamService
+        
+        monkeypatch.setattr(exams_module, "_exam_service", ExamService(repository=mock_repository))
+        app = create_app({"TESTING": True, "SERVER_TIMING_HEADER": True})
+        response = app.test_client().get("/api/exams?q=MATH")
+        
+        header = response.headers["Server-Timing"]
+        for phase in ("validate", "filter", "paginate", "serialize", "total"):
+            assert f"{phase};dur=" in header
@@ -0,0 +1,102 @@
+"""Tests for snapshot preloading and coordinated reloads."""
+
+import gc
+import json
+
+import pytest
+from api.prefork import SnapshotWatcher, warm_and_freeze
+from api.repositories.exam_repository import ExamRepository
+from api.services.exam_service import ExamService
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, sample_exams):
+    """Write the sample exams to a snapshot file."""
+    path = tmp_path / "exams.json"
+    path.write_text(json.dumps(sample_exams), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def file_service(snapshot_file):
+    """Create a service backed by the snapshot file."""
+    return ExamService(repository=ExamRepository(snapshot_file))
+
+
+@pytest.fixture(autouse=True)
+def unfreeze_heap():
+    """Undo gc.freeze() so later tests run with a normal collector."""
+    yield
+    gc.unfreeze()
+
+
+class TestPreload:
+    """Tests for warming the dataset before fork."""
+    
+    def test_warm_and_freeze_builds_index(self, file_service):
+        """Test that warming loads the snapshot and freezes the heap."""
+        warm_and_freeze(file_service)
+        
+        assert gc.get_freeze_count() > 0
+        assert file_service.get_available_dates() == ["2025-12-08", "2025-12-09", "2025-12-10"]
+
+
+class TestSnapshotWatcher:
+    """Tests for master-side snapshot change detection."""
+    
+    def test_no_reload_when_unchanged(self, file_service):
+        """Test that an unchanged snapshot does not trigger a reload."""
+        reloads = []
+        file_service.warm()
+        watcher = SnapshotWatcher(file_service, on_reload=lambda: reloads.append(True))
+        
+        assert watcher.check() is False
+        assert reloads == []
+    
+    def test_reload_when_snapshot_changes(self, file_service, snapshot_file, sample_exams):
+        """Test that a rewritten snapshot is reloaded and workers are signalled."""
+        reloads = []
+        file_service.warm()
+        watcher = SnapshotWatcher(file_service, on_reload=lambda: reloads.append(True))
+        
+        snapshot_file.write_text(json.dumps(sample_exams[:1]), encoding="utf-8")
+        
+        assert watcher.check() is True
+        assert reloads == [True]
+        assert file_service.search_exams()["pagination"]["total"] == 1
+        assert watcher.check() is False
+    
+    def test_failed_reload_keeps_current_snapshot(self, file_service, snapshot_file):
+        """Test that an unreadable snapshot leaves the old data in place."""
+        reloads = []
+        file_service.warm()
+        watcher = SnapshotWatcher(file_service, on_reload=lambda: reloads.append(True))
+        
+        snapshot_file.write_text("[{not json", encoding="utf-8")
+        
+        assert watcher.check() is False
+        assert reloads == []
+        assert file_service.search_exams()["pagination"]["total"] == 4
+    
+    def test_service_listeners_run_without_on_reload(self, file_service, snapshot_file, sample_exams):
+        """Test that an in-process watcher needs no callback to reach reload listeners."""
+        notified = []
+        file_service.warm()
+        file_service.add_reload_listener(lambda: notified.append(True))
+        watcher = SnapshotWatcher(file_service)
+        
+        snapshot_file.write_text(json.dumps(sample_exams[:1]), encoding="utf-8")
+        
+        assert watcher.check() is True
+        assert notified == [True]
+    
+    @pytest.mark.parametrize("freeze", [False, True])
+    def test_freezes_only_when_asked(self, file_service, snapshot_file, sample_exams, freeze):
+        """Test that only a pre-fork watcher freezes the reloaded heap."""
+        file_service.warm()
+        watcher = SnapshotWatcher(file_service, on_reload=lambda: None, freeze=freeze)
+        
+        snapshot_file.write_text(json.dumps(sample_exams[:1]), encoding="utf-8")
+        
+        assert watcher.check() is True
+        assert (gc.get_freeze_count() > 0) is freeze
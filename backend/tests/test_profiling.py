@@ -0,0 +1,99 @@
+"""Tests for the opt-in request profiler."""
+
+import pytest
+from api.app import create_app
+
+
+@pytest.fixture
+def make_client(app, tmp_path):
+    """Build a test client with profiling enabled and extra config applied."""
+    def _make_client(**config):
+        return create_app({
+            "TESTING": True,
+            "PROFILING_ENABLED": True,
+            "PROFILING_DIR": str(tmp_path),
+            **config,
+        }).test_client()
+    
+    return _make_client
+
+
+@pytest.fixture
+def profiling_client(make_client):
+    """Create a test client with profiling enabled and a small ring buffer."""
+    return make_client(PROFILING_MAX_FILES=2)
+
+
+class TestRequestProfiler:
+    """Tests for profile capture and the on-disk ring buffer."""
+    
+    def test_no_profile_without_header(self, profiling_client, tmp_path):
+        """Test that nothing is captured at a zero sample rate."""
+        profiling_client.get("/api/exams")
+        
+        assert list(tmp_path.glob("*.prof")) == []
+    
+    def test_header_triggers_profile(self, profiling_client, tmp_path):
+        """Test that the profiling header captures a profile with metadata."""
+        import json
+        import pstats
+        
+        response = profiling_client.get("/api/exams?q=CALC", headers={"X-Profile": "1"})
+        
+        assert response.status_code == 200
+        assert (tmp_path / "profile-000.prof").exists()
+        pstats.Stats(str(tmp_path / "profile-000.prof"))
+        metadata = json.loads((tmp_path / "profile-000.json").read_text())
+        assert metadata["label"] == "search_exams"
+        assert metadata["path"] == "/api/exams?q=CALC"
+    
+    def test_ring_buffer_is_bounded(self, profiling_client, tmp_path):
+        """Test that old slots are overwritten once the buffer is full."""
+        for _ in range(5):
+            profiling_client.get("/api/filters/dates", headers={"X-Profile": "1"})
+        
+        assert sorted(p.name for p in tmp_path.glob("*.prof")) == [
+            "profile-000.prof",
+            "profile-001.prof",
+        ]
+    
+    def test_token_required_when_configured(self, make_client, tmp_path):
+        """Test that a configured token must match the header value."""
+        client = make_client(PROFILING_TOKEN="secret")
+        
+        client.get("/api/filters/dates", headers={"X-Profile": "wrong"})
+        assert list(tmp_path.glob("*.prof")) == []
+        
+        client.get("/api/filters/dates", headers={"X-Profile": "secret"})
+        assert len(list(tmp_path.glob("*.prof"))) == 1
+    
+    def test_non_ascii_header_is_ignored(self, make_client, tmp_path):
+        """Test that a non-ASCII header value is rejected rather than failing the request."""
+        client = make_client(PROFILING_TOKEN="secret")
+        
+        response = client.get("/api/filters/dates", headers={"X-Profile": "s\u00e9cret"})
+        
+        assert response.status_code == 200
+        assert list(tmp_path.glob("*.prof")) == []
+    
+    def test_header_ignored_from_remote_client_without_token(self, profiling_client, tmp_path):
+        """Test that remote clients cannot force a profile when no token is set."""
+        profiling_client.get(
+            "/api/filters/dates",
+            headers={"X-Profile": "1"},
+            environ_base={"REMOTE_ADDR": "10.0.0.5"},
+        )
+        
+        assert list(tmp_path.glob("*.prof")) == []
+    
+    def test_token_allows_remote_client(self, make_client, tmp_path):
+        """Test that a matching token is accepted from any address."""
+        client = make_client(PROFILING_TOKEN="secret")
+        
+        client.get(
+            "/api/filters/dates",
+            headers={"X-Profile": "secret"},
+            environ_base={"REMOTE_ADDR": "10.0.0.5"},
+        )
+        
+        assert len(list(tmp_path.glob("*.prof"))) == 1
@@ -0,0 +1,146 @@
+"""Tests for per-client rate limits and concurrency caps."""
+
+import pytest
+from api.app import create_app
+from api.ratelimit import ConcurrencyLimiter, RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for the token-bucket limiter."""
+    
+    def test_burst_then_refill(self):
+        """Test that a bucket allows its burst, then refills at its rate."""
+        limiter = RateLimiter()
+        key = ("exams.get_exams", "10.0.0.1")
+        
+        assert [limiter.acquire(key, rate=2, burst=3, now=0.0) for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire(key, rate=2, burst=3, now=0.0) == pytest.approx(0.5)
+        assert limiter.acquire(key, rate=2, burst=3, now=0.5) == 0
+    
+    def test_clients_have_separate_buckets(self):
+        """Test that one client exhausting its bucket does not affect another."""
+        limiter = RateLimiter()
+        
+        assert limiter.acquire(("e", "a"), rate=1, burst=1, now=0.0) == 0
+        assert limiter.acquire(("e", "a"), rate=1, burst=1, now=0.0) > 0
+        assert limiter.acquire(("e", "b"), rate=1, burst=1, now=0.0) == 0
+    
+    def test_least_recent_client_is_evicted(self):
+        """Test that the table is bounded and evicted clients start full."""
+        limiter = RateLimiter(max_keys=2)
+        
+        limiter.acquire(("e", "a"), rate=1, burst=1, now=0.0)
+        limiter.acquire(("e", "b"), rate=1, burst=1, now=0.0)
+        limiter.acquire(("e", "c"), rate=1, burst=1, now=0.0)
+        
+        assert limiter.acquire(("e", "a"), rate=1, burst=1, now=0.0) == 0
+        assert limiter.acquire(("e", "c"), rate=1, burst=1, now=0.0) > 0
+
+
+class TestConcurrencyLimiter:
+    """Tests for the non-blocking concurrency cap."""
+    
+    def test_acquire_until_full(self):
+        """Test that slots are refused at the limit and reusable after release."""
+        limiter = ConcurrencyLimiter(2)
+        
+        assert limiter.try_acquire() and limiter.try_acquire()
+        assert limiter.try_acquire() is False
+        limiter.release()
+        assert limiter.try_acquire() is True
+
+
+class TestAdmissionControl:
+    """Tests for the request hooks."""
+    
+    @pytest.fixture
+    def limited_app(self, app):
+        """App with tiny budgets so limits are reached in a few requests."""
+        return create_app({
+            "TESTING": True,
+            "RATE_LIMIT_BUDGETS": {
+                "default": {"rate": 0.01, "burst": 3, "max_concurrent": 4},
+                "search": {"rate": 0.01, "burst": 2, "max_concurrent": 1},
+            },
+        })
+    
+    def test_over_rate_gets_429(self, limited_app):
+        """Test that requests past the burst are rejected with Retry-After."""
+        client = limited_app.test_client()
+        statuses = [client.get("/api/exams").status_code for _ in range(3)]
+        response = client.get("/api/exams")
+        
+        assert statuses == [200, 200, 429]
+        assert response.status_code == 429
+        assert response.get_json()["error"] == "Too Many Requests"
+        assert int(response.headers["Retry-After"]) >= 1
+    
+    def test_budgets_are_separate(self, limited_app):
+        """Test that exhausting the search budget leaves cheap lookups available."""
+        client = limited_app.test_client()
+        for _ in range(3):
+            client.get("/api/exams")
+        
+        assert client.get("/api/filters/dates").status_code == 200
+    
+    def test_clients_are_limited_independently(self, limited_app):
+        """Test that each client address gets its own bucket."""
+        client = limited_app.test_client()
+        for _ in range(3):
+            client.get("/api/exams", environ_base={"REMOTE_ADDR": "10.0.0.1"})
+        
+        response = client.get("/api/exams", environ_base={"REMOTE_ADDR": "10.0.0.2"})
+        
+        assert response.status_code == 200
+    
+    def test_forwarded_address_used_when_trusted(self, limited_app):
+        """Test that X-Forwarded-For identifies clients only behind a trusted proxy."""
+        limited_app.config["RATE_LIMIT_TRUST_PROXY"] = True
+        client = limited_app.test_client()
+        for _ in range(2):
+            client.get("/api/exams", headers={"X-Forwarded-For": "203.0.113.7"})
+        
+        blocked = client.get("/api/exams", headers={"X-Forwarded-For": "203.0.113.7"})
+        other = client.get("/api/exams", headers={"X-Forwarded-For": "203.0.113.8"})
+        
+        assert (blocked.status_code, other.status_code) == (429, 200)
+    
+    def test_budget_concurrency_cap_gets_503(self, limited_app):
+        """Test that a full budget sheds requests with 503 and frees its slots."""
+        controller = limited_app.extensions["admission"]
+        controller.concurrency["search"].try_acquire()
+        
+        response = limited_app.test_client().get("/api/exams")
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert controller.total.active == 0
+    
+    def test_global_concurrency_cap_gets_503(self, app):
+        """Test that the global cap applies to every budget."""
+        controller = app.extensions["admission"]
+        controller.total.active = controller.total.limit
+        
+        assert app.test_client().get("/api/filters/dates").status_code == 503
+    
+    def test_slots_released_after_request(self, client, app):
+        """Test that completed requests give back their concurrency slots."""
+        client.get("/api/exams")
+        client.get("/api/filters/dates")
+        controller = app.extensions["admission"]
+        
+        assert controller.total.active == 0
+        assert all(limiter.active == 0 for limiter in controller.concurrency.values())
+    
+    def test_exempt_endpoints_are_not_limited(self, limited_app):
+        """Test that health checks are never throttled."""
+        client = limited_app.test_client()
+        limited_app.extensions["admission"].total.active = 10**6
+        
+        assert client.get("/api/health").status_code == 200
+    
+    def test_disabled(self):
+        """Test that admission control can be turned off."""
+        app = create_app({"TESTING": True, "RATE_LIMIT_ENABLED": False})
+        
+        assert "admission" not in app.extensions
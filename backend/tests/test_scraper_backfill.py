@@ -0,0 +1,69 @@
+"""Unit tests for process-pool backfill parsing."""
+
+from __future__ import annotations
+
+from scraper import backfill
+from scraper.report import ScrapeReport
+
+
+def _row(event_id: int, title: str, location: str = "SSC 335") -> str:
+    return (
+        f'<tr class="twSimpleTableEventRow0"><a eventid="{event_id}">EXAM: {title}</a>'
+        '<span class="twStartDate">Dec 6</span><span class="twStartTime">8am</span>'
+        f'<span class="twLocation">{location}</span></tr>'
+    )
+
+
+def _write_corpus(root):
+    for date in ("20251206", "20251207"):
+        for index in (0, 2, 10):
+            page = root / date / f"{index}.html"
+            page.parent.mkdir(parents=True, exist_ok=True)
+            page.write_text(
+                _row(int(date[-2:]) * 100 + index, f"CS 0{index}A 001 1{index}"),
+                encoding="utf-8",
+            )
+    (root / "20251208.html").write_text(_row(900, "MATH 006A 001 35359"), encoding="utf-8")
+    # Ignored: pages were recorded for this date.
+    (root / "20251206.html").write_text(_row(999, "PHYS 040A 001 99999"), encoding="utf-8")
+
+
+def test_iter_corpus_pages_orders_and_filters(tmp_path):
+    _write_corpus(tmp_path)
+
+    pages = backfill.iter_corpus_pages(tmp_path)
+    window = backfill.iter_corpus_pages(tmp_path, start="20251207", end="20251207")
+
+    assert [page[:2] for page in pages] == [
+        ("20251206", 0), ("20251206", 2), ("20251206", 10),
+        ("20251207", 0), ("20251207", 2), ("20251207", 10),
+        ("20251208", 0),
+    ]
+    assert [page[:2] for page in window] == [("20251207", 0), ("20251207", 2), ("20251207", 10)]
+
+
+def test_parse_pages_is_deterministic_across_workers(tmp_path):
+    _write_corpus(tmp_path)
+    pages = backfill.iter_corpus_pages(tmp_path)
+
+    serial = backfill.parse_pages(pages, workers=1, batch_pages=2)
+    parallel = backfill.parse_pages(list(reversed(pages)), workers=2, batch_pages=2)
+
+    assert parallel == serial
+    assert [exam["event_id"] for exam in serial] == ["600", "602", "610", "700", "702", "710", "900"]
+
+
+def test_parse_pages_keeps_earliest_duplicate_and_reports():
+    pages = [
+        ("20251207", 0, _row(1, "CS 010A 001 12345", location="LATER")),
+        ("20251206", 0, _row(1, "CS 010A 001 12345", location="EARLIER") + _row(2, "CS 010B 001 12346")),
+    ]
+    report = ScrapeReport()
+
+    exams = backfill.parse_pages(pages, workers=1, report=report)
+    data = report.to_dict()
+
+    assert [(exam["event_id"], exam["location"]) for exam in exams] == [("1", "EARLIER"), ("2", "SSC 335")]
+    assert [page["index"] for page in report.pages] == [0, 0]
+    assert data["totals"]["raw_rows"] == 3
+    assert data["totals"]["dedupe_dropped"] == 1
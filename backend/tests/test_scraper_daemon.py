@@ -0,0 +1,189 @@
+"""Unit tests for the scheduled scraper daemon."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from scraper import daemon, exam_scraper
+
+
+def _exam(event_id: str = "1", start_time: str = "2025-12-06T08:00:00") -> dict:
+    return {
+        "subject": "CS",
+        "course_number": "010A",
+        "section": "001",
+        "crn": "12345",
+        "start_time": start_time,
+        "end_time": "",
+        "location": "SSC 335",
+        "event_id": event_id,
+    }
+
+
+def test_validate_snapshot_accepts_well_formed_rows():
+    exams = [_exam(str(i)) for i in range(10)]
+
+    assert daemon.validate_snapshot(exams, previous_count=10) == []
+
+
+def test_validate_snapshot_rejects_row_count_drop():
+    exams = [_exam(str(i)) for i in range(7)]
+
+    problems = daemon.validate_snapshot(exams, previous_count=10, min_ratio=0.8)
+
+    assert len(problems) == 1
+    assert "dropped from 10 to 7" in problems[0]
+    assert daemon.validate_snapshot([], previous_count=0, min_rows=1)
+
+
+def test_validate_snapshot_rejects_schema_violations():
+    bad = [_exam(""), _exam("2", start_time="8am"), {"subject": "CS"}]
+
+    problems = daemon.validate_snapshot([_exam()] + bad, previous_count=0)
+
+    assert problems == [
+        "row 1: empty 'event_id'",
+        "row 2: invalid 'start_time': '8am'",
+        "row 3: missing or non-string 'course_number'",
+    ]
+
+
+def test_next_delay_is_denser_during_finals(monkeypatch):
+    monkeypatch.setattr(daemon, "START_DATE", "20251206")
+    monkeypatch.setattr(daemon, "END_DATE", "20251212")
+    monkeypatch.setattr(daemon, "FINALS_LEAD_DAYS", 7)
+    monkeypatch.setattr(daemon, "DAEMON_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(daemon, "FINALS_INTERVAL_SECONDS", 60)
+    monkeypatch.setattr(daemon, "DAEMON_JITTER_RATIO", 0.1)
+    rng = random.Random(0)
+
+    finals = dt.datetime(2025, 12, 1, 20, tzinfo=dt.timezone.utc)
+    summer = dt.datetime(2025, 7, 1, 20, tzinfo=dt.timezone.utc)
+
+    assert all(54 <= daemon.next_delay(finals, rng) <= 66 for _ in range(50))
+    assert all(3240 <= daemon.next_delay(summer, rng) <= 3960 for _ in range(50))
+
+
+def test_health_staleness_follows_the_current_interval(monkeypatch):
+    monkeypatch.setattr(daemon, "DAEMON_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(daemon, "FINALS_INTERVAL_SECONDS", 60)
+    health = daemon.DaemonHealth()
+    health.record_success(rows=42)
+    last_success = time.time()
+
+    monkeypatch.setattr(daemon, "in_finals_period", lambda today: False)
+    monkeypatch.setattr(daemon.time, "time", lambda: last_success + 600)
+    assert health.to_dict()["healthy"] is True
+
+    monkeypatch.setattr(daemon, "in_finals_period", lambda today: True)
+    assert health.to_dict()["healthy"] is False
+
+
+def test_instance_lock_is_exclusive(tmp_path):
+    path = tmp_path / "scraper.lock"
+
+    with daemon.InstanceLock(path):
+        with pytest.raises(daemon.DaemonAlreadyRunning):
+            daemon.InstanceLock(path).acquire()
+
+    with daemon.InstanceLock(path):
+        pass
+
+
+def test_run_once_publishes_valid_snapshot(monkeypatch, tmp_path):
+    snapshot = tmp_path / "exams.json"
+    snapshot.write_text(json.dumps([_exam("1"), _exam("2")]), encoding="utf-8")
+    published = []
+    monkeypatch.setattr(daemon, "OUTPUT_FILE", str(snapshot))
+    monkeypatch.setattr(daemon, "scrape_exams", lambda report: [_exam("1"), _exam("2"), _exam("3")])
+    monkeypatch.setattr(daemon, "publish_exams", lambda exams, report: published.append(exams))
+
+    scraper_daemon = daemon.ScraperDaemon()
+
+    assert scraper_daemon.run_once() is True
+    assert len(published) == 1
+    state = scraper_daemon.health.to_dict()
+    assert state["rows"] == 3
+    assert state["consecutive_failures"] == 0
+    assert state["healthy"] is True
+
+
+def test_run_once_withholds_shrunken_snapshot(monkeypatch, tmp_path):
+    snapshot = tmp_path / "exams.json"
+    snapshot.write_text(json.dumps([_exam(str(i)) for i in range(10)]), encoding="utf-8")
+    published = []
+    monkeypatch.setattr(daemon, "OUTPUT_FILE", str(snapshot))
+    monkeypatch.setattr(daemon, "scrape_exams", lambda report: [_exam("1")])
+    monkeypatch.setattr(daemon, "publish_exams", lambda exams, report: published.append(exams))
+
+    scraper_daemon = daemon.ScraperDaemon()
+
+    assert scraper_daemon.run_once() is False
+    assert published == []
+    state = scraper_daemon.health.to_dict()
+    assert state["consecutive_failures"] == 1
+    assert state["last_error"].startswith("validation failed")
+
+
+def test_run_once_survives_corrupt_history_manifest(monkeypatch, tmp_path):
+    snapshot = tmp_path / "exams.json"
+    snapshot.write_text(json.dumps([_exam("1"), _exam("2")]), encoding="utf-8")
+    history_dir = tmp_path / "history"
+    history_dir.mkdir()
+    (history_dir / "manifest.json").write_text('{"version": 3, "del', encoding="utf-8")
+    monkeypatch.setattr(daemon, "OUTPUT_FILE", str(snapshot))
+    monkeypatch.setattr(daemon, "scrape_exams", lambda report: [_exam("1"), _exam("2"), _exam("3")])
+    monkeypatch.setattr(
+        daemon,
+        "publish_exams",
+        lambda exams, report: exam_scraper.save_exams(
+            exams, output_path=str(snapshot), history_dir=str(history_dir)
+        ),
+    )
+
+    scraper_daemon = daemon.ScraperDaemon()
+
+    assert scraper_daemon.run_once() is False
+    state = scraper_daemon.health.to_dict()
+    assert state["consecutive_failures"] == 1
+    assert state["last_error"].startswith("publish failed")
+
+
+def test_run_once_survives_failed_scrape(monkeypatch):
+    def fail(report):
+        raise SystemExit(1)
+
+    monkeypatch.setattr(daemon, "scrape_exams", fail)
+
+    scraper_daemon = daemon.ScraperDaemon()
+
+    assert scraper_daemon.run_once() is False
+    assert scraper_daemon.health.to_dict()["last_error"] == "scrape failed"
+
+
+def test_health_endpoint_reports_state():
+    health = daemon.DaemonHealth(stale_after_seconds=60)
+    health.record_success(rows=42)
+    httpd = daemon.start_health_server(health, port=0)
+    host, port = httpd.server_address[:2]
+
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/health", timeout=5) as response:
+            body = json.loads(response.read())
+        assert body["healthy"] is True
+        assert body["rows"] == 42
+
+        health.stale_after_seconds = -1
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"http://{host}:{port}/health", timeout=5)
+        assert excinfo.value.code == 503
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
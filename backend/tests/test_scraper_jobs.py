@@ -0,0 +1,118 @@
+"""Unit tests for the SQLite-backed backfill job queue."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from scraper import exam_scraper, jobs
+from scraper.replay import ReplayCorpus, StandInServer
+
+
+def _row(event_id: int, title: str) -> str:
+    return (
+        f'<tr class="twSimpleTableEventRow0"><a eventid="{event_id}">EXAM: {title}</a>'
+        '<span class="twStartDate">Dec 6</span><span class="twStartTime">8am</span>'
+        '<span class="twLocation">SSC 335</span></tr>'
+    )
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = jobs.JobQueue(tmp_path / "queue.db", max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_enqueue_range_skips_existing_jobs(queue):
+    assert queue.enqueue_range("final-exam-calendar", "20251206", "20251208") == 3
+    assert queue.enqueue_range("final-exam-calendar", "20251207", "20251209") == 1
+    assert queue.enqueue_range("summer-exam-calendar", "20251206", "20251206") == 1
+
+    status = queue.status()
+    assert status["jobs"]["pending"] == 5
+    assert status["calendars"]["summer-exam-calendar"]["pending"] == 1
+
+
+def test_lease_hands_out_each_job_once(queue):
+    queue.enqueue_range("cal", "20251206", "20251207")
+
+    first = queue.lease("a", now=100.0)
+    second = queue.lease("b", now=100.0)
+
+    assert (first.date, second.date) == ("20251206", "20251207")
+    assert queue.lease("c", now=100.0) is None
+    assert queue.status()["jobs"]["leased"] == 2
+
+
+def test_expired_lease_is_reissued_and_stale_owner_loses_it(queue):
+    queue.enqueue("cal", "20251206")
+
+    stale = queue.lease("a", lease_seconds=10, now=100.0)
+    fresh = queue.lease("b", lease_seconds=10, now=111.0)
+
+    assert fresh.id == stale.id
+    assert fresh.attempts == 2
+    assert queue.complete(stale, "a", rows=3) is False
+    assert queue.complete(fresh, "b", rows=3, next_indexes=[25]) is True
+    assert queue.status()["jobs"] == {"pending": 1, "leased": 0, "done": 1, "failed": 0}
+
+
+def test_failed_jobs_retry_until_attempts_run_out(queue):
+    queue.enqueue("cal", "20251206")
+
+    queue.fail(queue.lease("a"), "a", "HTTP 503")
+    assert queue.status()["jobs"]["pending"] == 1
+
+    queue.fail(queue.lease("a"), "a", "HTTP 503")
+    assert queue.status()["jobs"]["failed"] == 1
+    assert queue.lease("a") is None
+
+    assert queue.retry_failed() == 1
+    assert queue.lease("a").attempts == 1
+
+
+def test_pause_stops_leasing(queue):
+    queue.enqueue("cal", "20251206")
+    queue.set_paused(True)
+
+    assert queue.lease("a") is None
+    assert queue.status()["paused"] is True
+
+    queue.set_paused(False)
+    assert queue.lease("a") is not None
+
+
+def test_workers_drain_queue_and_publish(tmp_path, monkeypatch):
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 100)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 2)
+    monkeypatch.setattr(jobs, "REQUEST_DELAY_SECONDS", 0)
+
+    upstream = tmp_path / "upstream"
+    upstream.mkdir()
+    (upstream / "20251206.html").write_text(
+        "".join(_row(i, f"CS 01{i}A 001 1234{i}") for i in range(5)), encoding="utf-8"
+    )
+    (upstream / "20251207.html").write_text(_row(9, "MATH 006A 001 35359"), encoding="utf-8")
+
+    queue_path = tmp_path / "queue.db"
+    pages_dir = tmp_path / "pages"
+    queue = jobs.JobQueue(queue_path)
+    queue.enqueue_range("final-exam-calendar", "20251206", "20251207")
+
+    with StandInServer(ReplayCorpus(upstream, page_size=2)) as server:
+        completed = jobs.run_workers(queue_path, pages_dir, workers=3, url_template=server.base_url)
+
+    status = queue.status()
+    queue.close()
+    assert completed == 4
+    assert status["jobs"]["done"] == 4
+    assert status["rows"] == 6
+
+    output = tmp_path / "backfill.json"
+    exams = jobs.publish_backfill(pages_dir, output_path=str(output))
+
+    assert [exam["event_id"] for exam in exams] == ["0", "1", "2", "3", "4", "9"]
+    assert json.loads(output.read_text(encoding="utf-8")) == exams
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import threading
 
 import pytest
 
@@ -14,6 +15,10 @@ class _FakeResponse:
         self.text = text
         self.status_code = status_code
 
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
             raise RuntimeError(f"HTTP {self.status_code}")
@@ -69,6 +74,25 @@ def test_parse_day_html_derives_end_time_and_display_fields():
     assert row["end_time"] == "2:30 PM"
 
 
+def test_parse_exam_emits_derived_fields():
+    raw = {
+        "title": "EXAM: CS 009A 001 34028",
+        "location": "OLMH 1208",
+        "startDateTime": "2025-12-06T11:30:00",
+        "endDateTime": "2025-12-06T14:30:00",
+        "eventId": "1337687736",
+    }
+
+    exam = exam_scraper.parse_exam(raw)
+
+    assert exam["schema_version"] == exam_scraper.SNAPSHOT_SCHEMA_VERSION
+    assert exam["building"] == "OLMH"
+    assert exam["room"] == "1208"
+    assert exam["date_iso"] == "2025-12-06"
+    assert exam["course_key"] == "CS 009A"
+    assert exam["end_epoch"] - exam["start_epoch"] == 3 * 60 * 60
+
+
 def test_fetch_exams_stops_when_no_next_page_hint(monkeypatch):
     # Reduce the loop to a single date and a few indexes.
     monkeypatch.setattr(exam_scraper, "_iter_dates", lambda start, end: ["20251206"])
@@ -115,3 +139,160 @@ def test_fetch_exams_stops_when_no_rows(monkeypatch):
 
     assert fake_session.requested == [0]
     assert exams == []
+
+
+def test_fetch_exams_records_report_and_retries(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "_iter_dates", lambda start, end: ["20251206"])
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 50)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 25)
+    monkeypatch.setattr(exam_scraper, "REQUEST_DELAY_SECONDS", 0)
+    monkeypatch.setattr(exam_scraper, "RETRY_BACKOFF_SECONDS", 0)
+
+    page0 = (
+        '<tr class="twSimpleTableEventRow0"><a eventid="1">EXAM: MATH 006A 001 35359</a>'
+        '<span class="twStartDate">Dec 6</span><span class="twStartTime">8am</span>'
+        '<span class="twLocation">SSC 335</span></tr>'
+    )
+
+    class _FlakySession(_FakeSession):
+        def get(self, url: str, timeout: int = 30):
+            if not self.requested:
+                self.requested.append(-1)
+                raise exam_scraper.requests.ConnectionError("connection reset")
+            return super().get(url, timeout=timeout)
+
+    fake_session = _FlakySession({0: page0})
+    monkeypatch.setattr(exam_scraper.requests, "Session", lambda: fake_session)
+
+    report = exam_scraper.ScrapeReport()
+    exams = exam_scraper.fetch_exams(report=report)
+    report.record_dedupe(raw_rows=len(exams), parsed_rows=len(exams), deduped_rows=len(exams))
+    report.finish()
+    data = report.to_dict()
+
+    assert len(exams) == 1
+    assert len(data["pages"]) == 1
+    page = data["pages"][0]
+    assert page["date"] == "20251206"
+    assert page["index"] == 0
+    assert page["rows"] == 1
+    assert page["retries"] == 1
+    assert page["bytes"] == len(page0)
+    assert data["dates"]["20251206"]["pages"] == 1
+    assert data["totals"]["retries"] == 1
+    assert data["totals"]["dedupe_dropped"] == 0
+    assert data["wall_seconds"] is not None
+
+
+def test_fetch_exams_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "_iter_dates", lambda start, end: ["20251206"])
+    monkeypatch.setattr(exam_scraper, "MAX_RETRIES", 1)
+    monkeypatch.setattr(exam_scraper, "RETRY_BACKOFF_SECONDS", 0)
+
+    class _DownSession(_FakeSession):
+        def get(self, url: str, timeout: int = 30):
+            self.requested.append(0)
+            raise exam_scraper.requests.ConnectionError("down")
+
+    fake_session = _DownSession({})
+    monkeypatch.setattr(exam_scraper.requests, "Session", lambda: fake_session)
+
+    with pytest.raises(SystemExit):
+        exam_scraper.fetch_exams()
+
+    assert len(fake_session.requested) == 2
+
+
+def _page_row(event_id: int, title: str) -> str:
+    return (
+        f'<tr class="twSimpleTableEventRow0"><a eventid="{event_id}">EXAM: {title}</a>'
+        '<span class="twStartDate">Dec 6</span><span class="twStartTime">8am</span>'
+        '<span class="twLocation">SSC 335</span></tr>'
+    )
+
+
+def test_discover_page_indexes_from_links_and_total(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 100)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 25)
+
+    links = "".join(f'<a href="s.aspx?index={i}">p</a>' for i in (0, 25, 50, 300))
+    assert exam_scraper._discover_page_indexes(links, 0) == [25, 50]
+    assert exam_scraper._discover_page_indexes(links, 25) == [50]
+    assert exam_scraper._discover_page_indexes("<span>1 - 25 of 60</span>", 0) == [25, 50]
+    assert exam_scraper._discover_page_indexes("No pagination", 0) == []
+
+
+def test_discover_page_indexes_ignores_ranges_outside_the_pager(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 1000)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 25)
+
+    prose = "<p>Finals run Dec 8 - 12 of 2025; see weeks 1 - 10 of 500 notes.</p>"
+    assert exam_scraper._discover_page_indexes(prose, 0) == []
+    assert exam_scraper._discover_page_indexes("<td>12 - 8 of 900</td>", 0) == []
+    page = prose + '<div class="pager"><span> 26 - 50 of 75 </span></div>'
+    assert exam_scraper._discover_page_indexes(page, 25) == [50]
+
+
+def test_fetch_exams_fans_out_over_linked_pages(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "_iter_dates", lambda start, end: ["20251206"])
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 100)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 25)
+    monkeypatch.setattr(exam_scraper, "REQUEST_DELAY_SECONDS", 0)
+    monkeypatch.setattr(exam_scraper, "MAX_CONCURRENT_PAGES", 3)
+
+    links = "".join(f'<a href="s.aspx?date=20251206&index={i}">{i}</a>' for i in (25, 50, 75))
+    pages = {
+        0: links + _page_row(1, "MATH 006A 001 35359"),
+        25: _page_row(2, "CS 010A 001 12345"),
+        50: _page_row(3, "CS 010B 001 12346"),
+        75: _page_row(4, "CS 010C 001 12347"),
+    }
+
+    # The three linked pages only complete once all of them are in flight.
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _ConcurrentSession(_FakeSession):
+        def get(self, url: str, timeout: int = 30):
+            response = super().get(url, timeout=timeout)
+            if not re.search(r"\bindex=0\b", url):
+                barrier.wait()
+            return response
+
+    fake_session = _ConcurrentSession(pages)
+    monkeypatch.setattr(exam_scraper.requests, "Session", lambda: fake_session)
+
+    exams = exam_scraper.fetch_exams()
+
+    assert sorted(fake_session.requested) == [0, 25, 50, 75]
+    assert [exam["eventId"] for exam in exams] == ["1", "2", "3", "4"]
+
+
+class _StatusSession(_FakeSession):
+    """Answers every request with one HTTP status, counting attempts."""
+
+    def __init__(self, status_code: int):
+        super().__init__({})
+        self.status_code = status_code
+
+    def get(self, url: str, timeout: int = 30):
+        self.requested.append(0)
+        response = exam_scraper.requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        return response
+
+
+@pytest.mark.parametrize("status_code,attempts", [(404, 1), (400, 1), (429, 3), (503, 3)])
+def test_fetch_page_retries_only_transient_statuses(monkeypatch, status_code, attempts):
+    monkeypatch.setattr(exam_scraper, "MAX_RETRIES", 2)
+    monkeypatch.setattr(exam_scraper, "RETRY_BACKOFF_SECONDS", 0)
+    session = _StatusSession(status_code)
+
+    with pytest.raises(exam_scraper.requests.HTTPError):
+        exam_scraper._fetch_page(session, "http://upstream/?index=0")
+
+    assert len(session.requested) == attempts
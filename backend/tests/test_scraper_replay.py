@@ -0,0 +1,104 @@
+"""End-to-end tests for the offline replay corpus and stand-in server."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+
+from scraper import exam_scraper, replay
+from scraper.replay import EMPTY_DAY_HTML, ReplayCorpus, StandInServer, record_corpus
+
+
+def _row(event_id: int, title: str, time_label: str = "8am") -> str:
+    return (
+        f'<tr class="twSimpleTableEventRow0"><a eventid="{event_id}">EXAM: {title}</a>'
+        f'<span class="twStartDate">Dec 6</span><span class="twStartTime">{time_label}</span>'
+        '<span class="twLocation">SSC 335</span></tr>'
+    )
+
+
+@pytest.fixture
+def single_date(monkeypatch):
+    monkeypatch.setattr(exam_scraper, "_iter_dates", lambda start, end: ["20251206"])
+    monkeypatch.setattr(exam_scraper, "INDEX_START", 0)
+    monkeypatch.setattr(exam_scraper, "INDEX_END", 100)
+    monkeypatch.setattr(exam_scraper, "INDEX_STEP", 2)
+    monkeypatch.setattr(exam_scraper, "REQUEST_DELAY_SECONDS", 0)
+    monkeypatch.setattr(exam_scraper, "RETRY_BACKOFF_SECONDS", 0)
+
+
+def test_corpus_slices_full_day_capture(tmp_path):
+    rows = [_row(i, f"MATH 00{i}A 001 3535{i}") for i in range(5)]
+    (tmp_path / "20251206.html").write_text("".join(rows), encoding="utf-8")
+    corpus = ReplayCorpus(tmp_path, page_size=2)
+
+    first = corpus.page("20251206", 0)
+    last = corpus.page("20251206", 4)
+
+    assert first.count("twSimpleTableEventRow") == 2
+    assert "index=2" in first
+    assert last.count("twSimpleTableEventRow") == 1
+    assert "index=6" not in last
+    assert corpus.page("20251206", 6) == EMPTY_DAY_HTML
+    assert corpus.page("20251207", 0) is None
+
+
+def test_recorded_pages_take_precedence(tmp_path):
+    corpus = ReplayCorpus(tmp_path)
+    corpus.save_page("20251206", 0, "recorded")
+    (tmp_path / "20251206.html").write_text(_row(1, "CS 010A 001 12345"), encoding="utf-8")
+
+    assert corpus.page("20251206", 0) == "recorded"
+
+
+def test_fetch_exams_against_stand_in(tmp_path, single_date):
+    rows = [_row(i, f"CS 01{i}A 001 1234{i}") for i in range(5)]
+    (tmp_path / "20251206.html").write_text("".join(rows), encoding="utf-8")
+    report = exam_scraper.ScrapeReport()
+
+    with StandInServer(ReplayCorpus(tmp_path, page_size=2)) as server:
+        exams = exam_scraper.fetch_exams(report=report, base_url=server.base_url)
+
+    assert [exam["eventId"] for exam in exams] == ["0", "1", "2", "3", "4"]
+    assert [page["index"] for page in report.pages] == [0, 2, 4]
+    assert server.requests_served == 3
+
+
+def test_injected_errors_are_retried(tmp_path, single_date):
+    (tmp_path / "20251206.html").write_text(_row(1, "CS 010A 001 12345"), encoding="utf-8")
+    report = exam_scraper.ScrapeReport()
+
+    with StandInServer(ReplayCorpus(tmp_path, page_size=2), error_rate=0.5, seed=3) as server:
+        exams = exam_scraper.fetch_exams(report=report, base_url=server.base_url)
+
+    assert len(exams) == 1
+    assert server.errors_injected == report.pages[0]["retries"] > 0
+
+
+def test_recorded_corpus_holds_pager_discovered_pages(tmp_path, single_date, monkeypatch):
+    monkeypatch.setattr(replay, "_iter_dates", lambda start, end: ["20251206"])
+    monkeypatch.setattr(replay, "INDEX_START", 0)
+    monkeypatch.setattr(replay, "REQUEST_DELAY_SECONDS", 0)
+    # Only the pager label names the later pages; there are no next-page links.
+    upstream = ReplayCorpus(tmp_path / "upstream")
+    upstream.save_page("20251206", 0, _row(0, "CS 010A 001 12340") + "<span>1 - 2 of 6</span>")
+    upstream.save_page("20251206", 2, _row(2, "CS 012A 001 12342"))
+    upstream.save_page("20251206", 4, _row(4, "CS 014A 001 12344"))
+    corpus = ReplayCorpus(tmp_path / "corpus")
+
+    with StandInServer(upstream) as server:
+        assert record_corpus(corpus, base_url=server.base_url) == 3
+
+    with StandInServer(corpus) as server:
+        exams = exam_scraper.fetch_exams(base_url=server.base_url)
+
+    assert sorted(path.name for path in (corpus.root / "20251206").iterdir()) == ["0.html", "2.html", "4.html"]
+    assert [exam["eventId"] for exam in exams] == ["0", "2", "4"]
+
+
+def test_stand_in_rejects_missing_params(tmp_path):
+    with StandInServer(ReplayCorpus(tmp_path)) as server:
+        url = server.base_url.split("?")[0]
+        response = requests.get(url, timeout=5)
+
+    assert response.status_code == 400
@@ -0,0 +1,127 @@
+"""Tests for request coalescing."""
+
+import threading
+import time
+
+from api.services.exam_index import ExamIndex
+from api.services.exam_service import ExamService
+from api.services.singleflight import SingleFlight
+
+
+def _run_concurrently(target, count: int) -> list:
+    """Call target from count threads at once and collect the results."""
+    results = [None] * count
+    errors = []
+    barrier = threading.Barrier(count)
+
+    def run(slot: int) -> None:
+        barrier.wait()
+        try:
+            results[slot] = target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(slot,)) for slot in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results if not errors else errors
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight primitive."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that overlapping calls with one key run the function once."""
+        flights = SingleFlight()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"value": 42}
+
+        results = _run_concurrently(lambda: flights.do("key", compute), 8)
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert (flights.executed, flights.shared) == (1, 7)
+
+    def test_different_keys_do_not_coalesce(self):
+        """Test that calls with different keys run independently."""
+        flights = SingleFlight()
+
+        assert flights.do("a", lambda: 1) == 1
+        assert flights.do("b", lambda: 2) == 2
+        assert flights.executed == 2
+
+    def test_results_are_not_cached(self):
+        """Test that a finished call is run again on the next request."""
+        flights = SingleFlight()
+        values = iter([1, 2])
+
+        assert flights.do("key", lambda: next(values)) == 1
+        assert flights.do("key", lambda: next(values)) == 2
+
+    def test_error_is_raised_to_every_waiter(self):
+        """Test that waiters receive the leader's exception."""
+        flights = SingleFlight()
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError("boom")
+
+        errors = _run_concurrently(lambda: flights.do("key", fail), 4)
+
+        assert len(errors) == 4
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert flights.do("key", lambda: "recovered") == "recovered"
+
+
+class TestServiceCoalescing:
+    """Tests for coalescing in the exam service."""
+
+    def test_identical_searches_compute_once(self, exam_service, monkeypatch):
+        """Test that concurrent identical searches run the filter once."""
+        index = exam_service.get_index()
+        original = index.match
+        calls = []
+
+        def slow_match(**filters):
+            calls.append(filters)
+            time.sleep(0.2)
+            return original(**filters)
+
+        monkeypatch.setattr(index, "match", slow_match)
+
+        results = _run_concurrently(lambda: exam_service.search_exams(query="calc"), 6)
+
+        assert len(calls) == 1
+        assert all(result["pagination"]["total"] == 2 for result in results)
+
+    def test_different_searches_are_not_shared(self, exam_service):
+        """Test that searches with different parameters get their own results."""
+        first = exam_service.search_exams(query="calc")
+        second = exam_service.search_exams(query="calc", page=2, limit=1)
+
+        assert first is not second
+        assert second["pagination"]["page"] == 2
+
+    def test_index_is_built_once(self, mock_repository, monkeypatch):
+        """Test that concurrent first requests build the index once."""
+        builds = []
+        original = ExamIndex.__init__
+
+        def slow_init(self, exams, artifact=None):
+            builds.append(1)
+            time.sleep(0.2)
+            original(self, exams, artifact=artifact)
+
+        monkeypatch.setattr(ExamIndex, "__init__", slow_init)
+        service = ExamService(repository=mock_repository)
+
+        indexes = _run_concurrently(service.get_index, 8)
+
+        assert len(builds) == 1
+        assert all(index is indexes[0] for index in indexes)
@@ -0,0 +1,182 @@
+"""Tests for the SQLite storage backend and its parity with the JSON backend."""
+
+import json
+import threading
+
+import pytest
+from api.repositories import create_repository
+from api.repositories.exam_repository import ExamRepository
+from api.repositories.sqlite_repository import (
+    SqliteExamIndex,
+    SqliteExamRepository,
+    SqliteExams,
+    write_sqlite_database,
+)
+from api.services.exam_index import ExamIndex
+from api.services.exam_service import ExamService
+from benchmarks.datasets import generate_exams
+from scraper.fields import enrich_exam
+
+FILTER_CASES = [
+    {},
+    {"query": "calc"},
+    {"query": "MATH"},
+    {"query": "0"},
+    {"query": "10500"},
+    {"query": "MATH 010"},
+    {"query": "cs010a"},
+    {"query": "writ267c", "date": "2025-12-09"},
+    {"query": "zzz"},
+    {"date": "2025-12-08"},
+    {"location": "ssc"},
+    {"query": "cs", "date": "2025-12-09", "location": "SSC"},
+    {"subject": "math", "building": "SSC"},
+    {"start_after": "2025-12-08T11:30", "start_before": "2025-12-10"},
+    {"time_of_day": "evening", "query": "a"},
+    {"time_of_day": "08:00-12:00", "location": "1"},
+]
+
+
+@pytest.fixture
+def synthetic_exams(sample_exams):
+    """Sample exams followed by a larger synthetic dataset."""
+    return sample_exams + generate_exams(2000, seed=23)
+
+
+@pytest.fixture
+def json_path(tmp_path, synthetic_exams):
+    """Write the synthetic exams as a JSON snapshot."""
+    path = tmp_path / "exams.json"
+    path.write_text(json.dumps(synthetic_exams), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def database_path(tmp_path, synthetic_exams):
+    """Write the synthetic exams as a SQLite snapshot."""
+    return write_sqlite_database(synthetic_exams, tmp_path / "exams.db")
+
+
+class TestSqliteExamIndex:
+    """Tests for answering filters with SQL."""
+    
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    def test_filter_parity_with_in_memory_index(self, database_path, synthetic_exams, filters):
+        """Test that SQL filtering returns the same ordinals as the in-memory index."""
+        service = ExamService(repository=SqliteExamRepository(database_path))
+        
+        assert service.get_index().filter(**filters) == ExamIndex(synthetic_exams).filter(**filters)
+    
+    @pytest.mark.parametrize("query", [None, "calc"])
+    def test_pages_omit_derived_fields(self, tmp_path, sample_exams, query):
+        """Test that enriched records are served with only their scraped fields."""
+        path = write_sqlite_database([enrich_exam(exam) for exam in sample_exams], tmp_path / "exams.db")
+        service = ExamService(repository=SqliteExamRepository(path))
+        
+        data = service.search_exams(query=query)["data"]
+        
+        assert data
+        assert all(exam in sample_exams for exam in data)
+    
+    @pytest.mark.parametrize("query,count", [("cs010a", 1), ("CS 010A", 1), ("writ267c", 4)])
+    def test_course_code_matches_subject_and_number(self, database_path, query, count):
+        """Test that SQL matches a course code by subject and number."""
+        service = ExamService(repository=SqliteExamRepository(database_path))
+        
+        assert service.search_exams(query=query)["pagination"]["total"] == count
+    
+    def test_records_round_trip(self, database_path, synthetic_exams):
+        """Test that stored records equal their source records."""
+        exams = SqliteExamRepository(database_path).get_all_exams()
+        
+        assert len(exams) == len(synthetic_exams)
+        assert list(exams) == synthetic_exams
+        assert exams[-1] == synthetic_exams[-1]
+        assert exams[10:13] == synthetic_exams[10:13]
+    
+    def test_pages_are_pushed_down(self, database_path, monkeypatch):
+        """Test that searching never reads exams outside the requested page."""
+        def forbidden(*args):
+            raise AssertionError("exams were read outside the page query")
+        
+        monkeypatch.setattr(SqliteExams, "__iter__", forbidden)
+        monkeypatch.setattr(SqliteExams, "__getitem__", forbidden)
+        service = ExamService(repository=SqliteExamRepository(database_path))
+        
+        result = service.search_exams(query="a", page=3, limit=5, facets=["date", "building"])
+        
+        assert isinstance(service.get_index(), SqliteExamIndex)
+        assert len(result["data"]) == 5
+
+
+class TestBackendParity:
+    """Tests that the JSON and SQLite backends serve identical responses."""
+    
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize("page,limit", [(1, 20), (4, 7)])
+    def test_search_parity(self, json_path, database_path, filters, page, limit):
+        """Test identical results, pagination and facets for both backends."""
+        json_service = ExamService(repository=ExamRepository(json_path))
+        sqlite_service = ExamService(repository=SqliteExamRepository(database_path))
+        kwargs = {**filters, "page": page, "limit": limit, "facets": ["date", "building"]}
+        
+        assert sqlite_service.search_exams(**kwargs) == json_service.search_exams(**kwargs)
+    
+    def test_filters_and_suggestions_match(self, json_path, database_path):
+        """Test that facet lists and suggestions match for both backends."""
+        json_service = ExamService(repository=ExamRepository(json_path))
+        sqlite_service = ExamService(repository=SqliteExamRepository(database_path))
+        
+        assert sqlite_service.get_available_dates() == json_service.get_available_dates()
+        assert sqlite_service.get_available_locations() == json_service.get_available_locations()
+        assert sqlite_service.suggest("ma") == json_service.suggest("ma")
+
+
+class TestSqliteExamRepository:
+    """Tests for opening, pooling and reloading SQLite snapshots."""
+    
+    def test_create_repository(self):
+        """Test selecting the SQLite backend by name."""
+        assert isinstance(create_repository("sqlite"), SqliteExamRepository)
+    
+    def test_connections_are_per_thread(self, database_path):
+        """Test that each thread reads through its own connection."""
+        exams = SqliteExamRepository(database_path).get_all_exams()
+        connections = []
+        
+        def read():
+            connections.append(exams.pool.connection())
+            assert exams[0]["crn"] == "35359"
+        
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(connection) for connection in connections}) == 3
+    
+    def test_connections_are_read_only(self, database_path):
+        """Test that the pool cannot modify the snapshot."""
+        exams = SqliteExamRepository(database_path).get_all_exams()
+        
+        with pytest.raises(Exception):
+            exams.pool.execute("DELETE FROM exams")
+    
+    def test_reload_after_rewrite(self, database_path, sample_exams):
+        """Test that a replaced database is detected and reopened."""
+        service = ExamService(repository=SqliteExamRepository(database_path))
+        service.warm()
+        
+        write_sqlite_database(sample_exams, database_path)
+        
+        assert service.reload_if_changed() is True
+        assert service.search_exams()["pagination"]["total"] == 4
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file that is not a SQLite snapshot is rejected."""
+        path = tmp_path / "exams.db"
+        path.write_bytes(b"not a database" * 10)
+        
+        with pytest.raises(ValueError):
+            SqliteExamRepository(path).get_all_exams()
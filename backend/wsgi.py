@@ -0,0 +1,15 @@
+"""WSGI entry point for production servers.
+
+Builds the application, loads the exam snapshot and its indexes, and freezes
+the heap at import time, so a pre-fork server that preloads this module
+(see gunicorn.conf.py) shares them copy-on-write with every worker.
+"""
+
+from api.app import create_app
+from api.prefork import warm_and_freeze
+from api.services.exam_service import get_exam_service
+
+app = create_app()
+service = get_exam_service()
+
+warm_and_freeze(service)